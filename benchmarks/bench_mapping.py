@@ -0,0 +1,131 @@
+"""Micro-benchmark comparing how SQLite rows become asset versions: sqlite3.Row looked
+up by name one row at a time, positional tuples built in bulk, and raw rows.
+
+Run from the repository root with: python -m benchmarks.bench_mapping
+"""
+
+import sqlite3
+import time
+
+from otherworld_asset_service.models.asset import Asset
+from otherworld_asset_service.models.asset_version import AssetVersion
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+from otherworld_asset_service.storage import sqlite_database
+from otherworld_asset_service.storage.codes import VERSION_STATUSES
+from otherworld_asset_service.storage.sqlite_database import SQLiteDatabase
+
+
+ROWS = 1_000_000
+
+VERSIONS_PER_ASSET = 10
+
+# The number of versions added per bulk call while populating the database
+BATCH_SIZE = 10_000
+
+DEPARTMENTS = ("modeling", "texturing", "rigging", "animation", "cfx", "fx")
+
+
+def populate(database: SQLiteDatabase) -> None:
+    entries = []
+
+    for index in range(ROWS // VERSIONS_PER_ASSET):
+        asset = database.add_asset(Asset("asset_{}".format(index), AssetType.PROP))
+
+        for version in range(1, VERSIONS_PER_ASSET + 1):
+            entries.append(
+                (
+                    asset,
+                    AssetVersion(
+                        asset.id,
+                        DEPARTMENTS[version % len(DEPARTMENTS)],
+                        version=version,
+                        status=VersionStatus.ACTIVE,
+                    ),
+                )
+            )
+
+        if len(entries) >= BATCH_SIZE:
+            database.add_asset_versions_bulk(entries)
+            entries = []
+
+    database.add_asset_versions_bulk(entries)
+
+
+def asset_version_from_row(row: sqlite3.Row) -> AssetVersion:
+    # The mapping used before rows became tuples, kept to compare against
+    return AssetVersion(
+        row["asset_id"],
+        row["department"],
+        version=row["version"],
+        status=VERSION_STATUSES[row["status_id"]],
+    )
+
+
+def map_named_rows(connection: sqlite3.Connection) -> int:
+    connection.row_factory = sqlite3.Row
+
+    try:
+        rows = connection.execute(sqlite_database._SELECT_ASSET_VERSIONS).fetchall()
+    finally:
+        connection.row_factory = None
+
+    asset_versions = []
+    for row in rows:
+        asset_versions.append(asset_version_from_row(row))
+
+    return len(asset_versions)
+
+
+def map_tuple_rows(connection: sqlite3.Connection) -> int:
+    rows = connection.execute(sqlite_database._SELECT_ASSET_VERSIONS).fetchall()
+
+    return len(sqlite_database._asset_versions_from_rows(rows))
+
+
+def time_once(function, *args) -> tuple[float, int]:
+    start_time = time.perf_counter()
+    rows = function(*args)
+
+    return time.perf_counter() - start_time, rows
+
+
+def main() -> None:
+    database = SQLiteDatabase()
+
+    try:
+        populate(database)
+
+        with database._connections.reading() as connection:
+            cases = (
+                ("sqlite3.Row, by name", map_named_rows, connection),
+                ("tuples, positional", map_tuple_rows, connection),
+                (
+                    "raw rows",
+                    lambda: sum(1 for _ in database.iter_asset_version_rows()),
+                ),
+            )
+
+            print("{} asset versions".format(ROWS))
+            print(
+                "{:<28}{:>12}{:>12}{:>12}".format("case", "total", "per row", "speedup")
+            )
+
+            baseline = None
+
+            for label, function, *args in cases:
+                elapsed, rows = min(time_once(function, *args) for _ in range(3))
+                baseline = baseline or elapsed
+
+                assert rows == ROWS
+
+                print(
+                    "{:<28}{:>11.2f}s{:>10.0f}ns{:>11.1f}x".format(
+                        label, elapsed, elapsed / rows * 1e9, baseline / elapsed
+                    )
+                )
+    finally:
+        database.close()
+
+
+if __name__ == "__main__":
+    main()
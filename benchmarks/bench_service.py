@@ -0,0 +1,339 @@
+"""Benchmark suite of OtherWorldAssetService operations at increasing data store sizes.
+
+For each size, a synthetic manifest is generated and loaded into a fresh data store,
+then each operation is timed against it. Results are printed as a table and written as
+JSON, so runs can be compared to catch regressions.
+
+Run from the repository root with, e.g.:
+    python -m benchmarks.bench_service --sizes 1000 100000 --output results.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from benchmarks.generate_manifest import ManifestConfig, asset_name, write_manifest
+from otherworld_asset_service.api.service import OtherWorldAssetService
+from otherworld_asset_service.api.validation.pipelines.asset_pipeline import (
+    build_default_asset_pipeline,
+)
+from otherworld_asset_service.api.validation.pipelines.asset_version_pipeline import (
+    build_default_asset_version_pipeline,
+)
+from otherworld_asset_service.models.asset import Asset
+from otherworld_asset_service.models.asset_version import AssetVersion
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+
+
+# The number of assets loaded into the data store for each run
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+
+# The number of calls timed per operation, at most one per asset
+DEFAULT_OPERATIONS = 1_000
+
+# The service methods a manifest can be loaded with
+LOADERS = ("load_assets", "load_assets_bulk", "load_assets_parallel")
+
+# The number of calls timed for operations reading the whole data store
+FULL_SCAN_OPERATIONS = 3
+
+
+@dataclass(slots=True)
+class OperationResult:
+    """The timings of a single operation at a single data store size.
+
+    Args:
+        operation (str): The name of the operation.
+        assets (int): The number of assets within the data store.
+        calls (int): The number of calls timed.
+        total_seconds (float): The time spent across every call.
+        mean_us (float): The mean latency of a call in microseconds.
+        p50_us (float): The median latency of a call in microseconds.
+        p95_us (float): The 95th percentile latency of a call in microseconds.
+        p99_us (float): The 99th percentile latency of a call in microseconds.
+        per_second (float): The number of calls, or rows for loads, per second.
+    """
+
+    operation: str
+    assets: int
+    calls: int
+    total_seconds: float
+    mean_us: float
+    p50_us: float
+    p95_us: float
+    p99_us: float
+    per_second: float
+
+
+def summarize(
+    operation: str, assets: int, latencies: list[float], units: Optional[int] = None
+) -> OperationResult:
+    """Summarize the latencies of an operation.
+
+    Args:
+        operation (str): The name of the operation.
+        assets (int): The number of assets within the data store.
+        latencies (list[float]): The latency of every call in seconds.
+        units (int | None): The number of units of work, such as rows, to report the
+            throughput of, or None for calls.
+
+    Returns:
+        OperationResult: The summary.
+    """
+
+    latencies = sorted(latencies)
+    total = sum(latencies)
+
+    def percentile(fraction: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1e6
+
+    return OperationResult(
+        operation=operation,
+        assets=assets,
+        calls=len(latencies),
+        total_seconds=total,
+        mean_us=total / len(latencies) * 1e6,
+        p50_us=percentile(0.5),
+        p95_us=percentile(0.95),
+        p99_us=percentile(0.99),
+        per_second=(units or len(latencies)) / total if total else 0.0,
+    )
+
+
+def time_calls(function: Callable[[Any], Any], arguments: list[Any]) -> list[float]:
+    """Time a function called once with each argument.
+
+    Args:
+        function (Callable): The function to time.
+        arguments (list[Any]): The argument of each call.
+
+    Returns:
+        list[float]: The latency of every call in seconds.
+    """
+
+    latencies = []
+
+    for argument in arguments:
+        start_time = time.perf_counter()
+        function(argument)
+        latencies.append(time.perf_counter() - start_time)
+
+    return latencies
+
+
+def create_service(data_store_path: Path) -> OtherWorldAssetService:
+    """Create a service backed by a new data store with the default pipelines."""
+
+    return OtherWorldAssetService(
+        data_store_path,
+        build_default_asset_pipeline(),
+        build_default_asset_version_pipeline(),
+    )
+
+
+def run_size(
+    assets: int,
+    operations: int,
+    directory: Path,
+    seed: int,
+    loader: str = "load_assets",
+) -> list[OperationResult]:
+    """Run every benchmark against a data store of a single size.
+
+    Args:
+        assets (int): The number of assets to load.
+        operations (int): The number of calls timed per operation.
+        directory (Path): The directory holding the manifest and data store.
+        seed (int): The seed of the manifest and of the keys looked up.
+        loader (str): The name of the service method that loads the manifest.
+
+    Returns:
+        list[OperationResult]: The result of every operation.
+    """
+
+    randomizer = random.Random(seed)
+    manifest_path = directory / "manifest_{}.json".format(assets)
+    rows = write_manifest(manifest_path, ManifestConfig(assets=assets, seed=seed))
+
+    asset_service = create_service(directory / "assets_{}.db".format(assets))
+    results = []
+
+    start_time = time.perf_counter()
+    getattr(asset_service, loader)(manifest_path)
+    results.append(summarize(loader, assets, [time.perf_counter() - start_time], rows))
+
+    # Look up a random sample of the loaded assets, so caches start cold
+    indexes = randomizer.sample(range(assets), k=min(operations, assets))
+    names = [asset_name(index) for index in indexes]
+
+    results.append(
+        summarize("get_asset", assets, time_calls(asset_service.get_asset, names))
+    )
+    results.append(
+        summarize(
+            "get_asset_version",
+            assets,
+            time_calls(lambda name: asset_service.get_asset_version(name, 1), names),
+        )
+    )
+    results.append(
+        summarize(
+            "list_asset_versions",
+            assets,
+            time_calls(asset_service.list_asset_versions, names),
+        )
+    )
+    results.append(
+        summarize(
+            "list_assets",
+            assets,
+            time_calls(
+                lambda _: asset_service.list_assets(), range(FULL_SCAN_OPERATIONS)
+            ),
+        )
+    )
+
+    new_assets = [
+        Asset("benchmark_{:07d}".format(index), AssetType.PROP)
+        for index in range(operations)
+    ]
+
+    results.append(
+        summarize("add_asset", assets, time_calls(asset_service.add_asset, new_assets))
+    )
+
+    existing_assets = [asset_service.get_asset(name) for name in names]
+
+    results.append(
+        summarize(
+            "add_asset_version",
+            assets,
+            time_calls(
+                lambda asset: asset_service.add_asset_version(
+                    asset,
+                    AssetVersion(asset.id, "lighting", status=VersionStatus.ACTIVE),
+                ),
+                existing_assets,
+            ),
+        )
+    )
+
+    return results
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Parse arguments.
+
+    Returns:
+        argparse.ArgumentParser: The ArgumentParser object
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark OtherWorldAssetService operations"
+    )
+
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="The numbers of assets to benchmark at",
+    )
+    parser.add_argument(
+        "--operations",
+        type=int,
+        default=DEFAULT_OPERATIONS,
+        help="The number of calls timed per operation",
+    )
+    parser.add_argument(
+        "--loader",
+        choices=LOADERS,
+        default=LOADERS[0],
+        help="The service method that loads each manifest",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("benchmark_results.json"),
+        help="The JSON file results are written to",
+    )
+    parser.add_argument(
+        "--directory",
+        type=Path,
+        default=None,
+        help="The directory for manifests and data stores (default: a temporary one)",
+    )
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        directory = args.directory or Path(temporary_directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        print(
+            "{:<22}{:>10}{:>8}{:>12}{:>12}{:>12}{:>14}".format(
+                "operation",
+                "assets",
+                "calls",
+                "mean (us)",
+                "p50 (us)",
+                "p99 (us)",
+                "per second",
+            )
+        )
+
+        results = []
+        for assets in args.sizes:
+            for result in run_size(
+                assets, args.operations, directory, args.seed, args.loader
+            ):
+                results.append(result)
+
+                print(
+                    "{:<22}{:>10}{:>8}{:>12.1f}{:>12.1f}{:>12.1f}{:>14.0f}".format(
+                        result.operation,
+                        result.assets,
+                        result.calls,
+                        result.mean_us,
+                        result.p50_us,
+                        result.p99_us,
+                        result.per_second,
+                    )
+                )
+
+    args.output.write_text(
+        json.dumps(
+            {
+                "created": datetime.now(timezone.utc).isoformat(),
+                "python": sys.version.split()[0],
+                "sqlite": sqlite3.sqlite_version,
+                "platform": platform.platform(),
+                "seed": args.seed,
+                "loader": args.loader,
+                "operations": args.operations,
+                "results": [asdict(result) for result in results],
+            },
+            indent=2,
+        )
+    )
+
+    print("\nWrote results to {}".format(args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Micro-benchmark comparing ValidationPipeline.validate with compiled validators and
+columnar validation.
+
+Run from the repository root with: python -m benchmarks.bench_validation
+"""
+
+import time
+import timeit
+
+from otherworld_asset_service.api.validation import columnar
+from otherworld_asset_service.api.validation.pipelines.asset_pipeline import (
+    build_default_asset_pipeline,
+)
+from otherworld_asset_service.api.validation.pipelines.asset_version_pipeline import (
+    build_default_asset_version_pipeline,
+)
+from otherworld_asset_service.models.asset import Asset
+from otherworld_asset_service.models.asset_version import AssetVersion
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+
+
+NUMBER = 200_000
+
+# The number of rows validated per columnar batch
+BATCH_ROWS = 1_000_000
+
+
+def time_per_subject(function, subject) -> float:
+    """Time a validator against a single subject.
+
+    Returns:
+        float: The best time per subject in nanoseconds across repeated runs.
+    """
+
+    timings = timeit.repeat(lambda: function(subject), number=NUMBER, repeat=5)
+
+    return min(timings) / NUMBER * 1e9
+
+
+def main() -> None:
+    cases = (
+        (
+            "asset",
+            build_default_asset_pipeline(),
+            Asset("coraline", AssetType.CHARACTER),
+            Asset(None, 1),
+        ),
+        (
+            "asset version",
+            build_default_asset_version_pipeline(),
+            AssetVersion(1, "animation", version=1, status=VersionStatus.ACTIVE),
+            AssetVersion(1, 1, version=0, status="unknown"),
+        ),
+    )
+
+    print("{:<28}{:>12}{:>12}{:>12}".format("case", "validate", "compiled", "speedup"))
+
+    for name, pipeline, valid_subject, invalid_subject in cases:
+        validate = pipeline.compile()
+
+        for label, subject in (("valid", valid_subject), ("invalid", invalid_subject)):
+            baseline = time_per_subject(pipeline.validate, subject)
+            compiled = time_per_subject(validate, subject)
+
+            print(
+                "{:<28}{:>10.0f}ns{:>10.0f}ns{:>11.1f}x".format(
+                    "{} ({})".format(name, label),
+                    baseline,
+                    compiled,
+                    baseline / compiled,
+                )
+            )
+
+    pipeline = build_default_asset_version_pipeline()
+    validate = pipeline.compile()
+
+    statuses = [status.value for status in VersionStatus]
+    columns = {
+        "department": ["animation"] * BATCH_ROWS,
+        "version": list(range(1, BATCH_ROWS + 1)),
+        "status": [statuses[row % len(statuses)] for row in range(BATCH_ROWS)],
+    }
+    subjects = [
+        AssetVersion(1, department, version=version, status=status)
+        for department, version, status in zip(*columns.values())
+    ]
+
+    start_time = time.perf_counter()
+    for subject in subjects:
+        validate(subject)
+    compiled = time.perf_counter() - start_time
+
+    print("\n{} asset versions".format(BATCH_ROWS))
+    print("{:<28}{:>10.0f}ns".format("compiled, per row", compiled / BATCH_ROWS * 1e9))
+
+    batches = [("validate_many, lists", columns)]
+
+    if columnar.numpy is not None:
+        batches.append(
+            (
+                "validate_many, arrays",
+                {
+                    field: columnar.numpy.asarray(values)
+                    for field, values in columns.items()
+                },
+            )
+        )
+
+    for label, batch in batches:
+        start_time = time.perf_counter()
+        pipeline.validate_many(batch)
+        elapsed = time.perf_counter() - start_time
+
+        print("{:<28}{:>10.0f}ns".format(label, elapsed / BATCH_ROWS * 1e9))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""Deterministic generator of synthetic manifests in the shape accepted by load_assets.
+
+Run from the repository root with, e.g.:
+    python -m benchmarks.generate_manifest manifest.json --assets 100000 --seed 7
+"""
+
+import argparse
+import json
+import random
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from otherworld_asset_service.api.ingestion import NDJSON_SUFFIXES
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+
+
+# The departments of a typical production, weighted by how often they publish
+DEFAULT_DEPARTMENT_WEIGHTS = {
+    "modeling": 0.25,
+    "texturing": 0.2,
+    "rigging": 0.1,
+    "animation": 0.25,
+    "cfx": 0.1,
+    "fx": 0.1,
+}
+
+DEFAULT_ASSET_TYPE_WEIGHTS = {
+    AssetType.CHARACTER.value: 0.15,
+    AssetType.DRESSING.value: 0.25,
+    AssetType.ENVIRONMENT.value: 0.05,
+    AssetType.FX.value: 0.1,
+    AssetType.PROP.value: 0.3,
+    AssetType.SET.value: 0.1,
+    AssetType.VEHICLE.value: 0.05,
+}
+
+DEFAULT_STATUS_WEIGHTS = {
+    VersionStatus.ACTIVE.value: 0.8,
+    VersionStatus.INACTIVE.value: 0.2,
+}
+
+_WORDS = (
+    "beldam",
+    "button",
+    "cat",
+    "coraline",
+    "doll",
+    "garden",
+    "key",
+    "mantis",
+    "mouse",
+    "piano",
+    "spider",
+    "tunnel",
+    "well",
+    "wybie",
+)
+
+
+def _corrupt_type(entry: dict[str, Any], _: random.Random) -> None:
+    entry["asset"]["type"] = "unknown"
+
+
+def _corrupt_status(entry: dict[str, Any], _: random.Random) -> None:
+    entry["status"] = "deprecated"
+
+
+def _corrupt_name(entry: dict[str, Any], randomizer: random.Random) -> None:
+    entry["asset"]["name"] = randomizer.choice(("", None, 42))
+
+
+def _corrupt_department(entry: dict[str, Any], randomizer: random.Random) -> None:
+    entry["department"] = randomizer.choice(("", None, 7))
+
+
+def _corrupt_version(entry: dict[str, Any], randomizer: random.Random) -> None:
+    entry["version"] = randomizer.choice((0, -1))
+
+
+# Every way an entry can be made invalid, one chosen at random per invalid entry
+ERROR_KINDS = {
+    "type": _corrupt_type,
+    "status": _corrupt_status,
+    "name": _corrupt_name,
+    "department": _corrupt_department,
+    "version": _corrupt_version,
+}
+
+
+@dataclass(slots=True)
+class ManifestConfig:
+    """The shape of a synthetic manifest.
+
+    Args:
+        assets (int): The number of distinct assets.
+        min_versions (int): The fewest versions generated per asset.
+        max_versions (int): The most versions generated per asset.
+        asset_type_weights (dict[str, float]): The relative frequency of each type.
+        department_weights (dict[str, float]): The relative frequency of each
+            department.
+        status_weights (dict[str, float]): The relative frequency of each status.
+        error_rate (float): The fraction of entries made invalid.
+        duplicate_rate (float): The fraction of entries repeated as a duplicate.
+        seed (int): The seed of the generator. The same seed and config always
+            generate the same manifest.
+    """
+
+    assets: int = 1000
+    min_versions: int = 1
+    max_versions: int = 5
+    asset_type_weights: dict[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_ASSET_TYPE_WEIGHTS)
+    )
+    department_weights: dict[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_DEPARTMENT_WEIGHTS)
+    )
+    status_weights: dict[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_STATUS_WEIGHTS)
+    )
+    error_rate: float = 0.0
+    duplicate_rate: float = 0.0
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.assets < 0:
+            raise ValueError("Assets must be greater than or equal to 0.")
+
+        if not 1 <= self.min_versions <= self.max_versions:
+            raise ValueError("Versions must satisfy 1 <= min_versions <= max_versions.")
+
+        for rate in (self.error_rate, self.duplicate_rate):
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError("Rates must be between 0 and 1.")
+
+
+def asset_name(index: int) -> str:
+    """Get the unique name of the asset generated at an index.
+
+    Args:
+        index (int): The index of the asset within the manifest.
+
+    Returns:
+        str: The name of the asset.
+    """
+
+    return "{}_{:07d}".format(_WORDS[index % len(_WORDS)], index)
+
+
+def generate_entries(config: ManifestConfig) -> Iterator[dict[str, Any]]:
+    """Generate the entries of a synthetic manifest one at a time.
+
+    Entries are grouped by asset, and each asset's versions increase by one per
+    department, as a production would publish them.
+
+    Args:
+        config (ManifestConfig): The shape of the manifest.
+
+    Yields:
+        dict[str, Any]: Each entry, in the shape accepted by load_assets.
+    """
+
+    randomizer = random.Random(config.seed)
+
+    asset_types = list(config.asset_type_weights)
+    asset_type_weights = list(config.asset_type_weights.values())
+    departments = list(config.department_weights)
+    department_weights = list(config.department_weights.values())
+    statuses = list(config.status_weights)
+    status_weights = list(config.status_weights.values())
+    error_kinds = list(ERROR_KINDS.values())
+
+    for index in range(config.assets):
+        asset = {
+            "name": asset_name(index),
+            "type": randomizer.choices(asset_types, asset_type_weights)[0],
+        }
+        versions = randomizer.randint(config.min_versions, config.max_versions)
+        last_versions: dict[str, int] = {}
+
+        for department in randomizer.choices(
+            departments, department_weights, k=versions
+        ):
+            last_versions[department] = last_versions.get(department, 0) + 1
+
+            entry = {
+                "asset": dict(asset),
+                "department": department,
+                "version": last_versions[department],
+                "status": randomizer.choices(statuses, status_weights)[0],
+            }
+
+            if randomizer.random() < config.error_rate:
+                randomizer.choice(error_kinds)(entry, randomizer)
+
+            yield entry
+
+            if randomizer.random() < config.duplicate_rate:
+                yield {**entry, "asset": dict(entry["asset"])}
+
+
+def write_manifest(file_path: str, config: ManifestConfig) -> int:
+    """Write a synthetic manifest, choosing the format from the file suffix.
+
+    Entries are written as they are generated, so any size of manifest can be written
+    at constant memory.
+
+    Args:
+        file_path (str): The JSON or NDJSON (.ndjson/.jsonl) file to write.
+        config (ManifestConfig): The shape of the manifest.
+
+    Returns:
+        int: The number of entries written.
+    """
+
+    is_ndjson = Path(file_path).suffix.lower() in NDJSON_SUFFIXES
+    count = 0
+
+    with Path(file_path).open("w", encoding="utf-8") as file:
+        if not is_ndjson:
+            file.write("[\n")
+
+        for entry in generate_entries(config):
+            if is_ndjson:
+                file.write(json.dumps(entry))
+                file.write("\n")
+            else:
+                file.write(",\n" if count else "")
+                file.write(json.dumps(entry))
+
+            count += 1
+
+        if not is_ndjson:
+            file.write("\n]\n")
+
+    return count
+
+
+def _parse_weights(value: str) -> dict[str, float]:
+    # Weights are given as comma separated name=weight pairs, e.g. prop=3,set=1
+    weights = {}
+
+    for pair in value.split(","):
+        name, _, weight = pair.partition("=")
+        weights[name.strip()] = float(weight)
+
+    return weights
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Parse arguments.
+
+    Returns:
+        argparse.ArgumentParser: The ArgumentParser object
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Generate a deterministic synthetic asset manifest"
+    )
+
+    parser.add_argument("file_path", type=Path, help="The JSON or NDJSON file")
+    parser.add_argument("--assets", type=int, default=1000)
+    parser.add_argument("--min-versions", type=int, default=1)
+    parser.add_argument("--max-versions", type=int, default=5)
+    parser.add_argument("--asset-types", type=_parse_weights, default=None)
+    parser.add_argument("--departments", type=_parse_weights, default=None)
+    parser.add_argument("--statuses", type=_parse_weights, default=None)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--duplicate-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+
+    config = ManifestConfig(
+        assets=args.assets,
+        min_versions=args.min_versions,
+        max_versions=args.max_versions,
+        error_rate=args.error_rate,
+        duplicate_rate=args.duplicate_rate,
+        seed=args.seed,
+    )
+
+    for attribute, weights in (
+        ("asset_type_weights", args.asset_types),
+        ("department_weights", args.departments),
+        ("status_weights", args.statuses),
+    ):
+        if weights is not None:
+            setattr(config, attribute, weights)
+
+    count = write_manifest(args.file_path, config)
+
+    print("Wrote {} entries to {}".format(count, args.file_path))
+
+
+if __name__ == "__main__":
+    main()
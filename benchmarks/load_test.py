@@ -0,0 +1,530 @@
+"""Load-testing harness replaying a mixed operation log against OtherWorldAssetService.
+
+An operation log is NDJSON, one call per line, e.g.:
+    {"operation": "get_asset", "args": ["coraline_0000007"]}
+    {"operation": "add_asset_version", "args": ["coraline_0000007", "fx", "active"]}
+
+A log is either generated from a weighted mix of operations, optionally recorded for
+later runs, or replayed from a recording. Its calls are spread round-robin across
+concurrent workers, either threads sharing a single service or processes each opening
+their own, and every call is timed. Lock contention surfaces as SQLITE_BUSY errors
+("database is locked"), which are counted separately from any other error.
+
+Run from the repository root with, e.g.:
+    python -m benchmarks.load_test --assets 10000 --operations 50000 --workers 8
+    python -m benchmarks.load_test --replay operations.ndjson --processes
+"""
+
+import argparse
+import json
+import random
+import sqlite3
+import tempfile
+import time
+
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from benchmarks.bench_service import OperationResult, summarize
+from benchmarks.generate_manifest import ManifestConfig, asset_name, write_manifest
+from otherworld_asset_service.api.service import OtherWorldAssetService
+from otherworld_asset_service.api.validation.pipelines.asset_pipeline import (
+    build_default_asset_pipeline,
+)
+from otherworld_asset_service.api.validation.pipelines.asset_version_pipeline import (
+    build_default_asset_version_pipeline,
+)
+from otherworld_asset_service.models.asset import Asset
+from otherworld_asset_service.models.asset_version import AssetVersion
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+from otherworld_asset_service.storage.connection_manager import DEFAULT_BUSY_TIMEOUT
+
+
+# A read-heavy mix, as render farm lookups outnumber publishes
+DEFAULT_OPERATION_WEIGHTS = {
+    "get_asset": 0.4,
+    "get_asset_version": 0.2,
+    "list_asset_versions": 0.25,
+    "list_assets": 0.001,
+    "add_asset": 0.05,
+    "add_asset_version": 0.1,
+}
+
+# A write-heavy mix, as when every department publishes at the start of the day
+PUBLISH_SPIKE_WEIGHTS = {
+    "get_asset": 0.2,
+    "list_asset_versions": 0.1,
+    "add_asset": 0.2,
+    "add_asset_version": 0.5,
+}
+
+MIXES = {"default": DEFAULT_OPERATION_WEIGHTS, "publish-spike": PUBLISH_SPIKE_WEIGHTS}
+
+# The primary SQLite result codes of a locked data store
+_SQLITE_BUSY = 5
+_SQLITE_LOCKED = 6
+
+_DEPARTMENTS = ("modeling", "texturing", "rigging", "animation", "cfx", "fx")
+
+# The operation replaying each call, given the service and the call's arguments
+_OPERATIONS = {
+    "get_asset": lambda service, name: service.get_asset(name),
+    "get_asset_version": lambda service, name, version: service.get_asset_version(
+        name, version
+    ),
+    "list_asset_versions": lambda service, name: service.list_asset_versions(name),
+    "list_assets": lambda service: service.list_assets(),
+    "add_asset": lambda service, name, asset_type: service.add_asset(
+        Asset(name, AssetType(asset_type))
+    ),
+    "add_asset_version": lambda service, name, department, status: _add_version(
+        service, name, department, status
+    ),
+}
+
+
+def _add_version(
+    service: OtherWorldAssetService, name: str, department: str, status: str
+) -> Optional[AssetVersion]:
+    asset = service.get_asset(name)
+
+    return service.add_asset_version(
+        asset, AssetVersion(asset.id, department, status=VersionStatus(status))
+    )
+
+
+def is_busy_error(error: BaseException) -> bool:
+    """Check whether an error was raised by a data store locked by another writer.
+
+    Args:
+        error (BaseException): The error raised by a call.
+
+    Returns:
+        bool: True if the error is SQLITE_BUSY or SQLITE_LOCKED.
+    """
+
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+
+    # sqlite_errorcode is only set from Python 3.11
+    error_code = getattr(error, "sqlite_errorcode", None)
+
+    if error_code is not None:
+        # Extended result codes keep the primary code in their lowest byte
+        return error_code & 0xFF in (_SQLITE_BUSY, _SQLITE_LOCKED)
+
+    return "locked" in str(error) or "busy" in str(error)
+
+
+def generate_operations(
+    assets: int,
+    count: int,
+    weights: Optional[dict[str, float]] = None,
+    seed: int = 0,
+) -> Iterator[dict[str, Any]]:
+    """Generate a deterministic operation log against a generated manifest.
+
+    Args:
+        assets (int): The number of assets within the manifest the data store was
+            loaded from, see generate_manifest.
+        count (int): The number of calls.
+        weights (dict[str, float] | None): The relative frequency of each operation,
+            or None for DEFAULT_OPERATION_WEIGHTS.
+        seed (int): The seed of the generator.
+
+    Yields:
+        dict[str, Any]: Each call, holding its operation and arguments.
+    """
+
+    weights = weights or DEFAULT_OPERATION_WEIGHTS
+    randomizer = random.Random(seed)
+    operations = list(weights)
+    operation_weights = list(weights.values())
+    asset_types = [asset_type.value for asset_type in AssetType]
+
+    for index, operation in enumerate(
+        randomizer.choices(operations, operation_weights, k=count)
+    ):
+        name = asset_name(randomizer.randrange(assets))
+
+        if operation == "get_asset_version":
+            args = [name, 1]
+        elif operation == "list_assets":
+            args = []
+        elif operation == "add_asset":
+            args = ["load_{:09d}".format(index), randomizer.choice(asset_types)]
+        elif operation == "add_asset_version":
+            args = [name, randomizer.choice(_DEPARTMENTS), VersionStatus.ACTIVE.value]
+        else:
+            args = [name]
+
+        yield {"operation": operation, "args": args}
+
+
+def read_operations(file_path: Path) -> list[dict[str, Any]]:
+    """Read a recorded operation log.
+
+    Args:
+        file_path (Path): The NDJSON operation log.
+
+    Returns:
+        list[dict[str, Any]]: Each call, holding its operation and arguments.
+    """
+
+    with Path(file_path).open(encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def write_operations(file_path: Path, operations: list[dict[str, Any]]) -> None:
+    """Record an operation log so it can be replayed.
+
+    Args:
+        file_path (Path): The NDJSON file to write.
+        operations (list[dict[str, Any]]): Each call, holding its operation and
+            arguments.
+    """
+
+    with Path(file_path).open("w", encoding="utf-8") as file:
+        for operation in operations:
+            file.write(json.dumps(operation))
+            file.write("\n")
+
+
+@dataclass(slots=True)
+class WorkerResult:
+    """The latencies and errors of the calls replayed by a single worker.
+
+    Args:
+        latencies (dict[str, list[float]]): The latency of every call in seconds, by
+            operation.
+        busy_errors (Counter[str]): The number of SQLITE_BUSY errors, by operation.
+        errors (Counter[str]): The number of any other errors, by operation.
+    """
+
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    busy_errors: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+
+
+def replay(
+    service: OtherWorldAssetService, operations: list[dict[str, Any]]
+) -> WorkerResult:
+    """Replay calls against a service one after another, timing each.
+
+    Args:
+        service (OtherWorldAssetService): The service to call.
+        operations (list[dict[str, Any]]): Each call, holding its operation and
+            arguments.
+
+    Returns:
+        WorkerResult: The latencies and errors of the calls.
+    """
+
+    result = WorkerResult()
+
+    for call in operations:
+        operation = call["operation"]
+        function = _OPERATIONS[operation]
+
+        start_time = time.perf_counter()
+
+        try:
+            function(service, *call["args"])
+        except Exception as error:
+            if is_busy_error(error):
+                result.busy_errors[operation] += 1
+            else:
+                result.errors[operation] += 1
+
+        result.latencies.setdefault(operation, []).append(
+            time.perf_counter() - start_time
+        )
+
+    return result
+
+
+def create_service(
+    data_store_path: Path, busy_timeout: int = DEFAULT_BUSY_TIMEOUT
+) -> OtherWorldAssetService:
+    """Create a service with the default pipelines."""
+
+    return OtherWorldAssetService(
+        data_store_path,
+        build_default_asset_pipeline(),
+        build_default_asset_version_pipeline(),
+        busy_timeout=busy_timeout,
+    )
+
+
+def _replay_in_process(
+    data_store_path: Path, busy_timeout: int, operations: list[dict[str, Any]]
+) -> WorkerResult:
+    # Services cannot be shared across processes, so each process opens its own
+    return replay(create_service(data_store_path, busy_timeout), operations)
+
+
+@dataclass(slots=True)
+class LoadTestResult:
+    """The outcome of replaying an operation log.
+
+    Args:
+        workers (int): The number of concurrent workers.
+        processes (bool): Whether the workers were processes rather than threads.
+        calls (int): The number of calls replayed.
+        wall_seconds (float): The time taken to replay every call.
+        per_second (float): The number of calls completed per second.
+        operations (list[OperationResult]): The latencies of each operation.
+        busy_errors (dict[str, int]): The number of SQLITE_BUSY errors, by operation.
+        errors (dict[str, int]): The number of any other errors, by operation.
+    """
+
+    workers: int
+    processes: bool
+    calls: int
+    wall_seconds: float
+    per_second: float
+    operations: list[OperationResult]
+    busy_errors: dict[str, int]
+    errors: dict[str, int]
+
+
+def run_load_test(
+    data_store_path: Path,
+    operations: list[dict[str, Any]],
+    workers: int = 4,
+    processes: bool = False,
+    busy_timeout: int = DEFAULT_BUSY_TIMEOUT,
+    assets: int = 0,
+) -> LoadTestResult:
+    """Replay an operation log across concurrent workers.
+
+    Args:
+        data_store_path (Path): The data store to replay against.
+        operations (list[dict[str, Any]]): Each call, holding its operation and
+            arguments, dealt round-robin to the workers.
+        workers (int): The number of concurrent workers.
+        processes (bool): Whether each worker is a process with its own service,
+            rather than a thread sharing a single service.
+        busy_timeout (int): The number of milliseconds a call waits on a locked data
+            store before failing with SQLITE_BUSY.
+        assets (int): The number of assets within the data store, reported alongside
+            each operation.
+
+    Returns:
+        LoadTestResult: The latencies, throughput and errors of the replay.
+    """
+
+    batches = [operations[worker::workers] for worker in range(workers)]
+    executor: Executor
+
+    if processes:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        replay_batch = partial(_replay_in_process, data_store_path, busy_timeout)
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+        replay_batch = partial(replay, create_service(data_store_path, busy_timeout))
+
+    with executor:
+        start_time = time.perf_counter()
+        futures = [executor.submit(replay_batch, batch) for batch in batches]
+        worker_results = [future.result() for future in futures]
+        wall_seconds = time.perf_counter() - start_time
+
+    latencies: dict[str, list[float]] = {}
+    busy_errors: Counter = Counter()
+    errors: Counter = Counter()
+
+    for worker_result in worker_results:
+        for operation, operation_latencies in worker_result.latencies.items():
+            latencies.setdefault(operation, []).extend(operation_latencies)
+
+        busy_errors.update(worker_result.busy_errors)
+        errors.update(worker_result.errors)
+
+    return LoadTestResult(
+        workers=workers,
+        processes=processes,
+        calls=len(operations),
+        wall_seconds=wall_seconds,
+        per_second=len(operations) / wall_seconds if wall_seconds else 0.0,
+        operations=[
+            summarize(operation, assets, operation_latencies)
+            for operation, operation_latencies in sorted(latencies.items())
+        ],
+        busy_errors=dict(busy_errors),
+        errors=dict(errors),
+    )
+
+
+def _parse_weights(value: str) -> dict[str, float]:
+    # Weights are either a named mix or comma separated operation=weight pairs
+    if value in MIXES:
+        return MIXES[value]
+
+    weights = {}
+
+    for pair in value.split(","):
+        operation, _, weight = pair.partition("=")
+
+        if operation.strip() not in _OPERATIONS:
+            raise argparse.ArgumentTypeError(
+                "Unknown operation: {}".format(operation.strip())
+            )
+
+        weights[operation.strip()] = float(weight)
+
+    return weights
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Parse arguments.
+
+    Returns:
+        argparse.ArgumentParser: The ArgumentParser object
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Replay a concurrent workload against OtherWorldAssetService"
+    )
+
+    parser.add_argument(
+        "--data-store",
+        type=Path,
+        default=None,
+        help="An existing data store to replay against (default: a generated one)",
+    )
+    parser.add_argument(
+        "--assets",
+        type=int,
+        default=10_000,
+        help="The number of assets loaded into a generated data store",
+    )
+    parser.add_argument(
+        "--replay", type=Path, default=None, help="An NDJSON operation log to replay"
+    )
+    parser.add_argument(
+        "--record",
+        type=Path,
+        default=None,
+        help="The NDJSON file a generated operation log is recorded to",
+    )
+    parser.add_argument(
+        "--operations",
+        type=int,
+        default=10_000,
+        help="The number of calls within a generated operation log",
+    )
+    parser.add_argument(
+        "--mix",
+        type=_parse_weights,
+        default=DEFAULT_OPERATION_WEIGHTS,
+        help="A named mix ({}) or operation=weight pairs, e.g. get_asset=3,"
+        "add_asset=1".format(", ".join(MIXES)),
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Run each worker as a process rather than a thread",
+    )
+    parser.add_argument(
+        "--busy-timeout",
+        type=int,
+        default=DEFAULT_BUSY_TIMEOUT,
+        help="The milliseconds a call waits on a locked data store",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="The JSON file results are written to",
+    )
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        data_store_path = args.data_store
+
+        if data_store_path is None:
+            data_store_path = Path(temporary_directory) / "assets.db"
+            manifest_path = Path(temporary_directory) / "manifest.ndjson"
+
+            write_manifest(
+                manifest_path, ManifestConfig(assets=args.assets, seed=args.seed)
+            )
+            create_service(data_store_path).load_assets_bulk(manifest_path)
+
+        if args.replay is not None:
+            operations = read_operations(args.replay)
+        else:
+            operations = list(
+                generate_operations(args.assets, args.operations, args.mix, args.seed)
+            )
+
+            if args.record is not None:
+                write_operations(args.record, operations)
+
+        result = run_load_test(
+            data_store_path,
+            operations,
+            workers=args.workers,
+            processes=args.processes,
+            busy_timeout=args.busy_timeout,
+            assets=args.assets,
+        )
+
+    print(
+        "{:<22}{:>8}{:>12}{:>12}{:>12}{:>12}{:>8}{:>8}".format(
+            "operation",
+            "calls",
+            "mean (us)",
+            "p50 (us)",
+            "p95 (us)",
+            "p99 (us)",
+            "busy",
+            "errors",
+        )
+    )
+
+    for operation in result.operations:
+        print(
+            "{:<22}{:>8}{:>12.1f}{:>12.1f}{:>12.1f}{:>12.1f}{:>8}{:>8}".format(
+                operation.operation,
+                operation.calls,
+                operation.mean_us,
+                operation.p50_us,
+                operation.p95_us,
+                operation.p99_us,
+                result.busy_errors.get(operation.operation, 0),
+                result.errors.get(operation.operation, 0),
+            )
+        )
+
+    print(
+        "\n{} calls across {} {} in {:.2f}s ({:.0f} calls/sec, {} SQLITE_BUSY)".format(
+            result.calls,
+            result.workers,
+            "processes" if result.processes else "threads",
+            result.wall_seconds,
+            result.per_second,
+            sum(result.busy_errors.values()),
+        )
+    )
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(asdict(result), indent=2))
+
+        print("Wrote results to {}".format(args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+import asyncio
+import functools
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Iterable, Optional, TypeVar, Union
+
+from otherworld_asset_service.api.export import EXPORT_PAGE_SIZE, ExportResult
+from otherworld_asset_service.api.ingestion import (
+    BulkLoadResult,
+    IncrementalLoadResult,
+)
+from otherworld_asset_service.api.reporting import ImportReport
+from otherworld_asset_service.api.service import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CACHE_SIZE,
+    OtherWorldAssetService,
+)
+from otherworld_asset_service.models.asset import Asset
+from otherworld_asset_service.models.asset_version import AssetVersion
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+from otherworld_asset_service.storage.data_store import AssetKey
+from otherworld_asset_service.storage.pagination import DEFAULT_PAGE_SIZE, Page
+from otherworld_asset_service.utils import logger
+from otherworld_asset_service.utils.cache import CacheInfo
+
+
+LOGGER = logger.get_logger()
+
+# The number of threads running storage calls for a single async service
+DEFAULT_MAX_WORKERS = 4
+
+R = TypeVar("R")
+
+
+class AsyncOtherWorldAssetService:
+    """An asyncio front-end for OtherWorldAssetService.
+
+    Every method mirrors the synchronous service as a coroutine, running the storage
+    call on a dedicated thread pool so the event loop is never blocked. Identical reads
+    that are already in flight are coalesced, so a burst of requests for the same asset
+    runs a single query and every caller receives the same result.
+
+    An instance must only be used from a single event loop.
+
+    Args:
+        data_store_path (str): The location of the data store.
+        asset_pipeline (ValidationPipeline[Asset]): The pipeline validating assets.
+        asset_version_pipeline (ValidationPipeline[AssetVersion]): The pipeline
+            validating asset versions.
+        cache_size (int): The number of entries held by each cache of the service.
+        max_workers (int): The number of threads running storage calls.
+    """
+
+    def __init__(
+        self,
+        data_store_path,
+        asset_pipeline,
+        asset_version_pipeline,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        self._service = OtherWorldAssetService(
+            data_store_path,
+            asset_pipeline,
+            asset_version_pipeline,
+            cache_size=cache_size,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="OtherWorldAssetService"
+        )
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+
+    async def __aenter__(self) -> "AsyncOtherWorldAssetService":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    async def _run(self, function: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            self._executor, functools.partial(function, *args, **kwargs)
+        )
+
+    async def _read(self, key: Hashable, function: Callable[..., R], *args: Any) -> R:
+        future = self._in_flight.get(key)
+
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(
+                self._executor, functools.partial(function, *args)
+            )
+            self._in_flight[key] = future
+
+            def forget(done_future: asyncio.Future) -> None:
+                # A write may already have replaced this read with a newer one
+                if self._in_flight.get(key) is done_future:
+                    del self._in_flight[key]
+
+            future.add_done_callback(forget)
+        else:
+            LOGGER.debug("Joining in-flight read for %s", key)
+
+        # Shield the shared read so one caller being cancelled does not cancel it for
+        # every other caller waiting on it
+        return await asyncio.shield(future)
+
+    async def _write(self, function: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        # Reads started before the write may return stale data, so later callers must
+        # not join them
+        self._in_flight.clear()
+
+        try:
+            return await self._run(function, *args, **kwargs)
+        finally:
+            self._in_flight.clear()
+
+    async def load_assets(
+        self, file_path: str, report: Optional[ImportReport] = None
+    ) -> ImportReport:
+        """Load all assets from a file.
+
+        Args:
+            file_path (str): The JSON or NDJSON file path.
+            report (ImportReport | None): The report collecting the outcome of every
+                entry, or None to collect them within a new report.
+
+        Returns:
+            ImportReport: The report holding the outcome of every entry.
+        """
+
+        return await self._write(self._service.load_assets, file_path, report=report)
+
+    async def load_assets_bulk(
+        self,
+        file_path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        report: Optional[ImportReport] = None,
+    ) -> BulkLoadResult:
+        """Load all assets from a file, writing each batch in a single transaction.
+
+        Args:
+            file_path (str): The JSON or NDJSON file path.
+            batch_size (int): The number of entries validated and written per
+                transaction.
+            report (ImportReport | None): The report to also collect the outcome of
+                every entry within, if any.
+
+        Returns:
+            BulkLoadResult: The outcome of every entry and the ingestion throughput.
+        """
+
+        return await self._write(
+            self._service.load_assets_bulk,
+            file_path,
+            batch_size=batch_size,
+            report=report,
+        )
+
+    async def load_assets_incremental(
+        self,
+        file_path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        report: Optional[ImportReport] = None,
+    ) -> IncrementalLoadResult:
+        """Load only what has changed in a manifest since it was last imported.
+
+        Args:
+            file_path (str): The JSON or NDJSON file path.
+            batch_size (int): The number of entries fingerprinted, validated and
+                written at a time.
+            report (ImportReport | None): The report to also collect the outcome of
+                every changed entry within, if any.
+
+        Returns:
+            IncrementalLoadResult: The number of unchanged entries, the outcome of
+                every other entry, and the ingestion throughput.
+        """
+
+        return await self._write(
+            self._service.load_assets_incremental,
+            file_path,
+            batch_size=batch_size,
+            report=report,
+        )
+
+    async def add_asset(
+        self, asset: Asset, report: Optional[ImportReport] = None
+    ) -> Optional[Asset]:
+        """Add an asset to the data store.
+
+        Args:
+            asset (Asset): The asset to add.
+            report (ImportReport | None): The report to collect the outcome within, or
+                None to log any errors.
+
+        Returns:
+            Asset | None: The added asset, the existing asset if it is a duplicate, or
+                None if the asset is invalid.
+        """
+
+        return await self._write(self._service.add_asset, asset, report=report)
+
+    async def add_asset_version(
+        self,
+        asset: Asset,
+        version: AssetVersion,
+        report: Optional[ImportReport] = None,
+    ) -> Optional[AssetVersion]:
+        """Add an asset version to the data store.
+
+        Args:
+            asset (Asset): The asset to be versioned.
+            version (AssetVersion): The version data associated with the asset.
+            report (ImportReport | None): The report to collect the outcome within, or
+                None to log any errors.
+
+        Returns:
+            AssetVersion | None: The added asset version, or None if it was rejected.
+        """
+
+        return await self._write(
+            self._service.add_asset_version, asset, version, report=report
+        )
+
+    async def list_assets(self) -> list[Asset]:
+        """List all assets within the data store.
+
+        Returns:
+            list[Asset]: A list of assets currently in the data store.
+        """
+
+        return await self._read(("list_assets",), self._service.list_assets)
+
+    async def list_assets_page(
+        self, page_token: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Page[Asset]:
+        """List a single page of assets within the data store.
+
+        Args:
+            page_token (str | None): The token of the page to list, or None for the
+                first page.
+            page_size (int): The most assets returned within the page.
+
+        Returns:
+            Page[Asset]: The assets within the page and the token of the next page.
+        """
+
+        return await self._read(
+            ("list_assets_page", page_token, page_size),
+            self._service.list_assets_page,
+            page_token,
+            page_size,
+        )
+
+    async def get_asset(self, asset_name: str) -> Asset:
+        """Get an asset from the data store.
+
+        Args:
+            asset_name (str): The asset to get.
+
+        Returns:
+            Asset: The asset found matching the provided asset name.
+        """
+
+        return await self._read(
+            ("get_asset", asset_name), self._service.get_asset, asset_name
+        )
+
+    async def get_assets(self, keys: Iterable[AssetKey]) -> dict[AssetKey, Asset]:
+        """Get many assets from the data store at once.
+
+        Args:
+            keys (Iterable[str | tuple[str, AssetType]]): The asset names, or asset
+                name and type pairs, to get.
+
+        Returns:
+            dict[str | tuple[str, AssetType], Asset]: The asset found for each key.
+                Keys without a matching asset are omitted.
+        """
+
+        keys = tuple(keys)
+
+        return await self._read(("get_assets", keys), self._service.get_assets, keys)
+
+    async def get_asset_version(self, asset_name: str, version: int) -> AssetVersion:
+        """Get an asset version from the data store.
+
+        Args:
+            asset_name (str): The asset name necessary for version lookup.
+            version (int): The version number to find.
+
+        Returns:
+            AssetVersion: The asset version found matching the provided name and number.
+        """
+
+        return await self._read(
+            ("get_asset_version", asset_name, version),
+            self._service.get_asset_version,
+            asset_name,
+            version,
+        )
+
+    async def list_asset_versions(self, asset_name: str) -> list[AssetVersion]:
+        """List all assets versions for an asset.
+
+        Args:
+            asset_name (str): The asset name used to find all versions for an asset.
+
+        Returns:
+            list[AssetVersion]: A list of versions.
+        """
+
+        return await self._read(
+            ("list_asset_versions", asset_name),
+            self._service.list_asset_versions,
+            asset_name,
+        )
+
+    async def list_asset_versions_page(
+        self,
+        asset_name: str,
+        page_token: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[AssetVersion]:
+        """List a single page of asset versions for an asset.
+
+        Args:
+            asset_name (str): The asset name used to find all versions for an asset.
+            page_token (str | None): The token of the page to list, or None for the
+                first page.
+            page_size (int): The most asset versions returned within the page.
+
+        Returns:
+            Page[AssetVersion]: The asset versions within the page and the token of the
+                next page.
+        """
+
+        return await self._read(
+            ("list_asset_versions_page", asset_name, page_token, page_size),
+            self._service.list_asset_versions_page,
+            asset_name,
+            page_token,
+            page_size,
+        )
+
+    async def list_asset_versions_for(
+        self, asset_ids: Iterable[int]
+    ) -> dict[int, list[AssetVersion]]:
+        """List all asset versions for many assets at once.
+
+        Args:
+            asset_ids (Iterable[int]): The ids of the assets to list versions for.
+
+        Returns:
+            dict[int, list[AssetVersion]]: The asset versions of each asset.
+        """
+
+        asset_ids = tuple(asset_ids)
+
+        return await self._read(
+            ("list_asset_versions_for", asset_ids),
+            self._service.list_asset_versions_for,
+            asset_ids,
+        )
+
+    async def export_assets(
+        self,
+        file_path: str,
+        export_format: Optional[str] = None,
+        asset_types: Optional[Iterable[Union[AssetType, str]]] = None,
+        departments: Optional[Iterable[str]] = None,
+        statuses: Optional[Iterable[Union[VersionStatus, str]]] = None,
+        page_size: int = EXPORT_PAGE_SIZE,
+    ) -> ExportResult:
+        """Export every asset version to a file, at constant memory.
+
+        Args:
+            file_path (str): The file to write.
+            export_format (str | None): ndjson, csv or json, or None to choose from
+                the file suffix.
+            asset_types (Iterable[AssetType | str] | None): Only export the versions
+                of assets of these types, or None for every type.
+            departments (Iterable[str] | None): Only export versions of these
+                departments, or None for every department.
+            statuses (Iterable[VersionStatus | str] | None): Only export versions
+                with these statuses, or None for every status.
+            page_size (int): The number of rows read from the data store at a time.
+
+        Returns:
+            ExportResult: The number of rows written and the export throughput.
+        """
+
+        return await self._run(
+            self._service.export_assets,
+            file_path,
+            export_format=export_format,
+            asset_types=asset_types,
+            departments=departments,
+            statuses=statuses,
+            page_size=page_size,
+        )
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """Get the hit and miss counters of every cache of the service.
+
+        Returns:
+            dict[str, CacheInfo]: A snapshot of each cache, keyed by what it holds.
+        """
+
+        return self._service.cache_info()
+
+    async def close(self) -> None:
+        """Wait for any running storage calls, then close the pool and the service."""
+
+        loop = asyncio.get_running_loop()
+
+        await loop.run_in_executor(
+            None, functools.partial(self._executor.shutdown, wait=True)
+        )
+
+        # Only closed once no storage call can still be using the data store
+        await loop.run_in_executor(None, self._service.close)
@@ -0,0 +1,237 @@
+import csv
+import json
+import time
+
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, TextIO, Union
+
+from otherworld_asset_service.api.ingestion import NDJSON_SUFFIXES
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+from otherworld_asset_service.storage.data_store import AssetDataStore, ManifestRow
+from otherworld_asset_service.utils import logger
+
+
+LOGGER = logger.get_logger()
+
+EXPORT_FORMATS = ("ndjson", "csv", "json")
+
+# The number of rows read from the data store, and formatted, at a time
+EXPORT_PAGE_SIZE = 10_000
+
+# The number of bytes buffered before each write to the export file
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+CSV_HEADER = ("name", "type", "department", "version", "status")
+
+# A manifest entry in the shape load_assets accepts, spaced as json.dumps would. Type
+# and status values are known enum values, so only names and departments are encoded.
+_ENTRY_FORMAT = (
+    '{"asset": {"name": %s, "type": "%s"}, "department": %s, "version": %d, '
+    '"status": "%s"}'
+)
+
+
+@dataclass(slots=True)
+class ExportResult:
+    """The outcome of an export.
+
+    Args:
+        file_path (str): The file written.
+        export_format (str): The format written, one of EXPORT_FORMATS.
+        rows (int): The number of asset versions written.
+        elapsed_seconds (float): The wall clock time spent exporting.
+    """
+
+    file_path: str
+    export_format: str
+    rows: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """float: The export throughput."""
+
+        if not self.elapsed_seconds:
+            return 0.0
+
+        return self.rows / self.elapsed_seconds
+
+
+class _EncodedDepartments(dict):
+    # Encodes each department once, as the same few repeat across every row
+    def __missing__(self, department: str) -> str:
+        encoded = self[department] = json.dumps(department)
+        return encoded
+
+
+def export_format_for(file_path: str) -> str:
+    """Choose the export format from the suffix of a file.
+
+    Args:
+        file_path (str): The file to export to.
+
+    Returns:
+        str: csv for .csv files, ndjson for .ndjson/.jsonl files, and json otherwise.
+    """
+
+    suffix = Path(file_path).suffix.lower()
+
+    if suffix == ".csv":
+        return "csv"
+
+    if suffix in NDJSON_SUFFIXES:
+        return "ndjson"
+
+    return "json"
+
+
+def export_manifest(
+    data_store: AssetDataStore,
+    file_path: str,
+    export_format: Optional[str] = None,
+    asset_types: Optional[Iterable[Union[AssetType, str]]] = None,
+    departments: Optional[Iterable[str]] = None,
+    statuses: Optional[Iterable[Union[VersionStatus, str]]] = None,
+    page_size: int = EXPORT_PAGE_SIZE,
+) -> ExportResult:
+    """Stream every asset version of a data store to a file.
+
+    Rows come from a single joined query, read a page at a time, and are written
+    through a large buffer without building any models, so any size of data store is
+    exported at constant memory. JSON and NDJSON exports hold one entry per version in
+    the shape load_assets accepts, so an export can be loaded straight back in. Assets
+    without any versions are not exported.
+
+    Args:
+        data_store (AssetDataStore): The data store to export.
+        file_path (str): The file to write.
+        export_format (str | None): One of EXPORT_FORMATS, or None to choose from the
+            file suffix.
+        asset_types (Iterable[AssetType | str] | None): Only export the versions of
+            assets of these types, or None for every type.
+        departments (Iterable[str] | None): Only export versions of these departments,
+            or None for every department.
+        statuses (Iterable[VersionStatus | str] | None): Only export versions with
+            these statuses, or None for every status.
+        page_size (int): The number of rows read from the data store at a time.
+
+    Returns:
+        ExportResult: The number of rows written and the export throughput.
+
+    Raises:
+        ValueError: If the format, an asset type or a status is not known, or the page
+            size is less than 1.
+    """
+
+    if page_size < 1:
+        raise ValueError("Page size must be greater than or equal to 1.")
+
+    if export_format is None:
+        export_format = export_format_for(file_path)
+
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(
+            "Unknown export format {}, expected one of {}".format(
+                export_format, ", ".join(EXPORT_FORMATS)
+            )
+        )
+
+    LOGGER.debug("Exporting assets to %s as %s", file_path, export_format)
+
+    start_time = time.perf_counter()
+
+    rows = data_store.iter_manifest_rows(
+        asset_types=asset_types,
+        departments=departments,
+        statuses=statuses,
+        page_size=page_size,
+    )
+    pages = _pages(rows, page_size)
+
+    with Path(file_path).open(
+        "w",
+        encoding="utf-8",
+        buffering=WRITE_BUFFER_SIZE,
+        # The csv module writes its own line endings
+        newline="" if export_format == "csv" else None,
+    ) as file:
+        if export_format == "csv":
+            count = _write_csv(file, pages)
+        elif export_format == "ndjson":
+            count = _write_ndjson(file, pages)
+        else:
+            count = _write_json(file, pages)
+
+    result = ExportResult(
+        str(file_path), export_format, count, time.perf_counter() - start_time
+    )
+
+    LOGGER.info(
+        "Exported %s asset versions to %s (%.0f rows/sec)",
+        result.rows,
+        file_path,
+        result.rows_per_second,
+    )
+
+    return result
+
+
+def _pages(rows: Iterator[ManifestRow], page_size: int) -> Iterator[list[ManifestRow]]:
+    while page := list(islice(rows, page_size)):
+        yield page
+
+
+def _format_entries(
+    page: list[ManifestRow], entry_format: str, departments: _EncodedDepartments
+) -> list[str]:
+    dumps = json.dumps
+
+    return [
+        entry_format
+        % (dumps(name), asset_type, departments[department], version, status)
+        for name, asset_type, department, version, status in page
+    ]
+
+
+def _write_ndjson(file: TextIO, pages: Iterator[list[ManifestRow]]) -> int:
+    departments = _EncodedDepartments()
+    count = 0
+
+    for page in pages:
+        file.writelines(_format_entries(page, _ENTRY_FORMAT + "\n", departments))
+        count += len(page)
+
+    return count
+
+
+def _write_json(file: TextIO, pages: Iterator[list[ManifestRow]]) -> int:
+    departments = _EncodedDepartments()
+    count = 0
+
+    file.write("[\n")
+
+    for page in pages:
+        entries = _format_entries(page, _ENTRY_FORMAT, departments)
+
+        file.write(",\n" if count else "")
+        file.write(",\n".join(entries))
+        count += len(page)
+
+    file.write("\n]\n")
+
+    return count
+
+
+def _write_csv(file: TextIO, pages: Iterator[list[ManifestRow]]) -> int:
+    writer = csv.writer(file)
+    count = 0
+
+    writer.writerow(CSV_HEADER)
+
+    for page in pages:
+        writer.writerows(page)
+        count += len(page)
+
+    return count
@@ -0,0 +1,640 @@
+import asyncio
+import json
+import re
+import time
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from otherworld_asset_service.api.async_service import AsyncOtherWorldAssetService
+from otherworld_asset_service.api.reporting import ImportReport
+from otherworld_asset_service.models.asset import Asset
+from otherworld_asset_service.models.asset_version import AssetVersion
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+from otherworld_asset_service.storage.data_store import AssetKey
+from otherworld_asset_service.storage.pagination import DEFAULT_PAGE_SIZE, Page
+from otherworld_asset_service.utils import logger, metrics
+
+
+LOGGER = logger.get_logger("HTTPService")
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+# The number of seconds an idle keep-alive connection is held open for another request
+DEFAULT_KEEP_ALIVE_TIMEOUT = 60.0
+
+# The largest request line and headers, and the largest request body, in bytes
+MAX_HEAD_SIZE = 64 * 1024
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+# The most items returned per page, and the most keys resolved by a single batch
+MAX_PAGE_SIZE = 10_000
+MAX_BATCH_SIZE = 10_000
+
+JSON_CONTENT_TYPE = "application/json"
+
+REQUEST_DURATION = metrics.REGISTRY.histogram(
+    "otherworld_http_request_duration_seconds",
+    "The latency of HTTP service requests.",
+    labels=("route", "status"),
+)
+
+_REASONS = {
+    200: "OK",
+    201: "Created",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    501: "Not Implemented",
+}
+
+
+class HTTPError(Exception):
+    """An error returned to the client as a JSON response.
+
+    Args:
+        status (int): The HTTP status code of the response.
+        message (str): The reason the request failed.
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+
+        self.status = status
+        self.message = message
+
+
+@dataclass(slots=True)
+class Request:
+    """A single HTTP request read from a connection.
+
+    Args:
+        method (str): The request method, e.g. GET.
+        path (str): The path, still percent-encoded, without the query string.
+        version (str): The HTTP version, e.g. HTTP/1.1.
+        query (dict[str, str]): The query string parameters.
+        headers (dict[str, str]): The headers, keyed by lowercase name.
+        body (bytes): The request body.
+    """
+
+    method: str
+    path: str
+    version: str = "HTTP/1.1"
+    query: dict[str, str] = field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    @property
+    def keep_alive(self) -> bool:
+        """bool: Whether the client asked to reuse the connection."""
+
+        connection = self.headers.get("connection", "").lower()
+
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+
+        return connection != "close"
+
+    def json(self) -> Any:
+        """Decode the body as JSON.
+
+        Returns:
+            Any: The decoded body.
+
+        Raises:
+            HTTPError: If the body is not valid JSON.
+        """
+
+        try:
+            return json.loads(self.body)
+        except ValueError as error:
+            raise HTTPError(400, "Invalid JSON body: {}".format(error)) from error
+
+
+@dataclass(slots=True)
+class Response:
+    """A JSON response to a request.
+
+    Args:
+        status (int): The HTTP status code.
+        body (Any): The JSON serializable body.
+    """
+
+    status: int
+    body: Any
+
+
+Handler = Callable[..., Awaitable[Response]]
+
+
+def asset_to_json(asset: Asset) -> dict[str, Any]:
+    """Convert an asset to its JSON representation.
+
+    Args:
+        asset (Asset): The asset to convert.
+
+    Returns:
+        dict[str, Any]: The id, name and type of the asset.
+    """
+
+    return {"id": asset.id, "name": asset.name, "type": asset.asset_type.value}
+
+
+def asset_version_to_json(asset_version: AssetVersion) -> dict[str, Any]:
+    """Convert an asset version to its JSON representation.
+
+    Args:
+        asset_version (AssetVersion): The asset version to convert.
+
+    Returns:
+        dict[str, Any]: The asset id, department, version and status of the version.
+    """
+
+    return {
+        "asset": asset_version.asset,
+        "department": asset_version.department,
+        "version": asset_version.version,
+        "status": asset_version.status.value,
+    }
+
+
+class AssetHTTPService:
+    """A long-running HTTP front-end for AsyncOtherWorldAssetService.
+
+    Requests and responses are JSON, served with only the standard library on a single
+    asyncio event loop. Connections are kept alive between requests, so clients such as
+    farm jobs pay for the interpreter and data store only once, within the service.
+
+    Routes:
+        GET /health: Check the service is running.
+        GET /assets: List a page of assets, with page_token and page_size parameters.
+        POST /assets: Add an asset from a {"name", "type"} body.
+        POST /assets/batch: Resolve many assets at once from a {"keys": [...]} body,
+            where each key is a name or a [name, type] pair. Pass "versions": true to
+            also list the versions of every asset found.
+        GET /assets/{name}: Get an asset.
+        GET /assets/{name}/versions: List a page of the versions of an asset.
+        POST /assets/{name}/versions: Add a version from a {"department", "status"}
+            body, with an optional "version".
+        GET /assets/{name}/versions/{version}: Get a single version of an asset.
+
+    Args:
+        service (AsyncOtherWorldAssetService): The service to serve.
+        host (str): The address to listen on, the local machine by default.
+        port (int): The port to listen on, or 0 to pick a free port.
+        keep_alive_timeout (float): The number of seconds an idle connection is held
+            open for another request.
+    """
+
+    def __init__(
+        self,
+        service: AsyncOtherWorldAssetService,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        keep_alive_timeout: float = DEFAULT_KEEP_ALIVE_TIMEOUT,
+    ):
+        self._service = service
+        self._host = host
+        self._port = port
+        self._keep_alive_timeout = keep_alive_timeout
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+        # Routes are matched in order against the method and the encoded path, so names
+        # holding a slash are still captured whole
+        self._routes: list[tuple[str, re.Pattern, str, Handler]] = [
+            ("GET", re.compile(r"/health"), "health", self._health),
+            ("GET", re.compile(r"/assets"), "list_assets", self._list_assets),
+            ("POST", re.compile(r"/assets"), "add_asset", self._add_asset),
+            ("POST", re.compile(r"/assets/batch"), "get_assets", self._get_assets),
+            ("GET", re.compile(r"/assets/([^/]+)"), "get_asset", self._get_asset),
+            (
+                "GET",
+                re.compile(r"/assets/([^/]+)/versions"),
+                "list_asset_versions",
+                self._list_asset_versions,
+            ),
+            (
+                "POST",
+                re.compile(r"/assets/([^/]+)/versions"),
+                "add_asset_version",
+                self._add_asset_version,
+            ),
+            (
+                "GET",
+                re.compile(r"/assets/([^/]+)/versions/([^/]+)"),
+                "get_asset_version",
+                self._get_asset_version,
+            ),
+        ]
+
+    async def __aenter__(self) -> "AssetHTTPService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    @property
+    def port(self) -> int:
+        """int: The port the service is listening on, once started."""
+
+        if self._server is None or not self._server.sockets:
+            return self._port
+
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self) -> None:
+        """Start listening for connections."""
+
+        self._server = await asyncio.start_server(
+            self._handle_connection, self._host, self._port, limit=MAX_HEAD_SIZE
+        )
+
+        LOGGER.info("Serving assets on http://%s:%s", self._host, self.port)
+
+    async def serve_forever(self) -> None:
+        """Start listening if needed, and serve until cancelled."""
+
+        if self._server is None:
+            await self.start()
+
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening and close every open connection."""
+
+        if self._server is None:
+            return
+
+        self._server.close()
+
+        # Idle keep-alive connections would otherwise hold the server open
+        for writer in list(self._writers):
+            writer.close()
+
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._writers.add(writer)
+
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(
+                        self._read_request(reader), self._keep_alive_timeout
+                    )
+                except HTTPError as error:
+                    # The rest of the request cannot be found, so the connection is
+                    # closed after reporting the error
+                    await self._write_response(
+                        writer, Response(error.status, {"error": error.message}), False
+                    )
+                    break
+
+                if request is None:
+                    break
+
+                response = await self._dispatch(request)
+
+                await self._write_response(writer, response, request.keep_alive)
+
+                if not request.keep_alive:
+                    break
+        except (asyncio.TimeoutError, ConnectionError):
+            # The client went idle or disconnected
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Request]:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as error:
+            if error.partial.strip():
+                raise HTTPError(400, "Incomplete request") from error
+
+            # The client closed the connection between requests
+            return None
+        except asyncio.LimitOverrunError as error:
+            raise HTTPError(431, "Request headers are too large") from error
+
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+
+        try:
+            method, target, version = request_line.split(" ")
+        except ValueError as error:
+            raise HTTPError(400, "Malformed request line") from error
+
+        headers = {}
+
+        for header_line in header_lines:
+            if header_line:
+                name, _, value = header_line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HTTPError(501, "Chunked request bodies are not supported")
+
+        try:
+            content_length = int(headers.get("content-length", 0))
+        except ValueError as error:
+            raise HTTPError(400, "Invalid Content-Length") from error
+
+        if content_length > MAX_BODY_SIZE:
+            raise HTTPError(
+                413, "Request bodies are limited to {} bytes".format(MAX_BODY_SIZE)
+            )
+
+        body = await reader.readexactly(content_length) if content_length else b""
+        url = urlsplit(target)
+
+        return Request(
+            method, url.path, version, dict(parse_qsl(url.query)), headers, body
+        )
+
+    async def _write_response(
+        self, writer: asyncio.StreamWriter, response: Response, keep_alive: bool
+    ) -> None:
+        body = json.dumps(response.body, separators=(",", ":")).encode("utf-8")
+        head = (
+            "HTTP/1.1 {} {}\r\n"
+            "Content-Type: {}\r\n"
+            "Content-Length: {}\r\n"
+            "Connection: {}\r\n"
+            "\r\n"
+        ).format(
+            response.status,
+            _REASONS.get(response.status, ""),
+            JSON_CONTENT_TYPE,
+            len(body),
+            "keep-alive" if keep_alive else "close",
+        )
+
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def _dispatch(self, request: Request) -> Response:
+        start_time = time.perf_counter()
+        route = "unknown"
+
+        try:
+            handler, route, arguments = self._route(request)
+            response = await handler(request, *arguments)
+        except HTTPError as error:
+            response = Response(error.status, {"error": error.message})
+        except Exception:
+            LOGGER.exception("Failed to handle %s %s", request.method, request.path)
+            response = Response(500, {"error": "Internal server error"})
+
+        REQUEST_DURATION.labels(route, str(response.status)).observe(
+            time.perf_counter() - start_time
+        )
+
+        return response
+
+    def _route(self, request: Request) -> tuple[Handler, str, tuple[str, ...]]:
+        path = request.path.rstrip("/") or "/"
+        allowed = False
+
+        for method, pattern, route, handler in self._routes:
+            match = pattern.fullmatch(path)
+
+            if match is None:
+                continue
+
+            if method == request.method:
+                return handler, route, tuple(map(unquote, match.groups()))
+
+            allowed = True
+
+        if allowed:
+            raise HTTPError(405, "{} is not allowed on {}".format(request.method, path))
+
+        raise HTTPError(404, "No route for {}".format(path))
+
+    async def _health(self, _: Request) -> Response:
+        return Response(200, {"status": "ok"})
+
+    async def _list_assets(self, request: Request) -> Response:
+        page_token, page_size = _page_parameters(request)
+
+        try:
+            page = await self._service.list_assets_page(page_token, page_size)
+        except ValueError as error:
+            raise HTTPError(400, str(error)) from error
+
+        return Response(200, _page_to_json(page, asset_to_json))
+
+    async def _add_asset(self, request: Request) -> Response:
+        body = _json_object(request)
+        asset = Asset(body.get("name"), _enum(AssetType, body.get("type"), "type"))
+
+        report = ImportReport()
+        added_asset = await self._service.add_asset(asset, report=report)
+
+        if report.invalid:
+            return Response(422, _rejected_to_json(report))
+
+        return Response(
+            201 if report.added else 200,
+            {
+                "status": "added" if report.added else "duplicate",
+                "asset": asset_to_json(added_asset),
+            },
+        )
+
+    async def _get_assets(self, request: Request) -> Response:
+        body = _json_object(request)
+        keys = body.get("keys")
+
+        if not isinstance(keys, list):
+            raise HTTPError(400, "keys must be a list of names or [name, type] pairs")
+
+        if len(keys) > MAX_BATCH_SIZE:
+            raise HTTPError(
+                413, "Batches are limited to {} keys".format(MAX_BATCH_SIZE)
+            )
+
+        asset_keys = [_asset_key(key) for key in keys]
+        assets = await self._service.get_assets(asset_keys)
+
+        results = [
+            {"key": key, "asset": None if asset is None else asset_to_json(asset)}
+            for key, asset in zip(keys, map(assets.get, asset_keys))
+        ]
+
+        if body.get("versions"):
+            # Every version is listed by a single query, rather than one per asset
+            asset_versions = await self._service.list_asset_versions_for(
+                {asset.id for asset in assets.values()}
+            )
+
+            for result, asset in zip(results, map(assets.get, asset_keys)):
+                if asset is not None:
+                    result["versions"] = [
+                        asset_version_to_json(asset_version)
+                        for asset_version in asset_versions[asset.id]
+                    ]
+
+        return Response(200, {"results": results})
+
+    async def _get_asset(self, _: Request, asset_name: str) -> Response:
+        asset = await self._require_asset(asset_name)
+
+        return Response(200, asset_to_json(asset))
+
+    async def _list_asset_versions(self, request: Request, asset_name: str) -> Response:
+        page_token, page_size = _page_parameters(request)
+
+        await self._require_asset(asset_name)
+
+        try:
+            page = await self._service.list_asset_versions_page(
+                asset_name, page_token, page_size
+            )
+        except ValueError as error:
+            raise HTTPError(400, str(error)) from error
+
+        return Response(200, _page_to_json(page, asset_version_to_json))
+
+    async def _add_asset_version(self, request: Request, asset_name: str) -> Response:
+        body = _json_object(request)
+        asset = await self._require_asset(asset_name)
+
+        asset_version = AssetVersion(
+            asset.id,
+            body.get("department"),
+            version=_version(body.get("version")),
+            status=_enum(VersionStatus, body.get("status"), "status"),
+        )
+
+        report = ImportReport()
+        added_asset_version = await self._service.add_asset_version(
+            asset, asset_version, report=report
+        )
+
+        if added_asset_version is None:
+            return Response(422 if report.invalid else 409, _rejected_to_json(report))
+
+        return Response(201, asset_version_to_json(added_asset_version))
+
+    async def _get_asset_version(
+        self, _: Request, asset_name: str, version: str
+    ) -> Response:
+        try:
+            version_number = int(version)
+        except ValueError as error:
+            raise HTTPError(400, "Invalid version: {}".format(version)) from error
+
+        await self._require_asset(asset_name)
+
+        asset_version = await self._service.get_asset_version(
+            asset_name, version_number
+        )
+
+        if asset_version is None:
+            raise HTTPError(
+                404, "{} has no version {}".format(asset_name, version_number)
+            )
+
+        return Response(200, asset_version_to_json(asset_version))
+
+    async def _require_asset(self, asset_name: str) -> Asset:
+        asset = await self._service.get_asset(asset_name)
+
+        if asset is None:
+            raise HTTPError(404, "No asset named {}".format(asset_name))
+
+        return asset
+
+
+async def serve(
+    service: AsyncOtherWorldAssetService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+) -> None:
+    """Serve an asset service over HTTP until cancelled.
+
+    Args:
+        service (AsyncOtherWorldAssetService): The service to serve.
+        host (str): The address to listen on, the local machine by default.
+        port (int): The port to listen on.
+    """
+
+    async with service, AssetHTTPService(service, host, port) as http_service:
+        await http_service.serve_forever()
+
+
+def _json_object(request: Request) -> dict[str, Any]:
+    body = request.json()
+
+    if not isinstance(body, dict):
+        raise HTTPError(400, "The request body must be a JSON object")
+
+    return body
+
+
+def _enum(enum_type, value: Any, name: str):
+    try:
+        return enum_type(value)
+    except ValueError as error:
+        raise HTTPError(422, "Unknown {}: {}".format(name, value)) from error
+
+
+def _version(value: Any) -> Optional[int]:
+    # bool is a subclass of int, but true is not a version number
+    if value is None or (isinstance(value, int) and not isinstance(value, bool)):
+        return value
+
+    raise HTTPError(422, "Invalid version: {}".format(json.dumps(value)))
+
+
+def _asset_key(key: Any) -> AssetKey:
+    if isinstance(key, str):
+        return key
+
+    if isinstance(key, list) and len(key) == 2 and isinstance(key[0], str):
+        return key[0], _enum(AssetType, key[1], "type")
+
+    raise HTTPError(400, "Invalid key: {}".format(json.dumps(key)))
+
+
+def _page_parameters(request: Request) -> tuple[Optional[str], int]:
+    try:
+        page_size = int(request.query.get("page_size", DEFAULT_PAGE_SIZE))
+    except ValueError as error:
+        raise HTTPError(400, "page_size must be an integer") from error
+
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise HTTPError(400, "page_size must be between 1 and {}".format(MAX_PAGE_SIZE))
+
+    return request.query.get("page_token"), page_size
+
+
+def _page_to_json(page: Page, to_json: Callable[[Any], dict]) -> dict[str, Any]:
+    return {
+        "items": [to_json(item) for item in page.items],
+        "next_page_token": page.next_page_token,
+    }
+
+
+def _rejected_to_json(report: ImportReport) -> dict[str, Any]:
+    return {
+        "status": "invalid" if report.invalid else "duplicate",
+        "errors": [
+            {"field": error.field, "message": error.message}
+            for error in report.error_counts
+        ],
+    }
@@ -0,0 +1,504 @@
+import hashlib
+import json
+import re
+
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
+
+from otherworld_asset_service.api.validation.errors import ValidationError
+from otherworld_asset_service.models.asset import Asset
+from otherworld_asset_service.models.asset_version import AssetVersion
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+
+
+# The number of characters read from a manifest at a time while streaming
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Manifest suffixes holding one JSON entry per line rather than a top-level array
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+# The number of bytes read from a manifest at a time while hashing its content
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_WHITESPACE = re.compile(r"\s*")
+
+# Parsing errors use fixed messages, so they can be counted alongside rule errors
+INVALID_ENTRY_ERROR = ValidationError(
+    field="entry", message="Manifest entry must be a JSON object"
+)
+INVALID_ASSET_ERROR = ValidationError(
+    field="asset", message="Manifest entry asset must be a JSON object"
+)
+UNKNOWN_ASSET_TYPE_ERROR = ValidationError(
+    field="type", message="Asset type must be a known AssetType value"
+)
+UNKNOWN_VERSION_STATUS_ERROR = ValidationError(
+    field="status", message="Asset version status must be a known VersionStatus value"
+)
+
+# The compiled asset and asset version validators of a validation worker process
+_worker_validators: Optional[tuple[Callable, Callable]] = None
+
+
+class RowStatus(Enum):
+    """Represents the outcome of ingesting a single manifest entry."""
+
+    ADDED = "added"
+    DUPLICATE = "duplicate"
+    INVALID = "invalid"
+
+
+@dataclass(slots=True)
+class RowOutcome:
+    """The outcome of ingesting a single manifest entry.
+
+    Args:
+        index (int): The position of the entry within the manifest.
+        status (RowStatus): Whether the entry was added, rejected, or a duplicate.
+        asset_version (AssetVersion | None): The stored asset version, if added.
+        errors (list[ValidationError]): Any errors encountered for the entry.
+    """
+
+    index: int
+    status: RowStatus
+    asset_version: Optional[AssetVersion] = None
+    errors: list[ValidationError] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class BulkLoadResult:
+    """The per-row outcomes and throughput of a bulk load.
+
+    Args:
+        outcomes (list[RowOutcome]): The outcome of every entry, in manifest order.
+        elapsed_seconds (float): The wall clock time spent loading.
+    """
+
+    outcomes: list[RowOutcome] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        """int: The number of entries processed."""
+
+        return len(self.outcomes)
+
+    @property
+    def added(self) -> int:
+        """int: The number of entries stored."""
+
+        return sum(1 for outcome in self.outcomes if outcome.status is RowStatus.ADDED)
+
+    @property
+    def rejected(self) -> int:
+        """int: The number of entries that were not stored."""
+
+        return self.rows - self.added
+
+    @property
+    def rows_per_second(self) -> float:
+        """float: The ingestion throughput."""
+
+        if not self.elapsed_seconds:
+            return 0.0
+
+        return self.rows / self.elapsed_seconds
+
+
+@dataclass(slots=True)
+class IncrementalLoadResult:
+    """The outcome of an incremental load, which skips anything already imported.
+
+    Args:
+        content_hash (str): The hash of the content of the manifest.
+        file_unchanged (bool): Whether the whole manifest was skipped, as a file with
+            the same content was imported before.
+        unchanged (int): The number of entries skipped, as the same record was
+            imported before.
+        outcomes (list[RowOutcome]): The outcome of every other entry, in manifest
+            order.
+        elapsed_seconds (float): The wall clock time spent loading.
+    """
+
+    content_hash: str
+    file_unchanged: bool = False
+    unchanged: int = 0
+    outcomes: list[RowOutcome] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        """int: The number of entries processed, including unchanged entries."""
+
+        return self.unchanged + len(self.outcomes)
+
+    @property
+    def added(self) -> int:
+        """int: The number of entries stored."""
+
+        return sum(1 for outcome in self.outcomes if outcome.status is RowStatus.ADDED)
+
+    @property
+    def rejected(self) -> int:
+        """int: The number of changed entries that were not stored."""
+
+        return len(self.outcomes) - self.added
+
+    @property
+    def rows_per_second(self) -> float:
+        """float: The ingestion throughput, including unchanged entries."""
+
+        if not self.elapsed_seconds:
+            return 0.0
+
+        return self.rows / self.elapsed_seconds
+
+
+@dataclass(slots=True)
+class ValidatedBatch:
+    """A batch of manifest entries that has been parsed and validated, ready to write.
+
+    Args:
+        outcomes (list[RowOutcome]): The outcome of every entry. Valid entries remain
+            marked as invalid until written.
+        entries (list[tuple[int, Asset, AssetVersion]]): The position within outcomes,
+            asset, and asset version of every valid entry.
+    """
+
+    outcomes: list[RowOutcome] = field(default_factory=list)
+    entries: list[tuple[int, Asset, AssetVersion]] = field(default_factory=list)
+
+
+def parse_asset_entry(
+    entry: Any,
+) -> tuple[Optional[Asset], Optional[AssetVersion], list[ValidationError]]:
+    """Parse a single manifest entry into an asset and asset version.
+
+    The asset version is not yet associated with an asset id since the asset may not
+    have been stored.
+
+    Args:
+        entry (Any): A decoded manifest entry, in the shape accepted by load_assets
+            when valid.
+
+    Returns:
+        tuple[Asset | None, AssetVersion | None, list[ValidationError]]: The parsed
+            asset and asset version, and any errors encountered while parsing.
+    """
+
+    parsing_errors: list[ValidationError] = []
+
+    # Manifests may hold any JSON value, which is rejected rather than aborting a load
+    if not isinstance(entry, dict):
+        return None, None, [INVALID_ENTRY_ERROR]
+
+    asset_data = entry.get("asset") or {}
+
+    if not isinstance(asset_data, dict):
+        return None, None, [INVALID_ASSET_ERROR]
+
+    try:
+        asset_type = AssetType(asset_data.get("type"))
+    except ValueError:
+        parsing_errors.append(UNKNOWN_ASSET_TYPE_ERROR)
+        asset_type = None
+
+    try:
+        version_status = VersionStatus(entry.get("status"))
+    except ValueError:
+        parsing_errors.append(UNKNOWN_VERSION_STATUS_ERROR)
+        version_status = None
+
+    if parsing_errors:
+        return None, None, parsing_errors
+
+    asset = Asset(asset_data.get("name"), asset_type)
+    asset_version = AssetVersion(
+        None,
+        entry.get("department"),
+        version=entry.get("version"),
+        status=version_status,
+    )
+
+    return asset, asset_version, parsing_errors
+
+
+def hash_file(file_path: str) -> str:
+    """Hash the content of a manifest, to recognize a file that was imported before.
+
+    Args:
+        file_path (str): The manifest file path.
+
+    Returns:
+        str: The hex digest of the content of the file.
+    """
+
+    digest = hashlib.blake2b()
+
+    with Path(file_path).open("rb") as file:
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def fingerprint_records(records: Iterable[bytes]) -> list[int]:
+    """Fingerprint the text of manifest records, to recognize a previous import of them.
+
+    Fingerprints are 64-bit to be stored compactly, which keeps the chance of any
+    collision across many millions of records negligible.
+
+    Args:
+        records (Iterable[bytes]): Records yielded by iter_manifest_records.
+
+    Returns:
+        list[int]: The signed 64-bit fingerprint of each record, in order.
+    """
+
+    blake2b = hashlib.blake2b
+    from_bytes = int.from_bytes
+
+    return [
+        from_bytes(blake2b(record, digest_size=8).digest(), "big", signed=True)
+        for record in records
+    ]
+
+
+def iter_json_entries(
+    file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Any]:
+    """Stream the entries of a top-level JSON array one at a time.
+
+    The file is read in chunks and each entry is decoded as soon as it is complete, so
+    only the entry being decoded is held in memory rather than the whole manifest.
+
+    Args:
+        file_path (str): The JSON file path.
+        chunk_size (int): The number of characters read from the file at a time.
+
+    Yields:
+        Any: Each entry of the array, in file order.
+
+    Raises:
+        ValueError: If the file is not a well-formed top-level JSON array.
+    """
+
+    decoder = json.JSONDecoder()
+
+    with Path(file_path).open(encoding="utf-8") as file:
+        buffer = ""
+        position = 0
+        at_end_of_file = False
+        started = False
+        expecting_entry = True
+
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+
+            if position == len(buffer):
+                if at_end_of_file:
+                    raise ValueError(
+                        "Unexpected end of JSON manifest {}".format(file_path)
+                    )
+
+                # Drop everything already consumed so the buffer stays bounded by the
+                # size of a single entry
+                chunk = file.read(chunk_size)
+                at_end_of_file = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+
+            character = buffer[position]
+
+            if not started:
+                if character != "[":
+                    raise ValueError(
+                        "JSON manifest {} must contain a top-level array".format(
+                            file_path
+                        )
+                    )
+
+                started = True
+                position += 1
+            elif expecting_entry:
+                if character == "]":
+                    return
+
+                try:
+                    entry, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if at_end_of_file:
+                        raise
+
+                    end = None
+
+                # An entry reaching the end of the buffer may have been cut off mid-way,
+                # so read more before trusting it
+                if end is None or (end == len(buffer) and not at_end_of_file):
+                    chunk = file.read(chunk_size)
+                    at_end_of_file = not chunk
+                    buffer = buffer[position:] + chunk
+                    position = 0
+                    continue
+
+                yield entry
+
+                position = end
+                expecting_entry = False
+            elif character == ",":
+                position += 1
+                expecting_entry = True
+            elif character == "]":
+                return
+            else:
+                raise ValueError(
+                    "Expected ',' or ']' in JSON manifest {} but found {!r}".format(
+                        file_path, character
+                    )
+                )
+
+
+def iter_ndjson_entries(file_path: str) -> Iterator[Any]:
+    """Stream the entries of a newline-delimited JSON file one at a time.
+
+    Blank lines are skipped.
+
+    Args:
+        file_path (str): The NDJSON file path.
+
+    Yields:
+        Any: Each entry of the file, in file order.
+    """
+
+    with Path(file_path).open(encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+
+            if line:
+                yield json.loads(line)
+
+
+def iter_manifest_entries(file_path: str) -> Iterator[Any]:
+    """Stream the entries of a manifest, choosing the format from its suffix.
+
+    Files ending in .ndjson or .jsonl are read as newline-delimited JSON and everything
+    else is read as a top-level JSON array.
+
+    Args:
+        file_path (str): The manifest file path.
+
+    Returns:
+        Iterator[Any]: A generator over each entry of the manifest, in file order.
+    """
+
+    if Path(file_path).suffix.lower() in NDJSON_SUFFIXES:
+        return iter_ndjson_entries(file_path)
+
+    return iter_json_entries(file_path)
+
+
+def iter_manifest_records(file_path: str) -> Iterator[bytes]:
+    """Stream the JSON text of each entry of a manifest, to be fingerprinted.
+
+    NDJSON records are the stripped lines of the file, so they are never decoded. The
+    entries of a JSON array must be decoded to find where each ends, so every entry is
+    decoded by iter_json_entries and encoded back as json.dumps would. Either way an
+    entry written by json.dumps yields the same record from both formats.
+
+    Args:
+        file_path (str): The manifest file path.
+
+    Yields:
+        bytes: The UTF-8 JSON text of each entry, in file order.
+    """
+
+    if Path(file_path).suffix.lower() in NDJSON_SUFFIXES:
+        with Path(file_path).open("rb") as file:
+            for line in file:
+                line = line.strip()
+
+                if line:
+                    yield line
+    else:
+        for entry in iter_json_entries(file_path):
+            yield json.dumps(entry).encode("utf-8")
+
+
+def validate_batch(
+    batch: Iterable[dict[str, Any]],
+    offset: int,
+    validate_asset: Callable[[Asset], Sequence[ValidationError]],
+    validate_asset_version: Callable[[AssetVersion], Sequence[ValidationError]],
+) -> ValidatedBatch:
+    """Parse and validate a batch of manifest entries.
+
+    Args:
+        batch (Iterable[dict[str, Any]]): The manifest entries to validate.
+        offset (int): The manifest index of the first entry within the batch.
+        validate_asset (Callable): The validator for assets.
+        validate_asset_version (Callable): The validator for asset versions.
+
+    Returns:
+        ValidatedBatch: The outcome of every entry and the valid entries to write.
+    """
+
+    validated_batch = ValidatedBatch()
+
+    for index, asset_entry in enumerate(batch, start=offset):
+        asset, asset_version, validation_errors = parse_asset_entry(asset_entry)
+
+        if not validation_errors:
+            validation_errors = [
+                *validate_asset(asset),
+                *validate_asset_version(asset_version),
+            ]
+
+        if not validation_errors:
+            validated_batch.entries.append(
+                (len(validated_batch.outcomes), asset, asset_version)
+            )
+
+        validated_batch.outcomes.append(
+            RowOutcome(index, RowStatus.INVALID, errors=validation_errors)
+        )
+
+    return validated_batch
+
+
+def initialize_validation_worker(asset_pipeline, asset_version_pipeline) -> None:
+    """Compile the validation pipelines of a validation worker process.
+
+    Used as the initializer of a process pool, so pipelines are sent to each worker
+    once rather than with every batch.
+
+    Args:
+        asset_pipeline (ValidationPipeline[Asset]): The pipeline validating assets.
+        asset_version_pipeline (ValidationPipeline[AssetVersion]): The pipeline
+            validating asset versions.
+    """
+
+    global _worker_validators
+
+    _worker_validators = (asset_pipeline.compile(), asset_version_pipeline.compile())
+
+
+def validate_batch_in_worker(
+    batch: list[dict[str, Any]], offset: int
+) -> ValidatedBatch:
+    """Parse and validate a batch of manifest entries within a validation worker.
+
+    Args:
+        batch (list[dict[str, Any]]): The manifest entries to validate.
+        offset (int): The manifest index of the first entry within the batch.
+
+    Returns:
+        ValidatedBatch: The outcome of every entry and the valid entries to write.
+    """
+
+    if _worker_validators is None:
+        raise RuntimeError("The validation worker has not been initialized.")
+
+    return validate_batch(batch, offset, *_worker_validators)
@@ -0,0 +1,177 @@
+import json
+import threading
+
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+from otherworld_asset_service.api.ingestion import RowOutcome, RowStatus
+from otherworld_asset_service.api.validation.errors import ValidationError
+
+
+# The number of rejected entries kept as examples by an import report
+DEFAULT_MAX_EXAMPLES = 10
+
+
+@dataclass(slots=True)
+class RejectedEntry:
+    """An example of an entry that was not stored.
+
+    Args:
+        index (int): The position of the entry within the import.
+        status (RowStatus): Whether the entry was rejected or a duplicate.
+        errors (list[ValidationError]): The errors encountered for the entry.
+        entry (Any): The manifest entry, if the entry came from a manifest.
+    """
+
+    index: int
+    status: RowStatus
+    errors: list[ValidationError] = field(default_factory=list)
+    entry: Any = None
+
+
+class ImportReport:
+    """An aggregated account of the entries stored and rejected by an import.
+
+    Rather than logging every error, errors are counted by field and message, and only
+    a bounded sample of rejected entries is kept. Every rejected entry can optionally be
+    streamed to an NDJSON reject file, one JSON object per line holding its index,
+    status, errors and manifest entry, ready to be fixed and loaded again.
+
+    A report is thread-safe, so a single report can collect the outcomes of concurrent
+    writes. Close it, or use it as a context manager, to flush the reject file.
+
+    Args:
+        max_examples (int): The number of rejected entries kept as examples.
+        reject_file_path (str | None): The NDJSON file rejected entries are written to,
+            or None to not write them.
+    """
+
+    def __init__(
+        self,
+        max_examples: int = DEFAULT_MAX_EXAMPLES,
+        reject_file_path: Optional[str] = None,
+    ) -> None:
+        if max_examples < 0:
+            raise ValueError("Max examples must be greater than or equal to 0.")
+
+        self.max_examples = max_examples
+        self.rows = 0
+        self.added = 0
+        self.duplicates = 0
+        self.invalid = 0
+        self.error_counts: Counter[ValidationError] = Counter()
+        self.examples: list[RejectedEntry] = []
+
+        self._lock = threading.Lock()
+        self._reject_file: Optional[TextIO] = None
+
+        if reject_file_path is not None:
+            self._reject_file = Path(reject_file_path).open("w", encoding="utf-8")
+
+    def __enter__(self) -> "ImportReport":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @property
+    def rejected(self) -> int:
+        """int: The number of entries that were not stored."""
+
+        return self.duplicates + self.invalid
+
+    def record(self, outcome: RowOutcome, entry: Any = None) -> None:
+        """Add the outcome of a single entry to the report.
+
+        Args:
+            outcome (RowOutcome): The outcome of the entry.
+            entry (Any): The manifest entry, if the entry came from a manifest.
+        """
+
+        with self._lock:
+            self.rows += 1
+
+            if outcome.status is RowStatus.ADDED:
+                self.added += 1
+                return
+
+            if outcome.status is RowStatus.DUPLICATE:
+                self.duplicates += 1
+            else:
+                self.invalid += 1
+
+            self.error_counts.update(outcome.errors)
+
+            if len(self.examples) < self.max_examples:
+                self.examples.append(
+                    RejectedEntry(
+                        outcome.index, outcome.status, list(outcome.errors), entry
+                    )
+                )
+
+            if self._reject_file is not None:
+                self._write_rejected_entry(outcome, entry)
+
+    def most_common_errors(
+        self, limit: Optional[int] = None
+    ) -> list[tuple[ValidationError, int]]:
+        """Get the errors encountered most often.
+
+        Args:
+            limit (int | None): The most errors returned, or None for every error.
+
+        Returns:
+            list[tuple[ValidationError, int]]: Each error and its count, most common
+                first.
+        """
+
+        with self._lock:
+            return self.error_counts.most_common(limit)
+
+    def summary(self, limit: Optional[int] = DEFAULT_MAX_EXAMPLES) -> str:
+        """Format the totals of the report and its most common errors.
+
+        Args:
+            limit (int | None): The most errors listed, or None for every error.
+
+        Returns:
+            str: The multi-line summary.
+        """
+
+        lines = [
+            "Added {} of {} entries ({} invalid, {} duplicates)".format(
+                self.added, self.rows, self.invalid, self.duplicates
+            )
+        ]
+
+        for error, count in self.most_common_errors(limit):
+            lines.append("  {:>8}  {}: {}".format(count, error.field, error.message))
+
+        return "\n".join(lines)
+
+    def close(self) -> None:
+        """Flush and close the reject file, if any."""
+
+        with self._lock:
+            if self._reject_file is not None:
+                self._reject_file.close()
+                self._reject_file = None
+
+    def _write_rejected_entry(self, outcome: RowOutcome, entry: Any) -> None:
+        self._reject_file.write(
+            json.dumps(
+                {
+                    "index": outcome.index,
+                    "status": outcome.status.value,
+                    "errors": [
+                        {"field": error.field, "message": error.message}
+                        for error in outcome.errors
+                    ],
+                    "entry": entry,
+                },
+                default=str,
+            )
+        )
+        self._reject_file.write("\n")
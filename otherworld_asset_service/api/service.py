@@ -1,168 +1,648 @@
 import json
+import os
+import pickle
 import sqlite3
+import time
 
-from pathlib import Path
-from typing import Optional
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import replace
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional, Sequence, Union
 
+from otherworld_asset_service.api.export import (
+    EXPORT_PAGE_SIZE,
+    ExportResult,
+    export_manifest,
+)
+from otherworld_asset_service.api.ingestion import (
+    BulkLoadResult,
+    IncrementalLoadResult,
+    RowOutcome,
+    RowStatus,
+    ValidatedBatch,
+    fingerprint_records,
+    hash_file,
+    initialize_validation_worker,
+    iter_manifest_entries,
+    iter_manifest_records,
+    parse_asset_entry,
+    validate_batch,
+    validate_batch_in_worker,
+)
+from otherworld_asset_service.api.reporting import ImportReport
+from otherworld_asset_service.api.validation.errors import ValidationError
 from otherworld_asset_service.models.asset import Asset
 from otherworld_asset_service.models.asset_version import AssetVersion
 from otherworld_asset_service.models.enums import AssetType, VersionStatus
+from otherworld_asset_service.storage.connection_manager import DEFAULT_BUSY_TIMEOUT
+from otherworld_asset_service.storage.data_store import AssetDataStore, AssetKey
+from otherworld_asset_service.storage.pagination import DEFAULT_PAGE_SIZE, Page
 from otherworld_asset_service.storage.sqlite_database import SQLiteDatabase
-from otherworld_asset_service.utils import logger
+from otherworld_asset_service.utils import logger, metrics
+from otherworld_asset_service.utils.cache import CacheInfo, LRUCache
 
 
 LOGGER = logger.get_logger()
 
+# The number of manifest entries validated and written per transaction in bulk loads
+DEFAULT_BATCH_SIZE = 1000
+
+# The number of assets, and of per-asset version lists, kept in memory for lookups
+DEFAULT_CACHE_SIZE = 4096
+
+CALL_DURATION = metrics.REGISTRY.histogram(
+    "otherworld_service_call_duration_seconds",
+    "The latency of OtherWorldAssetService calls.",
+    labels=("method",),
+)
+CALL_ERRORS = metrics.REGISTRY.counter(
+    "otherworld_service_call_errors_total",
+    "The number of OtherWorldAssetService calls raising an exception.",
+    labels=("method",),
+)
+INGESTED_ROWS = metrics.REGISTRY.counter(
+    "otherworld_ingested_rows_total",
+    "The number of manifest entries loaded, by outcome.",
+    labels=("status",),
+)
+
+# Records the latency and errors of each call, labelled with the method name
+_timed = metrics.timed(CALL_DURATION, CALL_ERRORS)
+
 
 class OtherWorldAssetService:
-    """The main API and entry point for interacting with assets and asset versions."""
+    """The main API and entry point for interacting with assets and asset versions.
+
+    Assets looked up by name, and the version lists of assets, are cached in memory and
+    invalidated whenever the service writes to them. Writes made to the data store from
+    outside the service are not seen until the entry is evicted or the cache is cleared.
 
-    def __init__(self, data_store_path, asset_pipeline, asset_version_pipeline):
-        self._data_store = SQLiteDatabase(data_store_path)
+    Args:
+        data_store_path (str): The location of the SQLite data store.
+        asset_pipeline (ValidationPipeline[Asset]): The pipeline validating assets.
+        asset_version_pipeline (ValidationPipeline[AssetVersion]): The pipeline
+            validating asset versions.
+        cache_size (int): The number of entries held by each cache. A size of 0
+            disables caching.
+        busy_timeout (int): The number of milliseconds to wait on a data store locked
+            by another process.
+        data_store (AssetDataStore | None): The data store to use, such as an
+            ArrayDatabase, or None to open a SQLiteDatabase at data_store_path.
+    """
+
+    def __init__(
+        self,
+        data_store_path,
+        asset_pipeline,
+        asset_version_pipeline,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        busy_timeout: int = DEFAULT_BUSY_TIMEOUT,
+        data_store: Optional[AssetDataStore] = None,
+    ):
+        if data_store is None:
+            data_store = SQLiteDatabase(data_store_path, busy_timeout=busy_timeout)
+
+        self._data_store = data_store
         self._asset_pipeline = asset_pipeline
         self._asset_version_pipeline = asset_version_pipeline
 
-    def load_assets(self, file_path: str):
+        # Fuse the rules of each pipeline once rather than on every validation
+        self._validate_asset = asset_pipeline.compile()
+        self._validate_asset_version = asset_version_pipeline.compile()
+
+        self._asset_cache: LRUCache[str, Asset] = LRUCache(cache_size)
+        self._asset_versions_cache: LRUCache[int, list[AssetVersion]] = LRUCache(
+            cache_size
+        )
+
+        # Cache and validation stats are read on demand, only when metrics are exported
+        metrics.REGISTRY.register_collector(self._collect_metrics)
+
+    @_timed
+    def load_assets(
+        self, file_path: str, report: Optional[ImportReport] = None
+    ) -> ImportReport:
         """Load all assets from a file.
 
-        NOTE: This method assumes a JSON file with a flat structure.
+        Entries are streamed from the file one at a time, so memory use does not grow
+        with the size of the manifest. Entries whose asset already exists add a new
+        version to it. Rejected entries are aggregated within the report rather than
+        logged one at a time.
+
+        NOTE: This method assumes a JSON array, or NDJSON (.ndjson/.jsonl) file, with a
+        flat structure.
+
+        Args:
+            file_path (str): The JSON or NDJSON file path.
+            report (ImportReport | None): The report collecting the outcome of every
+                entry, or None to collect them within a new report.
+
+        Returns:
+            ImportReport: The report holding the outcome of every entry.
+        """
+
+        if report is None:
+            report = ImportReport()
+
+        LOGGER.debug("Loading assets from %s", file_path)
+
+        for index, asset_entry in enumerate(iter_manifest_entries(file_path)):
+            outcome = self._load_entry(index, asset_entry)
+            report.record(outcome, asset_entry)
+            _INGESTED_ROWS_BY_STATUS[outcome.status].inc()
+
+        LOGGER.info("Loaded assets from %s. %s", file_path, report.summary())
+
+        return report
+
+    def _load_entry(self, index: int, asset_entry: dict[str, Any]) -> RowOutcome:
+        """Add the asset and asset version of a single manifest entry.
 
         Args:
-            file_path (str): The JSON file path.
+            index (int): The position of the entry within the manifest.
+            asset_entry (dict[str, Any]): The manifest entry to load.
+
+        Returns:
+            RowOutcome: The outcome of the entry.
         """
 
-        LOGGER.debug("Loading assets from {}".format(file_path))
+        asset, asset_version, validation_errors = parse_asset_entry(asset_entry)
+
+        if validation_errors:
+            return RowOutcome(index, RowStatus.INVALID, errors=validation_errors)
+
+        # An asset that already exists is returned as a duplicate and versioned as is
+        asset, asset_outcome = self._add_asset(index, asset)
+
+        if asset is None:
+            return asset_outcome
+
+        asset_version.asset = asset.id
+
+        return self._add_asset_version(index, asset, asset_version)
+
+    @_timed
+    def load_assets_bulk(
+        self,
+        file_path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        report: Optional[ImportReport] = None,
+    ) -> BulkLoadResult:
+        """Load all assets from a file, writing each batch in a single transaction.
+
+        Entries are streamed from the file and each batch of entries is validated as a
+        whole before any valid entries are written together. Unlike load_assets, an
+        outcome is reported for every entry.
+
+        NOTE: This method assumes a JSON array, or NDJSON (.ndjson/.jsonl) file, with a
+        flat structure.
+
+        Args:
+            file_path (str): The JSON or NDJSON file path.
+            batch_size (int): The number of entries validated and written per
+                transaction.
+            report (ImportReport | None): The report to also collect the outcome of
+                every entry within, if any.
+
+        Returns:
+            BulkLoadResult: The outcome of every entry and the ingestion throughput.
+        """
+
+        if batch_size < 1:
+            raise ValueError("Batch size must be greater than or equal to 1.")
+
+        LOGGER.debug(
+            "Bulk loading assets from %s in batches of %s", file_path, batch_size
+        )
+
+        result = BulkLoadResult()
+        start_time = time.perf_counter()
+
+        entries = iter_manifest_entries(file_path)
+        while batch := list(islice(entries, batch_size)):
+            outcomes = self._load_batch(batch, offset=result.rows)
+            result.outcomes.extend(outcomes)
+            _count_ingested_rows(outcomes)
+
+            if report is not None:
+                _record_batch(report, outcomes, batch)
+
+        result.elapsed_seconds = time.perf_counter() - start_time
+
+        LOGGER.info(
+            "Loaded %s of %s entries from %s in %.2fs (%.0f rows/sec)",
+            result.added,
+            result.rows,
+            file_path,
+            result.elapsed_seconds,
+            result.rows_per_second,
+        )
+
+        return result
+
+    @_timed
+    def load_assets_parallel(
+        self,
+        file_path: str,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_BATCH_SIZE,
+        report: Optional[ImportReport] = None,
+    ) -> BulkLoadResult:
+        """Load all assets from a file, validating chunks in parallel worker processes.
+
+        Entries are streamed from the file in chunks, which worker processes parse,
+        validate, and normalize. The calling process is the single writer and persists
+        each chunk in manifest order, in a single transaction per chunk.
+
+        The validation pipelines are pickled to every worker once, so any custom rules
+        must be picklable, i.e. defined at module level.
+
+        Args:
+            file_path (str): The JSON or NDJSON file path.
+            workers (int | None): The number of worker processes, or None to use every
+                CPU.
+            chunk_size (int): The number of entries validated by a worker at a time and
+                written per transaction.
+            report (ImportReport | None): The report to also collect the outcome of
+                every entry within, if any.
+
+        Returns:
+            BulkLoadResult: The outcome of every entry and the ingestion throughput.
+        """
+
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be greater than or equal to 1.")
+
+        workers = workers or os.cpu_count() or 1
+
+        if workers < 1:
+            raise ValueError("Workers must be greater than or equal to 1.")
+
+        pipelines = (self._asset_pipeline, self._asset_version_pipeline)
+
+        try:
+            pickle.dumps(pipelines)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            raise TypeError(
+                "Validation pipelines must be picklable to validate in worker "
+                "processes. Custom rules must be defined at module level."
+            ) from error
+
+        LOGGER.debug(
+            "Loading assets from %s with %s workers in chunks of %s",
+            file_path,
+            workers,
+            chunk_size,
+        )
 
-        path = Path(file_path)
-        json_data = json.loads(path.read_text())
+        result = BulkLoadResult()
+        start_time = time.perf_counter()
 
-        for asset_entry in json_data:
-            # Parse asset data
-            asset_data = asset_entry.get("asset")
-            asset_name = asset_data.get("name")
-            asset_type = asset_data.get("type")
+        entries = iter_manifest_entries(file_path)
+        offset = 0
 
-            try:
-                # Confirm the asset type exists
-                asset_type = AssetType(asset_type)
-            except ValueError as error:
-                LOGGER.error(error)
-                continue
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=initialize_validation_worker,
+            initargs=pipelines,
+        ) as executor:
+            pending: deque[tuple[list[dict[str, Any]], Future]] = deque()
 
-            asset = self.add_asset(Asset(asset_name, asset_type))
+            def submit_chunks() -> None:
+                nonlocal offset
 
-            # Handle the scenario where the asset could not be added for reasons other
-            # than already existing within the data store. If any errors occurred, check
-            # if the asset already exists and if so, use that.
-            asset = asset or self.get_asset(asset_name)
+                # Keep two chunks per worker in flight so workers are not left idle
+                # while the writer persists, without reading the whole file ahead
+                while len(pending) < workers * 2:
+                    chunk = list(islice(entries, chunk_size))
 
-            if not asset:
-                # Continue to the next entry since adding an asset must contain a name
-                # and type
-                continue
+                    if not chunk:
+                        return
 
-            # Parse asset version data
-            version_department = asset_entry.get("department")
-            version_number = asset_entry.get("version")
-            version_status = asset_entry.get("status")
+                    future = executor.submit(validate_batch_in_worker, chunk, offset)
+                    pending.append((chunk, future))
+                    offset += len(chunk)
 
-            try:
-                # Confirm the status exists
-                version_status = VersionStatus(version_status)
-            except ValueError as error:
-                LOGGER.error(error)
-                continue
+            submit_chunks()
 
-            self.add_asset_version(
-                asset,
-                AssetVersion(
-                    asset.id,
-                    version_department,
-                    version=version_number,
-                    status=version_status,
-                ),
+            while pending:
+                chunk, future = pending.popleft()
+                validated_batch = future.result()
+
+                submit_chunks()
+
+                self._write_batch(validated_batch)
+                result.outcomes.extend(validated_batch.outcomes)
+                _count_ingested_rows(validated_batch.outcomes)
+
+                if report is not None:
+                    _record_batch(report, validated_batch.outcomes, chunk)
+
+        result.elapsed_seconds = time.perf_counter() - start_time
+
+        LOGGER.info(
+            "Loaded %s of %s entries from %s in %.2fs (%.0f rows/sec)",
+            result.added,
+            result.rows,
+            file_path,
+            result.elapsed_seconds,
+            result.rows_per_second,
+        )
+
+        return result
+
+    @_timed
+    def load_assets_incremental(
+        self,
+        file_path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        report: Optional[ImportReport] = None,
+    ) -> IncrementalLoadResult:
+        """Load only what has changed in a manifest since it was last imported.
+
+        A manifest whose content matches a file imported before is skipped without
+        being parsed. Otherwise the JSON text of every entry is fingerprinted, and each
+        batch of fingerprints is looked up at once, so entries imported before are
+        skipped without being validated or written. Unchanged NDJSON entries are not
+        even decoded, while JSON array entries must all be decoded to be split apart.
+        The rest are loaded as with load_assets_bulk, recording their fingerprints in
+        the same transaction.
+
+        An entry is recorded once it is stored or found to already exist, while
+        invalid entries are validated again on every load. A record re-spaced or with
+        its keys reordered counts as changed, and is found to already exist once
+        validated. The manifest itself is recorded once loaded, so re-sending it
+        unchanged costs a single hash of the file.
+
+        Args:
+            file_path (str): The JSON or NDJSON file path.
+            batch_size (int): The number of entries fingerprinted, validated and
+                written at a time.
+            report (ImportReport | None): The report to also collect the outcome of
+                every changed entry within, if any.
+
+        Returns:
+            IncrementalLoadResult: The number of unchanged entries, the outcome of
+                every other entry, and the ingestion throughput.
+        """
+
+        if batch_size < 1:
+            raise ValueError("Batch size must be greater than or equal to 1.")
+
+        start_time = time.perf_counter()
+        result = IncrementalLoadResult(hash_file(file_path))
+
+        if self._data_store.has_imported_file(result.content_hash):
+            result.file_unchanged = True
+            result.elapsed_seconds = time.perf_counter() - start_time
+
+            LOGGER.info("Skipped %s, unchanged since it was imported", file_path)
+
+            return result
+
+        LOGGER.debug(
+            "Incrementally loading assets from %s in batches of %s",
+            file_path,
+            batch_size,
+        )
+
+        records = iter_manifest_records(file_path)
+        offset = 0
+
+        while batch := list(islice(records, batch_size)):
+            fingerprints = fingerprint_records(batch)
+            # Sorted lookups walk the fingerprint index in order, which is faster
+            imported_fingerprints = self._data_store.find_record_fingerprints(
+                sorted(fingerprints)
             )
+            changed_positions = [
+                position
+                for position, fingerprint in enumerate(fingerprints)
+                if fingerprint not in imported_fingerprints
+            ]
+
+            result.unchanged += len(batch) - len(changed_positions)
+
+            if changed_positions:
+                # Only changed records are decoded
+                changed_entries = [
+                    json.loads(batch[position]) for position in changed_positions
+                ]
+                validated_batch = validate_batch(
+                    changed_entries,
+                    offset,
+                    self._validate_asset,
+                    self._validate_asset_version,
+                )
+
+                # Outcomes are indexed by their position within the whole manifest
+                for outcome, position in zip(
+                    validated_batch.outcomes, changed_positions
+                ):
+                    outcome.index = offset + position
+
+                self._write_batch(
+                    validated_batch,
+                    [fingerprints[position] for position in changed_positions],
+                )
+                result.outcomes.extend(validated_batch.outcomes)
+                _count_ingested_rows(validated_batch.outcomes)
+
+                if report is not None:
+                    _record_batch(report, validated_batch.outcomes, changed_entries)
+
+            offset += len(batch)
 
-    def add_asset(self, asset: Asset) -> Optional[Asset]:
+        _UNCHANGED_ROWS.inc(result.unchanged)
+
+        self._data_store.add_imported_file(result.content_hash, file_path, result.rows)
+
+        result.elapsed_seconds = time.perf_counter() - start_time
+
+        LOGGER.info(
+            "Loaded %s of %s entries from %s in %.2fs (%s unchanged, %.0f rows/sec)",
+            result.added,
+            result.rows,
+            file_path,
+            result.elapsed_seconds,
+            result.unchanged,
+            result.rows_per_second,
+        )
+
+        return result
+
+    def _load_batch(
+        self, batch: Iterable[dict[str, Any]], offset: int = 0
+    ) -> list[RowOutcome]:
+        """Validate a batch of manifest entries and write all valid entries at once.
+
+        Args:
+            batch (Iterable[dict[str, Any]]): The manifest entries to load.
+            offset (int): The manifest index of the first entry within the batch.
+
+        Returns:
+            list[RowOutcome]: The outcome of every entry within the batch.
+        """
+
+        validated_batch = validate_batch(
+            batch, offset, self._validate_asset, self._validate_asset_version
+        )
+
+        self._write_batch(validated_batch)
+
+        return validated_batch.outcomes
+
+    def _write_batch(
+        self,
+        validated_batch: ValidatedBatch,
+        fingerprints: Optional[Sequence[int]] = None,
+    ) -> None:
+        """Write all valid entries of a validated batch at once, updating outcomes.
+
+        Args:
+            validated_batch (ValidatedBatch): The validated manifest entries to write.
+            fingerprints (Sequence[int] | None): The fingerprint of every entry of the
+                batch, by position, to record alongside the written entries, if any.
+        """
+
+        results = self._data_store.add_asset_versions_bulk(
+            [
+                (asset, asset_version)
+                for _, asset, asset_version in validated_batch.entries
+            ],
+            fingerprints=(
+                None
+                if fingerprints is None
+                else [
+                    fingerprints[position]
+                    for position, _, _ in validated_batch.entries
+                ]
+            ),
+        )
+
+        for (position, asset, _), result in zip(validated_batch.entries, results):
+            self._invalidate_asset(asset)
+
+            outcome = validated_batch.outcomes[position]
+
+            if isinstance(result, sqlite3.IntegrityError):
+                outcome.status = RowStatus.DUPLICATE
+                outcome.errors.append(
+                    ValidationError(field="version", message=str(result))
+                )
+            else:
+                outcome.status = RowStatus.ADDED
+                outcome.asset_version = result
+
+    @_timed
+    def add_asset(
+        self, asset: Asset, report: Optional[ImportReport] = None
+    ) -> Optional[Asset]:
         """Add an asset to the data store.
 
         Args:
             asset (str): The asset to add.
+            report (ImportReport | None): The report to collect the outcome within, or
+                None to log any errors.
 
         Returns:
-            Asset: The added asset.
+            Asset | None: The added asset, the existing asset if it is a duplicate, or
+                None if the asset is invalid.
         """
 
-        LOGGER.debug(
-            "Adding asset for {} ({})".format(asset.name, asset.asset_type.value)
-        )
+        LOGGER.debug("Adding asset for %s (%s)", asset.name, asset.asset_type.value)
+
+        added_asset, outcome = self._add_asset(_next_index(report), asset)
 
-        validation_errors = self._asset_pipeline.validate(asset)
+        _report_outcome(outcome, report)
+
+        return added_asset
+
+    def _add_asset(
+        self, index: int, asset: Asset
+    ) -> tuple[Optional[Asset], RowOutcome]:
+        validation_errors = self._validate_asset(asset)
 
         if validation_errors:
-            for error in validation_errors:
-                LOGGER.error(error)
-            return
+            return None, RowOutcome(
+                index, RowStatus.INVALID, errors=list(validation_errors)
+            )
 
         try:
-            return self._data_store.add_asset(asset)
+            added_asset = self._data_store.add_asset(asset)
         except sqlite3.IntegrityError as error:
-            LOGGER.error(error)
-
             # Catch the exception when adding an asset that is not unique. If not, check
             # if an asset exists that matches the same name and type.
-            existing_asset = self._data_store.get_asset(asset.name)
+            existing_asset = self._get_asset(asset.name)
 
-            return existing_asset or None
+            return existing_asset, RowOutcome(
+                index,
+                RowStatus.DUPLICATE,
+                errors=[ValidationError(field="name", message=str(error))],
+            )
+
+        self._invalidate_asset(added_asset)
+
+        return added_asset, RowOutcome(index, RowStatus.ADDED)
 
-    def add_asset_version(self, asset: Asset, version: AssetVersion) -> AssetVersion:
+    @_timed
+    def add_asset_version(
+        self,
+        asset: Asset,
+        version: AssetVersion,
+        report: Optional[ImportReport] = None,
+    ) -> Optional[AssetVersion]:
         """Add an asset version to the data store.
 
         Args:
             asset (Asset): The asset to be versioned.
             version (AssetVersion): The version data associated with the asset.
+            report (ImportReport | None): The report to collect the outcome within, or
+                None to log any errors.
 
         Returns:
-            AssetVersion: The added asset version.
+            AssetVersion | None: The added asset version, or None if it was rejected.
         """
 
-        LOGGER.debug(
-            "Adding version for {} ({})".format(asset.name, asset.asset_type.value)
-        )
+        LOGGER.debug("Adding version for %s (%s)", asset.name, asset.asset_type.value)
 
-        validation_errors = self._asset_pipeline.validate(asset)
-        validation_errors.extend(self._asset_version_pipeline.validate(version))
+        outcome = self._add_asset_version(_next_index(report), asset, version)
 
-        if validation_errors:
-            for error in validation_errors:
-                LOGGER.error(error)
-            return
+        _report_outcome(outcome, report)
 
-        try:
-            if not version.version:
-                latest_version = self._data_store.get_last_asset_version_number(
-                    asset.id
-                )
+        return outcome.asset_version
 
-                if latest_version is None:
-                    latest_version = 1
-                else:
-                    latest_version += 1
+    def _add_asset_version(
+        self, index: int, asset: Asset, version: AssetVersion
+    ) -> RowOutcome:
+        validation_errors = [
+            *self._validate_asset(asset),
+            *self._validate_asset_version(version),
+        ]
 
-                version = AssetVersion(
-                    asset.id,
-                    version.department,
-                    version=latest_version,
-                    status=version.status,
-                )
+        if validation_errors:
+            return RowOutcome(index, RowStatus.INVALID, errors=validation_errors)
 
-            return self._data_store.add_asset_version(
+        try:
+            # The data store allocates the next version number atomically for any
+            # version that does not define one
+            added_asset_version = self._data_store.add_asset_version(
                 asset=asset, asset_version=version
             )
         except sqlite3.IntegrityError as error:
             # Catch the exception when adding an asset version that is not unique
-            LOGGER.error(error)
+            return RowOutcome(
+                index,
+                RowStatus.DUPLICATE,
+                errors=[ValidationError(field="version", message=str(error))],
+            )
+
+        self._invalidate_asset(asset)
 
+        return RowOutcome(index, RowStatus.ADDED, asset_version=added_asset_version)
+
+    @_timed
     def list_assets(self) -> list[Asset]:
         """List all assets within the data store.
 
@@ -174,6 +654,40 @@ class OtherWorldAssetService:
 
         return self._data_store.list_assets()
 
+    @_timed
+    def list_assets_page(
+        self, page_token: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Page[Asset]:
+        """List a single page of assets within the data store.
+
+        Args:
+            page_token (str | None): The token of the page to list, taken from the
+                previous page, or None for the first page.
+            page_size (int): The most assets returned within the page.
+
+        Returns:
+            Page[Asset]: The assets within the page and the token of the next page.
+        """
+
+        LOGGER.debug("Listing a page of assets")
+
+        return self._data_store.list_assets_page(page_token, page_size=page_size)
+
+    def iter_assets(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Asset]:
+        """Iterate all assets within the data store at constant memory.
+
+        Args:
+            page_size (int): The number of assets read from the data store at a time.
+
+        Returns:
+            Iterator[Asset]: A generator over every asset, ordered by name and type.
+        """
+
+        LOGGER.debug("Iterating all assets")
+
+        return self._data_store.iter_assets(page_size=page_size)
+
+    @_timed
     def get_asset(self, asset_name: str) -> Asset:
         """Get an asset from the data store.
 
@@ -184,10 +698,58 @@ class OtherWorldAssetService:
             Asset: The asset found matching the provided asset name.
         """
 
-        LOGGER.debug("Getting asset for {}".format(asset_name))
+        LOGGER.debug("Getting asset for %s", asset_name)
 
-        return self._data_store.get_asset(asset_name)
+        return self._get_asset(asset_name)
 
+    @_timed
+    def get_assets(self, keys: Iterable[AssetKey]) -> dict[AssetKey, Asset]:
+        """Get many assets from the data store at once.
+
+        Args:
+            keys (Iterable[str | tuple[str, AssetType]]): The asset names, or asset
+                name and type pairs, to get.
+
+        Returns:
+            dict[str | tuple[str, AssetType], Asset]: The asset found for each key.
+                Keys without a matching asset are omitted.
+        """
+
+        assets: dict[AssetKey, Asset] = {}
+        missing_keys = []
+
+        generations: dict[str, int] = {}
+
+        for key in keys:
+            # Only lookups by name alone are cached
+            asset = None if isinstance(key, tuple) else self._asset_cache.get(key)
+
+            if asset is None:
+                missing_keys.append(key)
+
+                if not isinstance(key, tuple):
+                    generations[key] = self._asset_cache.generation(key)
+            else:
+                # Copy the asset so callers cannot modify the cached entry
+                assets[key] = replace(asset)
+
+        LOGGER.debug(
+            "Getting %s assets (%s cached)",
+            len(assets) + len(missing_keys),
+            len(assets),
+        )
+
+        found_assets = self._data_store.get_assets(missing_keys)
+
+        for key, asset in found_assets.items():
+            if not isinstance(key, tuple):
+                self._asset_cache.put(key, asset, generation=generations[key])
+
+            assets[key] = replace(asset)
+
+        return assets
+
+    @_timed
     def get_asset_version(self, asset_name: str, version: int) -> AssetVersion:
         """Get an asset version from the data store.
 
@@ -199,14 +761,15 @@ class OtherWorldAssetService:
             AssetVersion: The asset version found matching the provided name and number.
         """
 
-        LOGGER.debug("Getting asset version for {}".format(asset_name))
+        LOGGER.debug("Getting asset version for %s", asset_name)
 
-        # Get the asset from the data store to ensure data is current
-        asset = self._data_store.get_asset(name=asset_name)
+        # Get the asset from the cache, which is kept current by every write
+        asset = self._get_asset(asset_name)
 
         # Use the asset id to get the specific asset version
         return self._data_store.get_asset_version(asset_id=asset.id, version=version)
 
+    @_timed
     def list_asset_versions(self, asset_name: str) -> list[AssetVersion]:
         """List all assets versions for an asset.
 
@@ -217,10 +780,320 @@ class OtherWorldAssetService:
             list[AssetVersion]: A list of versions.
         """
 
-        LOGGER.debug("Listing all asset versions for {}".format(asset_name))
+        LOGGER.debug("Listing all asset versions for %s", asset_name)
+
+        # Get the asset from the cache, which is kept current by every write
+        asset = self._get_asset(asset_name)
+
+        asset_versions = self._asset_versions_cache.get(asset.id)
+
+        if asset_versions is None:
+            generation = self._asset_versions_cache.generation(asset.id)
+
+            # Use the asset id to get all asset versions
+            asset_versions = self._data_store.list_asset_versions(asset_id=asset.id)
+            self._asset_versions_cache.put(
+                asset.id, asset_versions, generation=generation
+            )
+
+        return _copy_asset_versions(asset_versions)
+
+    @_timed
+    def list_asset_versions_page(
+        self,
+        asset_name: str,
+        page_token: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[AssetVersion]:
+        """List a single page of asset versions for an asset.
+
+        Args:
+            asset_name (str): The asset name used to find all versions for an asset.
+            page_token (str | None): The token of the page to list, taken from the
+                previous page, or None for the first page.
+            page_size (int): The most asset versions returned within the page.
+
+        Returns:
+            Page[AssetVersion]: The asset versions within the page and the token of the
+                next page.
+        """
+
+        LOGGER.debug("Listing a page of asset versions for %s", asset_name)
+
+        asset = self._get_asset(asset_name)
+
+        return self._data_store.list_asset_versions_page(
+            asset.id, page_token, page_size=page_size
+        )
+
+    def iter_asset_versions(
+        self, asset_name: str, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[AssetVersion]:
+        """Iterate all asset versions for an asset at constant memory.
+
+        Args:
+            asset_name (str): The asset name used to find all versions for an asset.
+            page_size (int): The number of asset versions read from the data store at
+                a time.
+
+        Returns:
+            Iterator[AssetVersion]: A generator over every version of the asset.
+        """
+
+        LOGGER.debug("Iterating all asset versions for %s", asset_name)
+
+        asset = self._get_asset(asset_name)
+
+        return self._data_store.iter_asset_versions(asset.id, page_size=page_size)
+
+    @_timed
+    def list_asset_versions_for(
+        self, asset_ids: Iterable[int]
+    ) -> dict[int, list[AssetVersion]]:
+        """List all asset versions for many assets at once.
+
+        Args:
+            asset_ids (Iterable[int]): The ids of the assets to list versions for.
+
+        Returns:
+            dict[int, list[AssetVersion]]: The asset versions of each asset. Assets
+                without versions map to an empty list.
+        """
+
+        asset_versions: dict[int, list[AssetVersion]] = {}
+        missing_asset_ids = []
+        generations: dict[int, int] = {}
+
+        for asset_id in asset_ids:
+            cached_asset_versions = self._asset_versions_cache.get(asset_id)
+
+            if cached_asset_versions is None:
+                missing_asset_ids.append(asset_id)
+                generations[asset_id] = self._asset_versions_cache.generation(asset_id)
+            else:
+                asset_versions[asset_id] = _copy_asset_versions(cached_asset_versions)
+
+        LOGGER.debug(
+            "Listing asset versions for %s assets (%s cached)",
+            len(asset_versions) + len(missing_asset_ids),
+            len(asset_versions),
+        )
+
+        found_asset_versions = self._data_store.list_asset_versions_for(
+            missing_asset_ids
+        )
+
+        for asset_id, versions in found_asset_versions.items():
+            self._asset_versions_cache.put(
+                asset_id, versions, generation=generations[asset_id]
+            )
+            asset_versions[asset_id] = _copy_asset_versions(versions)
+
+        return asset_versions
+
+    @_timed
+    def export_assets(
+        self,
+        file_path: str,
+        export_format: Optional[str] = None,
+        asset_types: Optional[Iterable[Union[AssetType, str]]] = None,
+        departments: Optional[Iterable[str]] = None,
+        statuses: Optional[Iterable[Union[VersionStatus, str]]] = None,
+        page_size: int = EXPORT_PAGE_SIZE,
+    ) -> ExportResult:
+        """Export every asset version to a file, at constant memory.
+
+        JSON and NDJSON exports can be loaded straight back in with load_assets.
+
+        Args:
+            file_path (str): The file to write.
+            export_format (str | None): ndjson, csv or json, or None to choose from
+                the file suffix.
+            asset_types (Iterable[AssetType | str] | None): Only export the versions
+                of assets of these types, or None for every type.
+            departments (Iterable[str] | None): Only export versions of these
+                departments, or None for every department.
+            statuses (Iterable[VersionStatus | str] | None): Only export versions
+                with these statuses, or None for every status.
+            page_size (int): The number of rows read from the data store at a time.
+
+        Returns:
+            ExportResult: The number of rows written and the export throughput.
+        """
+
+        return export_manifest(
+            self._data_store,
+            file_path,
+            export_format=export_format,
+            asset_types=asset_types,
+            departments=departments,
+            statuses=statuses,
+            page_size=page_size,
+        )
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """Get the hit and miss counters of every cache.
+
+        Returns:
+            dict[str, CacheInfo]: A snapshot of each cache, keyed by what it holds.
+        """
+
+        return {
+            "assets": self._asset_cache.info(),
+            "asset_versions": self._asset_versions_cache.info(),
+        }
+
+    def clear_cache(self) -> None:
+        """Remove every cached entry, such as after writing around the service."""
+
+        self._asset_cache.clear()
+        self._asset_versions_cache.clear()
+
+    def close(self) -> None:
+        """Close the data store, including one passed to the service."""
+
+        self._data_store.close()
+
+    def _collect_metrics(self) -> list[metrics.MetricFamily]:
+        cache_info = self.cache_info()
+        pipelines = {
+            "asset": self._asset_pipeline,
+            "asset_version": self._asset_version_pipeline,
+        }
+        memo_info = {
+            pipeline_name: info
+            for pipeline_name, pipeline in pipelines.items()
+            if (info := pipeline.memo_info()) is not None
+        }
+
+        families = [
+            metrics.counter_family(
+                "otherworld_cache_hits_total",
+                "The number of lookups answered by a service cache.",
+                [((("cache", name),), info.hits) for name, info in cache_info.items()],
+            ),
+            metrics.counter_family(
+                "otherworld_cache_misses_total",
+                "The number of lookups a service cache could not answer.",
+                [
+                    ((("cache", name),), info.misses)
+                    for name, info in cache_info.items()
+                ],
+            ),
+            metrics.gauge_family(
+                "otherworld_cache_entries",
+                "The number of entries held by a service cache.",
+                [((("cache", name),), info.size) for name, info in cache_info.items()],
+            ),
+            metrics.counter_family(
+                "otherworld_validation_memo_hits_total",
+                "The number of validations answered by a pipeline memo.",
+                [
+                    ((("pipeline", name),), info.hits)
+                    for name, info in memo_info.items()
+                ],
+            ),
+            metrics.counter_family(
+                "otherworld_validation_memo_misses_total",
+                "The number of validations a pipeline memo could not answer.",
+                [
+                    ((("pipeline", name),), info.misses)
+                    for name, info in memo_info.items()
+                ],
+            ),
+        ]
+
+        # Per-rule stats are only available for pipelines with profiling enabled
+        rule_stats = [
+            ((("pipeline", pipeline_name), ("rule", rule_name)), stats)
+            for pipeline_name, pipeline in pipelines.items()
+            if pipeline.profile is not None
+            for rule_name, stats in pipeline.profile.stats().items()
+        ]
+
+        if rule_stats:
+            families.extend(
+                [
+                    metrics.counter_family(
+                        "otherworld_validation_rule_calls_total",
+                        "The number of subjects checked by a validation rule.",
+                        [(labels, stats.calls) for labels, stats in rule_stats],
+                    ),
+                    metrics.counter_family(
+                        "otherworld_validation_rule_failures_total",
+                        "The number of subjects failing a validation rule.",
+                        [(labels, stats.failures) for labels, stats in rule_stats],
+                    ),
+                    metrics.counter_family(
+                        "otherworld_validation_rule_seconds_total",
+                        "The time spent within a validation rule.",
+                        [(labels, stats.seconds) for labels, stats in rule_stats],
+                    ),
+                ]
+            )
+
+        return families
+
+    def _get_asset(self, asset_name: str) -> Optional[Asset]:
+        asset = self._asset_cache.get(asset_name)
+
+        if asset is None:
+            # A write invalidating the asset while it is read keeps the stale read out
+            # of the cache
+            generation = self._asset_cache.generation(asset_name)
+            asset = self._data_store.get_asset(asset_name)
+
+            # Missing assets are not cached so they are found as soon as they are added
+            if asset is not None:
+                self._asset_cache.put(asset_name, asset, generation=generation)
+
+        # Copy the asset so callers cannot modify the cached entry
+        return replace(asset) if asset is not None else None
+
+    def _invalidate_asset(self, asset: Asset) -> None:
+        self._asset_cache.invalidate(asset.name)
+        self._asset_versions_cache.invalidate(asset.id)
+
+
+def _copy_asset_versions(asset_versions: list[AssetVersion]) -> list[AssetVersion]:
+    # Copy the list and its asset versions so callers cannot modify the cached entry
+    return [replace(asset_version) for asset_version in asset_versions]
+
+
+def _next_index(report: Optional[ImportReport]) -> int:
+    # Entries added one at a time are indexed by their position within the report
+    return report.rows if report is not None else 0
+
+
+def _report_outcome(outcome: RowOutcome, report: Optional[ImportReport]) -> None:
+    if report is not None:
+        report.record(outcome)
+    elif outcome.status is not RowStatus.ADDED:
+        LOGGER.error(
+            "Rejected %s entry: %s",
+            outcome.status.value,
+            "; ".join(
+                "{}: {}".format(error.field, error.message) for error in outcome.errors
+            ),
+        )
+
+
+def _record_batch(
+    report: ImportReport, outcomes: list[RowOutcome], batch: list[dict[str, Any]]
+) -> None:
+    for outcome, asset_entry in zip(outcomes, batch):
+        report.record(outcome, asset_entry)
+
+
+# The ingested row counter of each outcome, looked up once rather than per row
+_INGESTED_ROWS_BY_STATUS = {
+    status: INGESTED_ROWS.labels(status.value) for status in RowStatus
+}
+
+# Entries skipped by incremental loads, having been imported before
+_UNCHANGED_ROWS = INGESTED_ROWS.labels("unchanged")
 
-        # Get the asset from the data store to ensure data is correct
-        asset = self._data_store.get_asset(name=asset_name)
 
-        # Use the asset id to get all asset versions
-        return self._data_store.list_asset_versions(asset_id=asset.id)
+def _count_ingested_rows(outcomes: list[RowOutcome]) -> None:
+    for status, count in Counter(outcome.status for outcome in outcomes).items():
+        _INGESTED_ROWS_BY_STATUS[status].inc(count)
@@ -0,0 +1,286 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Sequence
+
+from otherworld_asset_service.api.validation.errors import ValidationError
+
+try:
+    import numpy
+except ImportError:
+    # NumPy is optional. Without it every check runs as a pure-Python loop.
+    numpy = None
+
+
+# A column of per-row results, either a NumPy bool array or a list of bools
+Mask = Sequence[bool]
+
+# The most rules a NumPy bitmask can hold, one bit per rule
+MAX_ARRAY_MASK_BITS = 64
+
+
+# The Python types whose columns become typed NumPy arrays, and the kind of array each
+# becomes. Columns of any other type, or mixing types, are checked per row.
+_ARRAY_KINDS = {str: "U", bytes: "S", bool: "b", int: "i", float: "f"}
+
+_KIND_TYPES = {kind: value_type for value_type, kind in _ARRAY_KINDS.items()}
+
+
+def _as_array(values: Sequence[Any]):
+    """Convert a column to a typed NumPy array, if every value shares a plain type.
+
+    NumPy coerces mixed columns to a single type, e.g. ["fx", 3] to two strings, so
+    only columns that NumPy stores exactly as given are converted. Every other column
+    is checked per row, so results never depend on whether NumPy is installed.
+    """
+
+    if numpy is None:
+        return None
+
+    if isinstance(values, numpy.ndarray):
+        # Columns converted by as_column are already typed arrays
+        return values if values.ndim == 1 and values.dtype.kind in _KIND_TYPES else None
+
+    value_types = set(map(type, values))
+
+    if len(value_types) != 1:
+        return None
+
+    kind = _ARRAY_KINDS.get(value_types.pop())
+
+    # Typed string arrays drop trailing NUL characters
+    if kind == "U" and "\x00" in "".join(values):
+        return None
+
+    if kind == "S" and b"\x00" in b"".join(values):
+        return None
+
+    # Integers too large for any NumPy integer type become object arrays
+    if kind is None or (array := numpy.asarray(values)).dtype.kind != kind:
+        return None
+
+    return array
+
+
+def as_column(values: Sequence[Any]) -> Sequence[Any]:
+    """Convert a column once up front so every rule checking it can share the array.
+
+    Args:
+        values (Sequence[Any]): The column to convert.
+
+    Returns:
+        Sequence[Any]: The column as a NumPy array when available, or the column as is.
+    """
+
+    array = _as_array(values)
+
+    return values if array is None else array
+
+
+def _check_each(values: Sequence[Any], predicate: Callable[[Any], bool]) -> Mask:
+    """Apply a predicate to every value, for columns that cannot be vectorized."""
+
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return numpy.fromiter(
+            (predicate(value) for value in values), dtype=bool, count=len(values)
+        )
+
+    return [predicate(value) for value in values]
+
+
+def is_non_empty(values: Sequence[Any]) -> Mask:
+    """Check which values of a column are truthy.
+
+    Args:
+        values (Sequence[Any]): The column to check.
+
+    Returns:
+        Sequence[bool]: Whether each value is truthy.
+    """
+
+    array = _as_array(values)
+
+    if array is not None:
+        if array.dtype.kind in "US":
+            return numpy.char.str_len(array) > 0
+
+        if array.dtype.kind in "biuf":
+            return array != 0
+
+        values = array
+
+    return _check_each(values, bool)
+
+
+def is_instance(values: Sequence[Any], kind: type) -> Mask:
+    """Check which values of a column are instances of a type.
+
+    Args:
+        values (Sequence[Any]): The column to check.
+        kind (type): The type every value should be an instance of.
+
+    Returns:
+        Sequence[bool]: Whether each value is an instance of the type.
+    """
+
+    array = _as_array(values)
+
+    if array is not None:
+        # Every value of a typed array was an instance of the same Python type
+        return numpy.full(len(array), issubclass(_KIND_TYPES[array.dtype.kind], kind))
+
+    return _check_each(values, lambda value: isinstance(value, kind))
+
+
+def is_none_or_at_least(values: Sequence[Any], minimum: int) -> Mask:
+    """Check which values of a column are None or greater than or equal to a minimum.
+
+    Args:
+        values (Sequence[Any]): The column to check.
+        minimum (int): The smallest valid value.
+
+    Returns:
+        Sequence[bool]: Whether each value is None or at least the minimum.
+    """
+
+    array = _as_array(values)
+
+    if array is not None:
+        if array.dtype.kind in "iuf":
+            return array >= minimum
+
+        values = array
+
+    return _check_each(values, lambda value: value is None or value >= minimum)
+
+
+def is_member(values: Sequence[Any], allowed: tuple[Any, ...]) -> Mask:
+    """Check which values of a column are one of a set of allowed values.
+
+    Args:
+        values (Sequence[Any]): The column to check.
+        allowed (tuple[Any, ...]): The allowed values.
+
+    Returns:
+        Sequence[bool]: Whether each value is allowed.
+    """
+
+    array = _as_array(values)
+
+    if array is not None:
+        if array.dtype.kind == "U":
+            return numpy.isin(
+                array, [value for value in allowed if isinstance(value, str)]
+            )
+
+        values = array
+
+    return _check_each(values, lambda value: value in allowed)
+
+
+def count_valid(valid: Mask) -> int:
+    """Count the rows a check passed.
+
+    Args:
+        valid (Sequence[bool]): Whether each row passed the check.
+
+    Returns:
+        int: The number of rows that passed.
+    """
+
+    if numpy is not None and isinstance(valid, numpy.ndarray):
+        return int(numpy.count_nonzero(valid))
+
+    return sum(map(bool, valid))
+
+
+def combine_masks(checks: Sequence[Mask], rows: int) -> Sequence[int]:
+    """Combine the results of several checks into a single bitmask per row.
+
+    Bit n of a row's bitmask is set when the row failed check n.
+
+    Args:
+        checks (Sequence[Sequence[bool]]): Whether each row passed, for each check.
+        rows (int): The number of rows checked.
+
+    Returns:
+        Sequence[int]: The bitmask of each row, as a NumPy array when available.
+    """
+
+    if numpy is not None and len(checks) <= MAX_ARRAY_MASK_BITS:
+        masks = numpy.zeros(rows, dtype=numpy.uint64)
+
+        for bit, valid in enumerate(checks):
+            masks |= numpy.logical_not(valid).astype(numpy.uint64) << numpy.uint64(bit)
+
+        return masks
+
+    masks = [0] * rows
+
+    for bit, valid in enumerate(checks):
+        flag = 1 << bit
+
+        for row, is_valid in enumerate(valid):
+            if not is_valid:
+                masks[row] |= flag
+
+    return masks
+
+
+@dataclass(slots=True)
+class BatchValidationResult:
+    """The result of validating a columnar batch of subjects.
+
+    Errors are kept as a bitmask per row and only become ValidationError objects for
+    the rows that fail.
+
+    Args:
+        masks (Sequence[int]): The bitmask of each row, where bit n is set when the row
+            failed the rule reporting errors[n].
+        errors (tuple[ValidationError, ...]): The error reported by each rule, in bit
+            order.
+    """
+
+    masks: Sequence[int]
+    errors: tuple[ValidationError, ...]
+
+    @property
+    def is_valid(self) -> bool:
+        """bool: Whether every row passed validation."""
+
+        return not any(self.masks)
+
+    def failing_rows(self) -> list[int]:
+        """Get the rows that failed validation.
+
+        Returns:
+            list[int]: The index of every failing row, in order.
+        """
+
+        if numpy is not None and isinstance(self.masks, numpy.ndarray):
+            return numpy.flatnonzero(self.masks).tolist()
+
+        return [row for row, mask in enumerate(self.masks) if mask]
+
+    def row_errors(self, row: int) -> list[ValidationError]:
+        """Get the validation errors of a single row.
+
+        Args:
+            row (int): The index of the row.
+
+        Returns:
+            list[ValidationError]: The errors of the row, in rule order.
+        """
+
+        mask = int(self.masks[row])
+
+        return [error for bit, error in enumerate(self.errors) if mask >> bit & 1]
+
+    def iter_errors(self) -> Iterator[tuple[int, list[ValidationError]]]:
+        """Iterate the validation errors of every failing row.
+
+        Yields:
+            tuple[int, list[ValidationError]]: The index and errors of each failing
+                row.
+        """
+
+        for row in self.failing_rows():
+            yield row, self.row_errors(row)
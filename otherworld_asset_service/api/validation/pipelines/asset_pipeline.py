@@ -8,9 +8,13 @@ from otherworld_asset_service.api.validation.validation import ValidationPipelin
 from otherworld_asset_service.models.asset import Asset
 
 
-def build_default_asset_pipeline() -> ValidationPipeline[Asset]:
+def build_default_asset_pipeline(memo_size: int = 0) -> ValidationPipeline[Asset]:
     """Build a default asset validation pipeline.
 
+    Args:
+        memo_size (int): The number of validation results memoized. A size of 0
+            disables memoization.
+
     Returns:
         ValidationPipeline[Asset]: A collection of all asset validation rules.
     """
@@ -21,5 +25,6 @@ def build_default_asset_pipeline() -> ValidationPipeline[Asset]:
             AssetNameIsValidRule(),
             AssetTypeIsRequiredRule(),
             AssetTypeIsValidRule(),
-        ]
+        ],
+        memo_size=memo_size,
     )
@@ -8,9 +8,15 @@ from otherworld_asset_service.api.validation.validation import ValidationPipelin
 from otherworld_asset_service.models.asset_version import AssetVersion
 
 
-def build_default_asset_version_pipeline() -> ValidationPipeline[AssetVersion]:
+def build_default_asset_version_pipeline(
+    memo_size: int = 0,
+) -> ValidationPipeline[AssetVersion]:
     """Build a default asset version validation pipeline.
 
+    Args:
+        memo_size (int): The number of validation results memoized. A size of 0
+            disables memoization.
+
     Returns:
         ValidationPipeline[AssetVersion]: A collection of all asset version validation
             rules.
@@ -22,5 +28,6 @@ def build_default_asset_version_pipeline() -> ValidationPipeline[AssetVersion]:
             AssetVersionDepartmentIsValidRule(),
             AssetVersionIsGreaterThanOneRule(),
             AssetVersionStatusIsKnownRule(),
-        ]
+        ],
+        memo_size=memo_size,
     )
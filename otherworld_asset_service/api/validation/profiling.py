@@ -0,0 +1,120 @@
+import threading
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class RuleStats:
+    """The timings of a single rule class within a validation pipeline.
+
+    Args:
+        calls (int): The number of subjects the rule checked.
+        seconds (float): The cumulative time spent within the rule.
+        failures (int): The number of subjects the rule reported errors for.
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+    failures: int = 0
+
+    @property
+    def mean_seconds(self) -> float:
+        """float: The average time spent checking a single subject."""
+
+        return self.seconds / self.calls if self.calls else 0.0
+
+
+class ValidationProfile:
+    """A thread-safe record of the time spent within each rule of a pipeline.
+
+    Stats are keyed by the qualified name of each rule class, so several instances of
+    the same rule share a single entry. A profile sent to another process, such as a
+    parallel ingest worker, arrives empty and its stats are not sent back.
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[str, RuleStats] = {}
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        # Locks cannot be pickled, so a profile is sent to other processes empty
+        return type(self), ()
+
+    def record(self, rule: object, calls: int, seconds: float, failures: int) -> None:
+        """Add a measurement of a rule to its stats.
+
+        Args:
+            rule (object): The rule measured.
+            calls (int): The number of subjects the rule checked.
+            seconds (float): The time spent within the rule.
+            failures (int): The number of subjects the rule reported errors for.
+        """
+
+        rule_name = type(rule).__qualname__
+
+        with self._lock:
+            rule_stats = self._stats.get(rule_name)
+
+            if rule_stats is None:
+                rule_stats = self._stats[rule_name] = RuleStats()
+
+            rule_stats.calls += calls
+            rule_stats.seconds += seconds
+            rule_stats.failures += failures
+
+    def stats(self) -> dict[str, RuleStats]:
+        """Get the stats of every rule measured so far.
+
+        Returns:
+            dict[str, RuleStats]: A snapshot of the stats of each rule class, keyed by
+                its qualified name, slowest first.
+        """
+
+        with self._lock:
+            snapshot = [
+                (rule_name, RuleStats(stats.calls, stats.seconds, stats.failures))
+                for rule_name, stats in self._stats.items()
+            ]
+
+        return dict(sorted(snapshot, key=lambda item: item[1].seconds, reverse=True))
+
+    def reset(self) -> None:
+        """Discard the stats of every rule."""
+
+        with self._lock:
+            self._stats.clear()
+
+    def format_table(self) -> str:
+        """Format the stats of every rule as a plain text table, slowest first.
+
+        Returns:
+            str: The table, with a row per rule class.
+        """
+
+        header = ("Rule", "Calls", "Failures", "Total (ms)", "Mean (us)")
+        rows = [
+            (
+                rule_name,
+                str(stats.calls),
+                str(stats.failures),
+                "{:.3f}".format(stats.seconds * 1e3),
+                "{:.3f}".format(stats.mean_seconds * 1e6),
+            )
+            for rule_name, stats in self.stats().items()
+        ]
+
+        widths = [
+            max(len(row[column]) for row in (header, *rows))
+            for column in range(len(header))
+        ]
+
+        lines = []
+        for row in (header, *rows):
+            # Left align the rule names and right align every number
+            cells = [row[0].ljust(widths[0])]
+            cells.extend(cell.rjust(width) for cell, width in zip(row[1:], widths[1:]))
+            lines.append("  ".join(cells))
+
+        lines.insert(1, "  ".join("-" * width for width in widths))
+
+        return "\n".join(lines)
@@ -1,3 +1,9 @@
+from typing import Any, Sequence
+
+from otherworld_asset_service.api.validation.columnar import (
+    is_instance,
+    is_non_empty,
+)
 from otherworld_asset_service.api.validation.errors import ValidationError
 from otherworld_asset_service.models.asset import Asset
 from otherworld_asset_service.models.enums import AssetType
@@ -6,56 +12,64 @@ from otherworld_asset_service.models.enums import AssetType
 class AssetNameIsRequiredRule:
     """Validation rule to ensure asset name exists."""
 
-    def validate(self, asset: Asset) -> list[ValidationError]:
-        validation_errors: list[ValidationError] = []
+    column = "name"
+    error = ValidationError(field="name", message="Asset must define a valid name")
 
-        if not asset.name:
-            validation_errors.append(
-                ValidationError(field="name", message="Asset must define a valid name")
-            )
+    def is_valid(self, asset: Asset) -> bool:
+        return bool(asset.name)
 
-        return validation_errors
+    def is_valid_many(self, values: Sequence[Any]) -> Sequence[bool]:
+        return is_non_empty(values)
+
+    def validate(self, asset: Asset) -> list[ValidationError]:
+        return [] if self.is_valid(asset) else [self.error]
 
 
 class AssetNameIsValidRule:
     """Validation rule to ensure data type is correct."""
 
-    def validate(self, asset: Asset) -> list[ValidationError]:
-        validation_errors: list[ValidationError] = []
+    column = "name"
+    error = ValidationError(field="name", message="Asset name must be of type str")
+
+    def is_valid(self, asset: Asset) -> bool:
+        return isinstance(asset.name, str)
 
-        if not isinstance(asset.name, str):
-            validation_errors.append(
-                ValidationError(field="name", message="Asset name must be of type str")
-            )
+    def is_valid_many(self, values: Sequence[Any]) -> Sequence[bool]:
+        return is_instance(values, str)
 
-        return validation_errors
+    def validate(self, asset: Asset) -> list[ValidationError]:
+        return [] if self.is_valid(asset) else [self.error]
 
 
 class AssetTypeIsRequiredRule:
     """Validation rule to ensure asset type exists."""
 
-    def validate(self, asset: Asset) -> list[ValidationError]:
-        validation_errors: list[ValidationError] = []
+    column = "type"
+    error = ValidationError(field="type", message="Asset must define a valid type")
+
+    def is_valid(self, asset: Asset) -> bool:
+        return bool(asset.asset_type)
 
-        if not asset.asset_type:
-            validation_errors.append(
-                ValidationError(field="type", message="Asset must define a valid type")
-            )
+    def is_valid_many(self, values: Sequence[Any]) -> Sequence[bool]:
+        return is_non_empty(values)
 
-        return validation_errors
+    def validate(self, asset: Asset) -> list[ValidationError]:
+        return [] if self.is_valid(asset) else [self.error]
 
 
 class AssetTypeIsValidRule:
     """Validation rule to ensure data type is correct."""
 
-    def validate(self, asset: Asset) -> list[ValidationError]:
-        validation_errors: list[ValidationError] = []
+    column = "type"
+    error = ValidationError(
+        field="type", message="Asset type must be of type AssetType"
+    )
+
+    def is_valid(self, asset: Asset) -> bool:
+        return isinstance(asset.asset_type, AssetType)
 
-        if not isinstance(asset.asset_type, AssetType):
-            validation_errors.append(
-                ValidationError(
-                    field="type", message="Asset type must be of type AssetType"
-                )
-            )
+    def is_valid_many(self, values: Sequence[Any]) -> Sequence[bool]:
+        return is_instance(values, AssetType)
 
-        return validation_errors
+    def validate(self, asset: Asset) -> list[ValidationError]:
+        return [] if self.is_valid(asset) else [self.error]
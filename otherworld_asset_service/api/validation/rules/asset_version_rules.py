@@ -1,73 +1,94 @@
+from typing import Any, Sequence
+
+from otherworld_asset_service.api.validation.columnar import (
+    is_instance,
+    is_member,
+    is_non_empty,
+    is_none_or_at_least,
+)
 from otherworld_asset_service.api.validation.errors import ValidationError
 from otherworld_asset_service.models.asset_version import AssetVersion
 from otherworld_asset_service.models.enums import VersionStatus
 
 
+# Every status accepted by VersionStatus, as members or raw values. A tuple is used so
+# membership never hashes, and so never raises, on unhashable statuses.
+KNOWN_VERSION_STATUSES = tuple(VersionStatus) + tuple(
+    status.value for status in VersionStatus
+)
+
+
 class AssetVersionDepartmentIsRequiredRule:
     """Validation rule to ensure department exists."""
 
-    def validate(self, asset_version: AssetVersion) -> list[ValidationError]:
-        validation_errors: list[ValidationError] = []
+    column = "department"
+    error = ValidationError(
+        field="department",
+        message="Asset version must define a valid department",
+    )
 
-        if not asset_version.department:
-            validation_errors.append(
-                ValidationError(
-                    field="department",
-                    message="Asset version must define a valid department",
-                )
-            )
+    def is_valid(self, asset_version: AssetVersion) -> bool:
+        return bool(asset_version.department)
 
-        return validation_errors
+    def is_valid_many(self, values: Sequence[Any]) -> Sequence[bool]:
+        return is_non_empty(values)
+
+    def validate(self, asset_version: AssetVersion) -> list[ValidationError]:
+        return [] if self.is_valid(asset_version) else [self.error]
 
 
 class AssetVersionDepartmentIsValidRule:
     """Validation rule to ensure the department data type is valid."""
 
-    def validate(self, asset_version: AssetVersion) -> list[ValidationError]:
-        validation_errors: list[ValidationError] = []
+    column = "department"
+    error = ValidationError(
+        field="department",
+        message="Asset version department must be of type str",
+    )
+
+    def is_valid(self, asset_version: AssetVersion) -> bool:
+        return isinstance(asset_version.department, str)
 
-        if not isinstance(asset_version.department, str):
-            validation_errors.append(
-                ValidationError(
-                    field="department",
-                    message="Asset version department must be of type str",
-                )
-            )
+    def is_valid_many(self, values: Sequence[Any]) -> Sequence[bool]:
+        return is_instance(values, str)
 
-        return validation_errors
+    def validate(self, asset_version: AssetVersion) -> list[ValidationError]:
+        return [] if self.is_valid(asset_version) else [self.error]
 
 
 class AssetVersionIsGreaterThanOneRule:
     """Validation rule to ensure asset version is greater than or equal to 1."""
 
-    def validate(self, asset_version: AssetVersion) -> list[ValidationError]:
-        validation_errors: list[ValidationError] = []
+    column = "version"
+    error = ValidationError(
+        field="version",
+        message="Asset version must be greater than or equal to 1",
+    )
 
-        if asset_version.version is not None and asset_version.version < 1:
-            validation_errors.append(
-                ValidationError(
-                    field="version",
-                    message="Asset version must be greater than or equal to 1",
-                )
-            )
+    def is_valid(self, asset_version: AssetVersion) -> bool:
+        return asset_version.version is None or asset_version.version >= 1
 
-        return validation_errors
+    def is_valid_many(self, values: Sequence[Any]) -> Sequence[bool]:
+        return is_none_or_at_least(values, 1)
+
+    def validate(self, asset_version: AssetVersion) -> list[ValidationError]:
+        return [] if self.is_valid(asset_version) else [self.error]
 
 
 class AssetVersionStatusIsKnownRule:
     """Validation rule to ensure asset version status exists."""
 
+    column = "status"
+    error = ValidationError(
+        field="status",
+        message="Asset version status must be of type VersionStatus",
+    )
+
+    def is_valid(self, asset_version: AssetVersion) -> bool:
+        return asset_version.status in KNOWN_VERSION_STATUSES
+
+    def is_valid_many(self, values: Sequence[Any]) -> Sequence[bool]:
+        return is_member(values, KNOWN_VERSION_STATUSES)
+
     def validate(self, asset_version: AssetVersion) -> list[ValidationError]:
-        validation_errors: list[ValidationError] = []
-
-        try:
-            VersionStatus(asset_version.status)
-        except ValueError:
-            validation_errors.append(
-                ValidationError(
-                    field="status",
-                    message="Asset version status must be of type VersionStatus",
-                )
-            )
-
-        return validation_errors
+        return [] if self.is_valid(asset_version) else [self.error]
@@ -1,11 +1,95 @@
-from dataclasses import dataclass
-from typing import Generic, Protocol, Sequence, TypeVar
+import dataclasses
+import functools
+import time
 
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    TypeVar,
+    runtime_checkable,
+)
+
+from otherworld_asset_service.api.validation.columnar import (
+    BatchValidationResult,
+    as_column,
+    combine_masks,
+    count_valid,
+)
 from otherworld_asset_service.api.validation.errors import ValidationError
+from otherworld_asset_service.api.validation.profiling import ValidationProfile
+from otherworld_asset_service.utils.cache import CacheInfo, LRUCache
 
 
 T = TypeVar("T")
 
+# The shared result of a compiled validator for a subject without errors
+NO_ERRORS: tuple[ValidationError, ...] = ()
+
+# The number of validation results memoized by a pipeline when memoization is enabled
+DEFAULT_MEMO_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=None)
+def _get_field_names(subject_type: type) -> Optional[tuple[str, ...]]:
+    if not dataclasses.is_dataclass(subject_type):
+        return None
+
+    return tuple(
+        subject_field.name for subject_field in dataclasses.fields(subject_type)
+    )
+
+
+def fingerprint(subject: Any) -> Optional[tuple]:
+    """Build a cheap fingerprint of a subject from the values of its fields.
+
+    The type of every value is included, so values that compare equal across types,
+    such as 1 and True, do not share a fingerprint.
+
+    Args:
+        subject (Any): The subject to fingerprint.
+
+    Returns:
+        tuple | None: The fingerprint, or None if the subject is not a dataclass.
+    """
+
+    field_names = _get_field_names(type(subject))
+
+    if field_names is None:
+        return None
+
+    values = tuple([getattr(subject, field_name) for field_name in field_names])
+
+    return (type(subject), values, tuple(map(type, values)))
+
+
+def _validate_memoized(
+    memo: LRUCache,
+    subject: T,
+    validate: Callable[[T], Sequence[ValidationError]],
+) -> Sequence[ValidationError]:
+    key = fingerprint(subject)
+
+    if key is None:
+        return validate(subject)
+
+    try:
+        validation_errors = memo.get(key)
+    except TypeError:
+        # Subjects holding unhashable values cannot be memoized
+        return validate(subject)
+
+    if validation_errors is None:
+        validation_errors = tuple(validate(subject))
+        memo.put(key, validation_errors)
+
+    return validation_errors
+
 
 class Rule(Protocol[T]):
     """Represents a validation rule for a subject of type T.
@@ -18,6 +102,140 @@ class Rule(Protocol[T]):
     def validate(self, subject: T) -> list[ValidationError]: ...
 
 
+@runtime_checkable
+class CheckRule(Protocol[T]):
+    """Represents a validation rule that reports at most a single, fixed error.
+
+    Besides validate, such a rule implements is_valid(self, subject: T) -> bool and
+    exposes the error it reports as error. Compiled validators call is_valid directly,
+    so validating a subject without errors allocates nothing.
+    """
+
+    error: ValidationError
+
+    def is_valid(self, subject: T) -> bool: ...
+
+    def validate(self, subject: T) -> list[ValidationError]: ...
+
+
+@runtime_checkable
+class ColumnRule(Protocol):
+    """Represents a validation rule that can check a whole column of values at once.
+
+    Such a rule names the column it checks as column, the error it reports as error, and
+    implements is_valid_many(self, values) -> Sequence[bool].
+    """
+
+    column: str
+    error: ValidationError
+
+    def is_valid_many(self, values: Sequence[Any]) -> Sequence[bool]: ...
+
+
+class CompiledValidator(Generic[T]):
+    """A validator fusing the rules of a pipeline into a single call.
+
+    Rules conforming to CheckRule are reduced to their is_valid predicate and error,
+    while any other Rule is still called through validate. Rules run in pipeline order.
+
+    Args:
+        rules (Sequence[Rule]): The rules to fuse.
+        fail_fast (bool): Whether to stop at the first rule reporting errors.
+        memo (LRUCache | None): The memo of validation results to share, if any. It is
+            ignored when failing fast, since those results are partial.
+        profile (ValidationProfile | None): The profile recording the time spent within
+            each rule, if profiling is enabled.
+    """
+
+    __slots__ = ("_rules", "_checks", "_fail_fast", "_memo", "_profile")
+
+    def __init__(
+        self,
+        rules: Sequence[Rule[T]],
+        fail_fast: bool = False,
+        memo: Optional[LRUCache] = None,
+        profile: Optional[ValidationProfile] = None,
+    ) -> None:
+        self._rules = tuple(rules)
+        # Each check pairs a predicate with its error, or, for rules that are not
+        # CheckRules, holds None and the rule's validate method
+        self._checks = tuple(
+            (rule.is_valid, rule.error)
+            if isinstance(rule, CheckRule)
+            else (None, rule.validate)
+            for rule in self._rules
+        )
+        self._fail_fast = fail_fast
+        self._memo = None if fail_fast else memo
+        self._profile = profile
+
+    def __call__(self, subject: T) -> Sequence[ValidationError]:
+        """Validate a subject.
+
+        Args:
+            subject (T): An object to validate.
+
+        Returns:
+            Sequence[ValidationError]: The validation errors encountered, or the shared,
+                empty NO_ERRORS if there were none.
+        """
+
+        if self._memo is not None:
+            return _validate_memoized(self._memo, subject, self._validate)
+
+        return self._validate(subject)
+
+    def _validate(self, subject: T) -> Sequence[ValidationError]:
+        if self._profile is not None:
+            return self._validate_profiled(subject)
+
+        validation_errors: Optional[list[ValidationError]] = None
+
+        for is_valid, error in self._checks:
+            if is_valid is not None:
+                if is_valid(subject):
+                    continue
+
+                rule_errors = (error,)
+            else:
+                rule_errors = error(subject)
+
+                if not rule_errors:
+                    continue
+
+            if self._fail_fast:
+                return tuple(rule_errors)
+
+            if validation_errors is None:
+                validation_errors = []
+
+            validation_errors.extend(rule_errors)
+
+        return validation_errors or NO_ERRORS
+
+    def _validate_profiled(self, subject: T) -> Sequence[ValidationError]:
+        validation_errors: list[ValidationError] = []
+
+        for rule, (is_valid, error) in zip(self._rules, self._checks):
+            started = time.perf_counter()
+
+            if is_valid is not None:
+                rule_errors = () if is_valid(subject) else (error,)
+            else:
+                rule_errors = error(subject)
+
+            self._profile.record(
+                rule, 1, time.perf_counter() - started, 1 if rule_errors else 0
+            )
+
+            if rule_errors and self._fail_fast:
+                return tuple(rule_errors)
+
+            validation_errors.extend(rule_errors)
+
+        return validation_errors or NO_ERRORS
+
+
 @dataclass(slots=True)
 class ValidationPipeline(Generic[T]):
     """A validation pipeline that is fully extensible and composable.
@@ -25,17 +243,43 @@ class ValidationPipeline(Generic[T]):
     This pipeline accepts a Sequence of rules conforming to the Rule protocol, and
     applies them to a subject of type T, which can be an Asset, AssetVersion, etc.
 
+    Results can optionally be memoized, keyed on a fingerprint of the subject's fields.
+    Each pipeline holds its own memo, so results are never shared between pipelines.
+    Memoization assumes every rule only depends on the subject's fields.
+
+    Profiling records the calls, cumulative time and failures of each rule class. It
+    must be enabled before compiling for compiled validators to be profiled, and
+    memoized results are not counted since no rule runs for them.
+
     Args:
         rules (Sequence[Rule] | None): A container of validation rules that conform
             to the Rule protocol and validate objects of type T.
+        memo_size (int): The number of validation results memoized. A size of 0
+            disables memoization.
+        profiling (bool): Whether to record the time spent within each rule.
     """
 
     # Container for all rules that implement the Rule protocol
     rules: Sequence[Rule[T]]
 
-    def __init__(self, rules: Sequence[Rule[T]] | None = None) -> None:
+    # Memoized validation results keyed on subject fingerprints, if enabled
+    memo: Optional[LRUCache] = field(default=None, compare=False, repr=False)
+
+    # The time spent within each rule, if profiling is enabled
+    profile: Optional[ValidationProfile] = field(
+        default=None, compare=False, repr=False
+    )
+
+    def __init__(
+        self,
+        rules: Sequence[Rule[T]] | None = None,
+        memo_size: int = 0,
+        profiling: bool = False,
+    ) -> None:
         # Ensure rules are immutable to maintain state after pipeline creation
         self.rules = tuple(rules) if rules is not None else tuple()
+        self.memo = LRUCache(memo_size) if memo_size else None
+        self.profile = ValidationProfile() if profiling else None
 
     def validate(self, subject: T) -> list[ValidationError]:
         """Validate a subject.
@@ -48,6 +292,44 @@ class ValidationPipeline(Generic[T]):
                 applying all rules to the subject.
         """
 
+        if self.memo is not None:
+            return list(_validate_memoized(self.memo, subject, self._validate))
+
+        return self._validate(subject)
+
+    def memo_info(self) -> Optional[CacheInfo]:
+        """Get how many validations the memo has skipped.
+
+        Returns:
+            CacheInfo | None: A snapshot of the memo, where hits are skipped
+                validations, or None if memoization is disabled.
+        """
+
+        return self.memo.info() if self.memo is not None else None
+
+    def enable_profiling(self) -> ValidationProfile:
+        """Start recording the time spent within each rule.
+
+        Validators compiled before profiling was enabled are not profiled.
+
+        Returns:
+            ValidationProfile: The profile of the pipeline, kept if already enabled.
+        """
+
+        if self.profile is None:
+            self.profile = ValidationProfile()
+
+        return self.profile
+
+    def disable_profiling(self) -> None:
+        """Stop recording the time spent within each rule, discarding the profile."""
+
+        self.profile = None
+
+    def _validate(self, subject: T) -> list[ValidationError]:
+        if self.profile is not None:
+            return self._validate_profiled(subject)
+
         validation_errors: list[ValidationError] = []
 
         # Iterate all validation rules and collect any errors encountered
@@ -55,3 +337,96 @@ class ValidationPipeline(Generic[T]):
             validation_errors.extend(validation_rule.validate(subject))
 
         return validation_errors
+
+    def _validate_profiled(self, subject: T) -> list[ValidationError]:
+        validation_errors: list[ValidationError] = []
+
+        for validation_rule in self.rules:
+            started = time.perf_counter()
+            rule_errors = validation_rule.validate(subject)
+
+            self.profile.record(
+                validation_rule,
+                1,
+                time.perf_counter() - started,
+                1 if rule_errors else 0,
+            )
+
+            validation_errors.extend(rule_errors)
+
+        return validation_errors
+
+    def validate_many(
+        self, columns: Mapping[str, Sequence[Any]]
+    ) -> BatchValidationResult:
+        """Validate a batch of subjects provided as columns of field values.
+
+        Each rule checks its whole column at once, as array operations when NumPy is
+        available. Every rule must conform to ColumnRule.
+
+        Args:
+            columns (Mapping[str, Sequence[Any]]): The values of each field, such as
+                name or status, for every subject. All columns must be the same length.
+
+        Returns:
+            BatchValidationResult: The per-row error bitmask of the batch.
+
+        Raises:
+            TypeError: If a rule cannot validate columns.
+            ValueError: If a column is missing or the columns differ in length.
+        """
+
+        lengths = {len(values) for values in columns.values()}
+
+        if len(lengths) > 1:
+            raise ValueError("All columns must be the same length.")
+
+        rows = lengths.pop() if lengths else 0
+
+        # Convert each column once, rather than once per rule checking it
+        columns = {field: as_column(values) for field, values in columns.items()}
+
+        checks = []
+        for validation_rule in self.rules:
+            if not isinstance(validation_rule, ColumnRule):
+                raise TypeError(
+                    "{} does not support columnar validation.".format(
+                        type(validation_rule).__name__
+                    )
+                )
+
+            if validation_rule.column not in columns:
+                raise ValueError("Missing column {}.".format(validation_rule.column))
+
+            started = time.perf_counter()
+            valid = validation_rule.is_valid_many(columns[validation_rule.column])
+
+            if self.profile is not None:
+                self.profile.record(
+                    validation_rule,
+                    rows,
+                    time.perf_counter() - started,
+                    rows - count_valid(valid),
+                )
+
+            checks.append(valid)
+
+        return BatchValidationResult(
+            combine_masks(checks, rows),
+            tuple(validation_rule.error for validation_rule in self.rules),
+        )
+
+    def compile(self, fail_fast: bool = False) -> CompiledValidator[T]:
+        """Fuse all rules into a single validator for repeated validation.
+
+        Args:
+            fail_fast (bool): Whether to stop at the first rule reporting errors.
+
+        Returns:
+            CompiledValidator[T]: The validator, returning the same errors as validate
+                when fail_fast is disabled.
+        """
+
+        return CompiledValidator(
+            self.rules, fail_fast=fail_fast, memo=self.memo, profile=self.profile
+        )
@@ -0,0 +1,891 @@
+import sqlite3
+import threading
+
+from array import array
+from bisect import bisect_right
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Union
+
+from otherworld_asset_service.models.asset import Asset
+from otherworld_asset_service.models.asset_version import AssetVersion
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+from otherworld_asset_service.storage.codes import (
+    ASSET_TYPE_CODES,
+    ASSET_TYPE_VALUES,
+    ASSET_TYPES,
+    VERSION_STATUS_CODES,
+    VERSION_STATUS_VALUES,
+    VERSION_STATUSES,
+    asset_type_code,
+    version_status_code,
+)
+from otherworld_asset_service.storage.data_store import (
+    AssetDataStore,
+    AssetKey,
+    AssetRow,
+    AssetVersionRow,
+    ManifestRow,
+)
+from otherworld_asset_service.storage.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_page_token,
+    encode_page_token,
+)
+from otherworld_asset_service.storage.sqlite_database import SQLiteDatabase
+from otherworld_asset_service.utils import logger
+
+
+LOGGER = logger.get_logger("ArrayDatabase")
+
+# Versions share a hash index keyed by a single integer packing the asset id above the
+# version number, which is far smaller than a tuple key per version
+_VERSION_BITS = 32
+_MAX_VERSION = (1 << _VERSION_BITS) - 1
+
+# Terminates the chain linking the versions of an asset
+_NO_ROW = -1
+
+
+class ArrayDatabase:
+    """An in-memory persistence layer holding assets and versions in compact arrays.
+
+    Each column is a typed array rather than a list of dataclasses, with asset types,
+    statuses and departments stored as small integer codes. Assets are found through a
+    hash index on name, and versions through a hash index on (asset id, version). The
+    versions of each asset are linked together so they can be listed without a scan,
+    and assets are kept ordered by name and type for listings once first listed.
+
+    Models are only built for the rows a call returns, so lookups take microseconds and
+    a million assets take a fraction of the memory of the equivalent models. Nothing is
+    persisted, so load from a SQLite data store at startup with from_sqlite, to serve
+    read-mostly workloads. The database is safe to share across threads.
+    """
+
+    def __init__(self) -> None:
+        # Writers are serialized, while rows only become visible to readers once every
+        # column is written
+        self._lock = threading.RLock()
+
+        self._reset()
+
+    def _reset(self) -> None:
+        # Assets, one row per asset across every column
+        self._asset_ids = array("q")
+        self._asset_names: list[str] = []
+        self._asset_types = array("B")
+
+        # The row of the first asset by type for each name, and every row, ordered by
+        # type, for the few names shared by assets of several types
+        self._asset_rows_by_name: dict[str, int] = {}
+        self._shared_asset_rows: dict[str, list[int]] = {}
+
+        # The row of every asset indexed by asset id, as for _last_version_rows below
+        self._asset_rows_by_id = array("q")
+
+        # Asset rows ordered by name and type, built by the first listing after a write
+        self._sorted_asset_rows: Optional[list[int]] = None
+
+        # Asset versions, one row per version across every column
+        self._version_asset_ids = array("q")
+        self._version_departments = array("I")
+        self._version_numbers = array("q")
+        self._version_statuses = array("B")
+
+        # The previous version row of the same asset, and the last version row of
+        # every asset indexed by asset id, linking the versions of each asset together.
+        # Asset ids are allocated sequentially, so indexing by id wastes little space.
+        self._previous_version_rows = array("q")
+        self._last_version_rows = array("q")
+
+        # The row of the first version by department for each (asset id, version)
+        self._version_rows: dict[int, int] = {}
+
+        # Departments are free text, so codes are assigned as they are first seen
+        self._departments: list[str] = []
+        self._department_codes: dict[str, int] = {}
+
+        self._next_asset_id = 1
+
+        # Manifest records and files recorded by incremental loads
+        self._record_fingerprints: set[int] = set()
+        self._imported_files: dict[str, tuple[str, int]] = {}
+
+    @classmethod
+    def from_data_store(
+        cls, data_store: AssetDataStore, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> "ArrayDatabase":
+        """Copy every asset and asset version of another data store.
+
+        Args:
+            data_store (AssetDataStore): The data store to copy.
+            page_size (int): The number of assets read from the data store at a time.
+
+        Returns:
+            ArrayDatabase: The populated database.
+        """
+
+        database = cls()
+
+        with database._lock:
+            for asset in data_store.iter_assets(page_size=page_size):
+                database._insert_asset(
+                    asset.name, ASSET_TYPE_CODES[asset.asset_type], asset.id
+                )
+
+            asset_ids = database._asset_ids.tolist()
+
+            for start in range(0, len(asset_ids), page_size):
+                asset_versions = data_store.list_asset_versions_for(
+                    asset_ids[start : start + page_size]
+                )
+
+                for asset_id, versions in asset_versions.items():
+                    for asset_version in versions:
+                        database._insert_asset_version(
+                            asset_id,
+                            asset_version.department,
+                            asset_version.version,
+                            asset_version.status,
+                        )
+
+        LOGGER.debug(
+            "Copied %s assets and %s asset versions",
+            len(database._asset_ids),
+            len(database._version_numbers),
+        )
+
+        return database
+
+    @classmethod
+    def from_sqlite(
+        cls, path: str, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> "ArrayDatabase":
+        """Load every asset and asset version of a SQLite data store.
+
+        Args:
+            path (str): The location of the SQLite data store.
+            page_size (int): The number of assets read from the data store at a time.
+
+        Returns:
+            ArrayDatabase: The populated database.
+        """
+
+        sqlite_database = SQLiteDatabase(path)
+
+        try:
+            return cls.from_data_store(sqlite_database, page_size=page_size)
+        finally:
+            sqlite_database.close()
+
+    def add_asset(self, asset: Asset) -> Asset:
+        """Add an asset to the database.
+
+        Args:
+            asset (Asset): The asset to add.
+
+        Returns:
+            Asset: The newly added asset.
+
+        Raises:
+            sqlite3.IntegrityError: If an asset of the same name and type exists.
+        """
+
+        LOGGER.debug("Adding asset for %s", asset.name)
+
+        with self._lock:
+            asset.id = self._insert_asset(
+                asset.name, ASSET_TYPE_CODES[asset.asset_type]
+            )
+
+        return asset
+
+    def add_asset_version(
+        self, asset: Asset, asset_version: AssetVersion
+    ) -> AssetVersion:
+        """Add an asset version to the database.
+
+        Args:
+            asset (Asset): The asset to reference.
+            asset_version (AssetVersion): The asset version to add. A version of None
+                is allocated the number following the latest of the asset.
+
+        Returns:
+            AssetVersion: The newly added asset version.
+
+        Raises:
+            sqlite3.IntegrityError: If the asset does not exist, or already has the
+                version within the department.
+        """
+
+        LOGGER.debug("Adding asset version for %s", asset.name)
+
+        if asset.id is None:
+            raise ValueError("Asset versions must be associated with a valid asset id.")
+
+        with self._lock:
+            return self._insert_asset_version(
+                asset.id,
+                asset_version.department,
+                asset_version.version,
+                asset_version.status,
+            )
+
+    def add_asset_versions_bulk(
+        self,
+        entries: Sequence[tuple[Asset, AssetVersion]],
+        fingerprints: Optional[Sequence[int]] = None,
+    ) -> list[Union[AssetVersion, sqlite3.IntegrityError]]:
+        """Add many assets and asset versions to the database at once.
+
+        Assets are inserted when they do not already exist and resolved to their ids.
+        An asset version that is not unique fails alone without discarding the rest.
+
+        Args:
+            entries (Sequence[tuple[Asset, AssetVersion]]): The assets and the asset
+                versions to add for them.
+            fingerprints (Sequence[int] | None): The fingerprints of the manifest
+                records the entries were loaded from, if any, recorded as imported.
+
+        Returns:
+            list[AssetVersion | sqlite3.IntegrityError]: The newly added asset version,
+                or the error that prevented it from being added, for each entry.
+        """
+
+        LOGGER.debug("Adding %s asset versions in bulk", len(entries))
+
+        results: list[Union[AssetVersion, sqlite3.IntegrityError]] = []
+
+        with self._lock:
+            for asset, asset_version in entries:
+                asset_type_code = ASSET_TYPE_CODES[asset.asset_type]
+                row = self._find_asset_row(asset.name, asset_type_code)
+
+                if row is None:
+                    asset.id = self._insert_asset(asset.name, asset_type_code)
+                else:
+                    asset.id = self._asset_ids[row]
+
+                try:
+                    results.append(
+                        self._insert_asset_version(
+                            asset.id,
+                            asset_version.department,
+                            asset_version.version,
+                            asset_version.status,
+                        )
+                    )
+                except sqlite3.IntegrityError as error:
+                    results.append(error)
+
+            if fingerprints:
+                self._record_fingerprints.update(fingerprints)
+
+        return results
+
+    def get_asset(self, name: str) -> Optional[Asset]:
+        """Get the asset corresponding to the provided asset name.
+
+        Args:
+            name (str): The name of the asset to get.
+
+        Returns:
+            Asset | None: The asset corresponding to the provided asset name, or None if
+                not found. When assets of several types share the name, the first by
+                type is returned.
+        """
+
+        row = self._asset_rows_by_name.get(name)
+
+        return None if row is None else self._asset_from_row(row)
+
+    def get_assets(self, keys: Iterable[AssetKey]) -> dict[AssetKey, Asset]:
+        """Get many assets at once, by name or by name and type.
+
+        Args:
+            keys (Iterable[str | tuple[str, AssetType]]): The asset names, or asset
+                name and type pairs, to get.
+
+        Returns:
+            dict[str | tuple[str, AssetType], Asset]: The asset found for each key.
+                Keys without a matching asset are omitted. A name matching assets of
+                several types resolves to the first by type, as with get_asset.
+        """
+
+        assets: dict[AssetKey, Asset] = {}
+
+        for key in keys:
+            if isinstance(key, tuple):
+                name, asset_type = key
+                key = (name, AssetType(asset_type))
+                row = self._find_asset_row(name, asset_type_code(asset_type))
+            else:
+                row = self._asset_rows_by_name.get(key)
+
+            if row is not None:
+                assets[key] = self._asset_from_row(row)
+
+        return assets
+
+    def get_asset_version(self, asset_id: int, version: int) -> Optional[AssetVersion]:
+        """Get the asset version corresponding to the provided asset id.
+
+        Args:
+            asset_id (int): The asset id necessary to retrieve all associated versions.
+            version (int): The specific version to get.
+
+        Returns:
+            AssetVersion | None: The asset version corresponding to the provided asset
+            id, or None if not found.
+        """
+
+        if not 0 <= version <= _MAX_VERSION:
+            return None
+
+        row = self._version_rows.get(asset_id << _VERSION_BITS | version)
+
+        return None if row is None else self._asset_version_from_row(row)
+
+    def get_last_asset_version_number(self, asset_id: int) -> Optional[int]:
+        """Get the last asset version number.
+
+        Args:
+            asset_id (int): The asset id necessary to retrieve the last asset version
+                number.
+
+        Returns:
+            int: The last asset version number.
+        """
+
+        return max(
+            (self._version_numbers[row] for row in self._iter_version_rows(asset_id)),
+            default=None,
+        )
+
+    def list_assets(self) -> list[Asset]:
+        """List all assets.
+
+        Returns:
+            list[Asset]: All asset entries within the database.
+        """
+
+        return [self._asset_from_row(row) for row in self._get_sorted_asset_rows()]
+
+    def list_assets_page(
+        self, page_token: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Page[Asset]:
+        """List a single page of assets, ordered by name and type.
+
+        Args:
+            page_token (str | None): The token of the page to list, or None for the
+                first page.
+            page_size (int): The most assets returned within the page.
+
+        Returns:
+            Page[Asset]: The assets within the page and the token of the next page.
+        """
+
+        if page_size < 1:
+            raise ValueError("Page size must be greater than or equal to 1.")
+
+        sorted_rows = self._get_sorted_asset_rows()
+        start = 0
+
+        if page_token is not None:
+            # Page tokens hold the type value rather than its code
+            name, asset_type = decode_page_token(page_token, 2)
+            start = bisect_right(
+                sorted_rows,
+                (name, asset_type_code(asset_type)),
+                key=self._asset_sort_key,
+            )
+
+        rows = sorted_rows[start : start + page_size + 1]
+        page = Page([self._asset_from_row(row) for row in rows[:page_size]])
+
+        if len(rows) > page_size:
+            last_asset = page.items[-1]
+            page.next_page_token = encode_page_token(
+                last_asset.name, last_asset.asset_type.value
+            )
+
+        return page
+
+    def iter_assets(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Asset]:
+        """Iterate all assets, ordered by name and type, one page at a time.
+
+        Args:
+            page_size (int): The number of assets built per page.
+
+        Yields:
+            Asset: Each asset within the database.
+        """
+
+        page = self.list_assets_page(page_size=page_size)
+        yield from page.items
+
+        while page.next_page_token is not None:
+            page = self.list_assets_page(page.next_page_token, page_size=page_size)
+            yield from page.items
+
+    def list_asset_versions(self, asset_id: int) -> list[AssetVersion]:
+        """List all asset versions for a specific asset.
+
+        Args:
+            asset_id (int): The id necessary to retrieve all associated versions.
+
+        Returns:
+            list[AssetVersion]: All asset versions corresponding to an asset with the
+                provided id, ordered by department and version.
+        """
+
+        return [
+            self._asset_version_from_row(row)
+            for row in self._sorted_version_rows(asset_id)
+        ]
+
+    def list_asset_versions_page(
+        self,
+        asset_id: int,
+        page_token: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[AssetVersion]:
+        """List a single page of asset versions for a specific asset.
+
+        Args:
+            asset_id (int): The id necessary to retrieve all associated versions.
+            page_token (str | None): The token of the page to list, or None for the
+                first page.
+            page_size (int): The most asset versions returned within the page.
+
+        Returns:
+            Page[AssetVersion]: The asset versions within the page and the token of the
+                next page.
+        """
+
+        if page_size < 1:
+            raise ValueError("Page size must be greater than or equal to 1.")
+
+        sorted_rows = self._sorted_version_rows(asset_id)
+        start = 0
+
+        if page_token is not None:
+            department, version = decode_page_token(page_token, 2)
+            start = bisect_right(
+                sorted_rows, (department, version), key=self._version_sort_key
+            )
+
+        rows = sorted_rows[start : start + page_size + 1]
+        page = Page([self._asset_version_from_row(row) for row in rows[:page_size]])
+
+        if len(rows) > page_size:
+            last_asset_version = page.items[-1]
+            page.next_page_token = encode_page_token(
+                last_asset_version.department, last_asset_version.version
+            )
+
+        return page
+
+    def iter_asset_versions(
+        self, asset_id: int, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[AssetVersion]:
+        """Iterate all asset versions for a specific asset, one page at a time.
+
+        Args:
+            asset_id (int): The id necessary to retrieve all associated versions.
+            page_size (int): The number of asset versions built per page.
+
+        Yields:
+            AssetVersion: Each asset version of the asset.
+        """
+
+        rows = iter(self._sorted_version_rows(asset_id))
+
+        while page_rows := list(islice(rows, page_size)):
+            yield from (self._asset_version_from_row(row) for row in page_rows)
+
+    def list_asset_versions_for(
+        self, asset_ids: Iterable[int]
+    ) -> dict[int, list[AssetVersion]]:
+        """List all asset versions for many assets at once.
+
+        Args:
+            asset_ids (Iterable[int]): The ids of the assets to list versions for.
+
+        Returns:
+            dict[int, list[AssetVersion]]: The asset versions of each asset, ordered as
+                by list_asset_versions. Assets without versions map to an empty list.
+        """
+
+        return {asset_id: self.list_asset_versions(asset_id) for asset_id in asset_ids}
+
+    def iter_asset_rows(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[AssetRow]:
+        """Iterate every asset as a raw row, in id order.
+
+        Args:
+            page_size (int): Unused, as every row is already in memory.
+
+        Yields:
+            tuple[int, str, str]: The id, name and type value of each asset.
+        """
+
+        if page_size < 1:
+            raise ValueError("Page size must be greater than or equal to 1.")
+
+        asset_rows_by_id = self._asset_rows_by_id
+
+        for asset_id in range(len(asset_rows_by_id)):
+            row = asset_rows_by_id[asset_id]
+
+            if row != _NO_ROW:
+                yield (
+                    asset_id,
+                    self._asset_names[row],
+                    ASSET_TYPE_VALUES[self._asset_types[row]],
+                )
+
+    def iter_asset_version_rows(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[AssetVersionRow]:
+        """Iterate every asset version as a raw row, in the order added.
+
+        Args:
+            page_size (int): Unused, as every row is already in memory.
+
+        Yields:
+            tuple[int, str, int, str]: The asset id, department, version and status
+                value of each asset version.
+        """
+
+        if page_size < 1:
+            raise ValueError("Page size must be greater than or equal to 1.")
+
+        departments = self._departments
+
+        for row in range(len(self._version_numbers)):
+            yield (
+                self._version_asset_ids[row],
+                departments[self._version_departments[row]],
+                self._version_numbers[row],
+                VERSION_STATUS_VALUES[self._version_statuses[row]],
+            )
+
+    def iter_manifest_rows(
+        self,
+        asset_types: Optional[Iterable[Union[AssetType, str]]] = None,
+        departments: Optional[Iterable[str]] = None,
+        statuses: Optional[Iterable[Union[VersionStatus, str]]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[ManifestRow]:
+        """Iterate every asset version joined with its asset, in the order added.
+
+        Filters are compared as codes, so departments are never compared by name.
+        Assets without any versions are not included.
+
+        Args:
+            asset_types (Iterable[AssetType | str] | None): Only include the versions
+                of assets of these types, or None for every type.
+            departments (Iterable[str] | None): Only include versions of these
+                departments, or None for every department.
+            statuses (Iterable[VersionStatus | str] | None): Only include versions with
+                these statuses, or None for every status.
+            page_size (int): Unused, as every row is already in memory.
+
+        Yields:
+            tuple[str, str, str, int, str]: The asset name and type value, and the
+                department, version and status value of each asset version.
+
+        Raises:
+            ValueError: If the page size is less than 1, or an asset type or status is
+                not known.
+        """
+
+        if page_size < 1:
+            raise ValueError("Page size must be greater than or equal to 1.")
+
+        type_codes = _code_filter(asset_types, asset_type_code)
+        status_codes = _code_filter(statuses, version_status_code)
+        department_codes = (
+            None
+            if departments is None
+            else {
+                self._department_codes[department]
+                for department in departments
+                if department in self._department_codes
+            }
+        )
+
+        asset_rows_by_id = self._asset_rows_by_id
+        asset_names = self._asset_names
+        asset_types_column = self._asset_types
+        department_names = self._departments
+        version_asset_ids = self._version_asset_ids
+        version_departments = self._version_departments
+        version_numbers = self._version_numbers
+        version_statuses = self._version_statuses
+
+        for row in range(len(version_numbers)):
+            asset_id = version_asset_ids[row]
+
+            # Versions of assets that do not exist are skipped, as by SQLite's join
+            if asset_id >= len(asset_rows_by_id):
+                continue
+
+            asset_row = asset_rows_by_id[asset_id]
+
+            if asset_row == _NO_ROW:
+                continue
+
+            type_code = asset_types_column[asset_row]
+            department_code = version_departments[row]
+            status_code = version_statuses[row]
+
+            if (
+                (type_codes is not None and type_code not in type_codes)
+                or (
+                    department_codes is not None
+                    and department_code not in department_codes
+                )
+                or (status_codes is not None and status_code not in status_codes)
+            ):
+                continue
+
+            yield (
+                asset_names[asset_row],
+                ASSET_TYPE_VALUES[type_code],
+                department_names[department_code],
+                version_numbers[row],
+                VERSION_STATUS_VALUES[status_code],
+            )
+
+    def find_record_fingerprints(self, fingerprints: Iterable[int]) -> set[int]:
+        """Find which manifest record fingerprints have already been imported.
+
+        Args:
+            fingerprints (Iterable[int]): The fingerprints to look for.
+
+        Returns:
+            set[int]: The fingerprints that were recorded by an earlier import.
+        """
+
+        return self._record_fingerprints.intersection(fingerprints)
+
+    def has_imported_file(self, content_hash: str) -> bool:
+        """Check whether a file with the same content has been imported.
+
+        Args:
+            content_hash (str): The hash of the content of the file.
+
+        Returns:
+            bool: True if a file with this content was imported before.
+        """
+
+        return content_hash in self._imported_files
+
+    def add_imported_file(self, content_hash: str, file_path: str, rows: int) -> None:
+        """Record that a file has been imported, so its content can be skipped.
+
+        Args:
+            content_hash (str): The hash of the content of the file.
+            file_path (str): The path the file was imported from.
+            rows (int): The number of entries within the file.
+        """
+
+        with self._lock:
+            self._imported_files[content_hash] = (str(file_path), rows)
+
+    def close(self) -> None:
+        """Release every row held by the database."""
+
+        with self._lock:
+            self._reset()
+
+    def _insert_asset(
+        self, name: str, asset_type_code: int, asset_id: Optional[int] = None
+    ) -> int:
+        # Callers must hold the lock
+        if self._find_asset_row(name, asset_type_code) is not None:
+            raise sqlite3.IntegrityError(
+                "UNIQUE constraint failed: assets.name, assets.type_id"
+            )
+
+        if asset_id is None:
+            asset_id = self._next_asset_id
+
+        # Ids are never reused, as with SQLite's AUTOINCREMENT
+        self._next_asset_id = max(self._next_asset_id, asset_id + 1)
+
+        self._asset_ids.append(asset_id)
+        self._asset_names.append(name)
+        self._asset_types.append(asset_type_code)
+
+        row = len(self._asset_ids) - 1
+
+        if asset_id >= len(self._asset_rows_by_id):
+            self._asset_rows_by_id.extend(
+                [_NO_ROW] * (asset_id + 1 - len(self._asset_rows_by_id))
+            )
+
+        self._asset_rows_by_id[asset_id] = row
+
+        # Publish the row through the name index only once every column is written
+        existing_row = self._asset_rows_by_name.get(name)
+
+        if existing_row is None:
+            self._asset_rows_by_name[name] = row
+        else:
+            shared_rows = sorted(
+                self._shared_asset_rows.get(name, [existing_row]) + [row],
+                key=self._asset_types.__getitem__,
+            )
+            self._shared_asset_rows[name] = shared_rows
+            self._asset_rows_by_name[name] = shared_rows[0]
+
+        # Readers may be paging through the current order, so it is replaced rather
+        # than updated. It is only rebuilt by the next listing, so bulk inserts after a
+        # listing cost nothing extra.
+        self._sorted_asset_rows = None
+
+        return asset_id
+
+    def _insert_asset_version(
+        self,
+        asset_id: int,
+        department: str,
+        version: Optional[int],
+        status: VersionStatus,
+    ) -> AssetVersion:
+        # Callers must hold the lock
+        if asset_id < 0:
+            raise ValueError("Asset ids must be greater than or equal to 0.")
+
+        if (
+            asset_id >= len(self._asset_rows_by_id)
+            or self._asset_rows_by_id[asset_id] == _NO_ROW
+        ):
+            raise sqlite3.IntegrityError("FOREIGN KEY constraint failed")
+
+        if version is None:
+            version = (self.get_last_asset_version_number(asset_id) or 0) + 1
+        elif not 0 <= version <= _MAX_VERSION:
+            raise ValueError(
+                "Asset version numbers must be between 0 and {}.".format(_MAX_VERSION)
+            )
+
+        department_code = self._department_codes.get(department)
+        key = asset_id << _VERSION_BITS | version
+        existing_row = self._version_rows.get(key)
+
+        if existing_row is not None and department_code is not None:
+            for row in self._iter_version_rows(asset_id):
+                if (
+                    self._version_numbers[row] == version
+                    and self._version_departments[row] == department_code
+                ):
+                    raise sqlite3.IntegrityError(
+                        "UNIQUE constraint failed: asset_versions.asset_id, "
+                        "asset_versions.department_id, asset_versions.version"
+                    )
+
+        if department_code is None:
+            department_code = len(self._departments)
+            self._departments.append(department)
+            self._department_codes[department] = department_code
+
+        self._version_asset_ids.append(asset_id)
+        self._version_departments.append(department_code)
+        self._version_numbers.append(version)
+        self._version_statuses.append(VERSION_STATUS_CODES[status])
+        self._previous_version_rows.append(self._last_version_row(asset_id))
+
+        row = len(self._version_numbers) - 1
+
+        if asset_id >= len(self._last_version_rows):
+            self._last_version_rows.extend(
+                [_NO_ROW] * (asset_id + 1 - len(self._last_version_rows))
+            )
+
+        self._last_version_rows[asset_id] = row
+
+        # Lookups by version resolve to the first department, as SQLite's index does
+        if (
+            existing_row is None
+            or department < self._departments[self._version_departments[existing_row]]
+        ):
+            self._version_rows[key] = row
+
+        return AssetVersion(asset_id, department, version=version, status=status)
+
+    def _find_asset_row(self, name: str, asset_type_code: int) -> Optional[int]:
+        shared_rows = self._shared_asset_rows.get(name)
+
+        if shared_rows is None:
+            row = self._asset_rows_by_name.get(name)
+            shared_rows = [] if row is None else [row]
+
+        for row in shared_rows:
+            if self._asset_types[row] == asset_type_code:
+                return row
+
+        return None
+
+    def _asset_from_row(self, row: int) -> Asset:
+        return Asset(
+            self._asset_names[row],
+            ASSET_TYPES[self._asset_types[row]],
+            id=self._asset_ids[row],
+        )
+
+    def _asset_sort_key(self, row: int) -> tuple[str, int]:
+        return self._asset_names[row], self._asset_types[row]
+
+    def _get_sorted_asset_rows(self) -> list[int]:
+        sorted_rows = self._sorted_asset_rows
+
+        if sorted_rows is None:
+            with self._lock:
+                if self._sorted_asset_rows is None:
+                    self._sorted_asset_rows = sorted(
+                        range(len(self._asset_ids)), key=self._asset_sort_key
+                    )
+
+                sorted_rows = self._sorted_asset_rows
+
+        return sorted_rows
+
+    def _last_version_row(self, asset_id: int) -> int:
+        if 0 <= asset_id < len(self._last_version_rows):
+            return self._last_version_rows[asset_id]
+
+        return _NO_ROW
+
+    def _iter_version_rows(self, asset_id: int) -> Iterator[int]:
+        row = self._last_version_row(asset_id)
+
+        while row != _NO_ROW:
+            yield row
+            row = self._previous_version_rows[row]
+
+    def _sorted_version_rows(self, asset_id: int) -> list[int]:
+        return sorted(self._iter_version_rows(asset_id), key=self._version_sort_key)
+
+    def _version_sort_key(self, row: int) -> tuple[str, int]:
+        return (
+            self._departments[self._version_departments[row]],
+            self._version_numbers[row],
+        )
+
+    def _asset_version_from_row(self, row: int) -> AssetVersion:
+        return AssetVersion(
+            self._version_asset_ids[row],
+            self._departments[self._version_departments[row]],
+            version=self._version_numbers[row],
+            status=VERSION_STATUSES[self._version_statuses[row]],
+        )
+
+
+def _code_filter(
+    values: Optional[Iterable], code: Callable[[Any], int]
+) -> Optional[set[int]]:
+    # No filter is applied for None, while an empty filter matches nothing
+    return None if values is None else {code(value) for value in values}
@@ -0,0 +1,73 @@
+from typing import Union
+
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+
+
+# Enum members are stored as small integer codes rather than their values. Codes are
+# persisted, so existing codes must never change. A new member is appended with the
+# next code, along with a migration adding it to the lookup tables. Codes of the
+# original members follow the order of their values, so ordering by code matches the
+# ordering by value of earlier releases.
+ASSET_TYPE_CODES: dict[AssetType, int] = {
+    AssetType.CHARACTER: 0,
+    AssetType.DRESSING: 1,
+    AssetType.ENVIRONMENT: 2,
+    AssetType.FX: 3,
+    AssetType.PROP: 4,
+    AssetType.SET: 5,
+    AssetType.VEHICLE: 6,
+}
+
+VERSION_STATUS_CODES: dict[VersionStatus, int] = {
+    VersionStatus.ACTIVE: 0,
+    VersionStatus.INACTIVE: 1,
+}
+
+# The member of each code, indexed by code, to map rows back to enums without a lookup
+# by value
+ASSET_TYPES: tuple[AssetType, ...] = tuple(
+    sorted(ASSET_TYPE_CODES, key=ASSET_TYPE_CODES.__getitem__)
+)
+VERSION_STATUSES: tuple[VersionStatus, ...] = tuple(
+    sorted(VERSION_STATUS_CODES, key=VERSION_STATUS_CODES.__getitem__)
+)
+
+# The value of each code, indexed by code, for rows returned without building enums
+ASSET_TYPE_VALUES: tuple[str, ...] = tuple(
+    asset_type.value for asset_type in ASSET_TYPES
+)
+VERSION_STATUS_VALUES: tuple[str, ...] = tuple(
+    status.value for status in VERSION_STATUSES
+)
+
+
+def asset_type_code(asset_type: Union[AssetType, str]) -> int:
+    """Get the code of an asset type.
+
+    Args:
+        asset_type (AssetType | str): The asset type, or its value.
+
+    Returns:
+        int: The code of the asset type.
+
+    Raises:
+        ValueError: If the value is not a known asset type.
+    """
+
+    return ASSET_TYPE_CODES[AssetType(asset_type)]
+
+
+def version_status_code(status: Union[VersionStatus, str]) -> int:
+    """Get the code of a version status.
+
+    Args:
+        status (VersionStatus | str): The version status, or its value.
+
+    Returns:
+        int: The code of the version status.
+
+    Raises:
+        ValueError: If the value is not a known version status.
+    """
+
+    return VERSION_STATUS_CODES[VersionStatus(status)]
@@ -0,0 +1,127 @@
+import sqlite3
+import threading
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from otherworld_asset_service.utils import logger
+
+
+LOGGER = logger.get_logger("ConnectionManager")
+
+# The number of milliseconds a connection waits on a locked database before failing
+DEFAULT_BUSY_TIMEOUT = 5000
+
+IN_MEMORY_PATH = ":memory:"
+
+
+class ConnectionManager:
+    """Hands out SQLite connections so a database can be used from many threads.
+
+    File databases give each thread its own connection in WAL mode, allowing any number
+    of readers to run alongside a single writer. Writers are serialized through a shared
+    lock so only one thread writes at a time.
+
+    An in-memory database only exists for the connection that created it, so every
+    thread shares that one connection and all access is serialized instead.
+
+    Args:
+        path (str): The location of the data store, or ":memory:" for an in-memory
+            database.
+        busy_timeout (int): The number of milliseconds to wait on a locked database.
+    """
+
+    def __init__(
+        self, path: str = IN_MEMORY_PATH, busy_timeout: int = DEFAULT_BUSY_TIMEOUT
+    ) -> None:
+        self._path = str(path)
+        self._busy_timeout = busy_timeout
+        self._in_memory = self._path == IN_MEMORY_PATH
+
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        # Reentrant so a write may perform reads through the same manager
+        self._write_lock = threading.RLock()
+
+        self._shared_connection = self._connect() if self._in_memory else None
+
+    def _connect(self) -> sqlite3.Connection:
+        LOGGER.debug("Opening connection to %s", self._path)
+
+        # Connections are only ever used by the thread they belong to, or under the
+        # write lock, but may be closed from whichever thread closes the manager
+        connection = sqlite3.connect(self._path, check_same_thread=False)
+
+        # Rows are left as plain tuples, which are far cheaper to build and unpack
+        # positionally than sqlite3.Row
+
+        connection.execute("PRAGMA busy_timeout = {:d}".format(self._busy_timeout))
+
+        if not self._in_memory:
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+
+        with self._connections_lock:
+            self._connections.append(connection)
+
+        return connection
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._shared_connection is not None:
+            return self._shared_connection
+
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None:
+            connection = self._connect()
+            self._local.connection = connection
+
+        return connection
+
+    @contextmanager
+    def reading(self) -> Iterator[sqlite3.Connection]:
+        """Provide a connection to read from.
+
+        Yields:
+            sqlite3.Connection: The connection for the current thread.
+        """
+
+        if self._in_memory:
+            with self._write_lock:
+                yield self._get_connection()
+        else:
+            yield self._get_connection()
+
+    @contextmanager
+    def writing(self) -> Iterator[sqlite3.Connection]:
+        """Provide a connection to write with, holding the write lock until done.
+
+        Any transaction left open by a failed write is rolled back so it does not keep
+        the database locked.
+
+        Yields:
+            sqlite3.Connection: The connection for the current thread.
+        """
+
+        with self._write_lock:
+            connection = self._get_connection()
+
+            try:
+                yield connection
+            except BaseException:
+                connection.rollback()
+                raise
+
+    def close(self) -> None:
+        """Safely close every connection opened by the manager."""
+
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+
+        for connection in connections:
+            connection.close()
+
+        self._local = threading.local()
+        self._shared_connection = None
@@ -0,0 +1,118 @@
+import sqlite3
+
+from typing import Iterable, Iterator, Optional, Protocol, Sequence, Union
+
+from otherworld_asset_service.models.asset import Asset
+from otherworld_asset_service.models.asset_version import AssetVersion
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+from otherworld_asset_service.storage.pagination import DEFAULT_PAGE_SIZE, Page
+
+
+# An asset is looked up by its name alone, or disambiguated by its name and type
+AssetKey = Union[str, tuple[str, AssetType]]
+
+# Raw rows skip building models, holding an asset's id, name and type value, and an
+# asset version's asset id, department, version and status value
+AssetRow = tuple[int, str, str]
+AssetVersionRow = tuple[int, str, int, str]
+
+# A raw asset version joined with its asset, holding every field of a manifest entry:
+# the asset's name and type value, then the department, version and status value
+ManifestRow = tuple[str, str, str, int, str]
+
+
+class AssetDataStore(Protocol):
+    """The persistence layer OtherWorldAssetService stores assets and versions within.
+
+    Every backend behaves as SQLiteDatabase does, including raising
+    sqlite3.IntegrityError for an asset or asset version that is not unique, so
+    backends can be swapped without changing the service.
+    """
+
+    def add_asset(self, asset: Asset) -> Asset:
+        ...
+
+    def add_asset_version(
+        self, asset: Asset, asset_version: AssetVersion
+    ) -> AssetVersion:
+        ...
+
+    def add_asset_versions_bulk(
+        self,
+        entries: Sequence[tuple[Asset, AssetVersion]],
+        fingerprints: Optional[Sequence[int]] = None,
+    ) -> list[Union[AssetVersion, sqlite3.IntegrityError]]:
+        ...
+
+    def get_asset(self, name: str) -> Optional[Asset]:
+        ...
+
+    def get_assets(self, keys: Iterable[AssetKey]) -> dict[AssetKey, Asset]:
+        ...
+
+    def get_asset_version(self, asset_id: int, version: int) -> Optional[AssetVersion]:
+        ...
+
+    def get_last_asset_version_number(self, asset_id: int) -> Optional[int]:
+        ...
+
+    def list_assets(self) -> list[Asset]:
+        ...
+
+    def list_assets_page(
+        self, page_token: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Page[Asset]:
+        ...
+
+    def iter_assets(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Asset]:
+        ...
+
+    def list_asset_versions(self, asset_id: int) -> list[AssetVersion]:
+        ...
+
+    def list_asset_versions_page(
+        self,
+        asset_id: int,
+        page_token: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[AssetVersion]:
+        ...
+
+    def iter_asset_versions(
+        self, asset_id: int, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[AssetVersion]:
+        ...
+
+    def list_asset_versions_for(
+        self, asset_ids: Iterable[int]
+    ) -> dict[int, list[AssetVersion]]:
+        ...
+
+    def iter_asset_rows(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[AssetRow]:
+        ...
+
+    def iter_asset_version_rows(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[AssetVersionRow]:
+        ...
+
+    def iter_manifest_rows(
+        self,
+        asset_types: Optional[Iterable[Union[AssetType, str]]] = None,
+        departments: Optional[Iterable[str]] = None,
+        statuses: Optional[Iterable[Union[VersionStatus, str]]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[ManifestRow]:
+        ...
+
+    def find_record_fingerprints(self, fingerprints: Iterable[int]) -> set[int]:
+        ...
+
+    def has_imported_file(self, content_hash: str) -> bool:
+        ...
+
+    def add_imported_file(self, content_hash: str, file_path: str, rows: int) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
@@ -0,0 +1,280 @@
+import sqlite3
+
+from dataclasses import dataclass
+
+from otherworld_asset_service.utils import logger
+
+
+LOGGER = logger.get_logger("Migrations")
+
+
+@dataclass(frozen=True, slots=True)
+class Migration:
+    """A single, ordered change to the database schema.
+
+    The schema version of a database is stored in PRAGMA user_version, so a migration
+    is only ever applied to databases older than its version.
+
+    Args:
+        version (int): The schema version the database is at once applied.
+        description (str): A short summary of the change.
+        statements (tuple[str, ...]): The SQL statements making up the change.
+    """
+
+    version: int
+    description: str
+    statements: tuple[str, ...]
+
+
+# Every schema change in order. Existing migrations must never be edited once released,
+# only new ones appended.
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        version=1,
+        description="Create the assets and asset versions tables",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS assets (
+                asset_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                type TEXT NOT NULL,
+                UNIQUE(name, type)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS asset_versions (
+                asset_id INTEGER NOT NULL,
+                department TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                FOREIGN KEY(asset_id) REFERENCES assets(asset_id),
+                UNIQUE(asset_id, department, version)
+            )
+            """,
+        ),
+    ),
+    Migration(
+        version=2,
+        description="Add covering indexes for asset version lookups and listings",
+        statements=(
+            # Serves lookups by version number and the latest version number of an
+            # asset without touching the table
+            """
+            CREATE INDEX IF NOT EXISTS idx_asset_versions_by_version
+            ON asset_versions (asset_id, version, department, status)
+            """,
+            # Serves listing the versions of an asset already in display order
+            """
+            CREATE INDEX IF NOT EXISTS idx_asset_versions_by_department
+            ON asset_versions (asset_id, department, version, status)
+            """,
+        ),
+    ),
+    Migration(
+        version=3,
+        description="Store asset types, statuses and departments as integer codes",
+        statements=(
+            # Lookup tables of the codes, see codes.py
+            """
+            CREATE TABLE asset_types (
+                type_id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            )
+            """,
+            """
+            INSERT INTO asset_types (type_id, name) VALUES
+                (0, 'character'),
+                (1, 'dressing'),
+                (2, 'environment'),
+                (3, 'fx'),
+                (4, 'prop'),
+                (5, 'set'),
+                (6, 'vehicle')
+            """,
+            """
+            CREATE TABLE version_statuses (
+                status_id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            )
+            """,
+            """
+            INSERT INTO version_statuses (status_id, name) VALUES
+                (0, 'active'),
+                (1, 'inactive')
+            """,
+            # Departments are free text, so each is interned once as it is first used
+            """
+            CREATE TABLE departments (
+                department_id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            )
+            """,
+            """
+            INSERT INTO departments (name)
+            SELECT DISTINCT department FROM asset_versions ORDER BY department
+            """,
+            # SQLite cannot change the type of a column, so both tables are rebuilt. A
+            # value without a code is copied as NULL, failing the migration rather than
+            # dropping the row.
+            """
+            CREATE TABLE assets_v3 (
+                asset_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                type_id INTEGER NOT NULL REFERENCES asset_types(type_id),
+                UNIQUE(name, type_id)
+            )
+            """,
+            """
+            INSERT INTO assets_v3 (asset_id, name, type_id)
+            SELECT
+                asset_id,
+                name,
+                (SELECT type_id FROM asset_types WHERE asset_types.name = assets.type)
+            FROM assets
+            """,
+            """
+            CREATE TABLE asset_versions_v3 (
+                asset_id INTEGER NOT NULL REFERENCES assets(asset_id),
+                department_id INTEGER NOT NULL REFERENCES departments(department_id),
+                version INTEGER NOT NULL,
+                status_id INTEGER NOT NULL REFERENCES version_statuses(status_id),
+                UNIQUE(asset_id, department_id, version)
+            )
+            """,
+            """
+            INSERT INTO asset_versions_v3 (asset_id, department_id, version, status_id)
+            SELECT
+                asset_id,
+                (
+                    SELECT department_id FROM departments
+                    WHERE departments.name = asset_versions.department
+                ),
+                version,
+                (
+                    SELECT status_id FROM version_statuses
+                    WHERE version_statuses.name = asset_versions.status
+                )
+            FROM asset_versions
+            """,
+            "DROP TABLE asset_versions",
+            "DROP TABLE assets",
+            "ALTER TABLE assets_v3 RENAME TO assets",
+            "ALTER TABLE asset_versions_v3 RENAME TO asset_versions",
+            # Serves lookups by version number and the latest version number of an
+            # asset without touching the table. Listings are served by the unique
+            # index, then ordered by department name.
+            """
+            CREATE INDEX idx_asset_versions_by_version
+            ON asset_versions (asset_id, version, department_id, status_id)
+            """,
+        ),
+    ),
+    Migration(
+        version=4,
+        description="Record imported files and manifest records for incremental loads",
+        statements=(
+            """
+            CREATE TABLE imported_files (
+                content_hash TEXT PRIMARY KEY,
+                file_path TEXT NOT NULL,
+                rows INTEGER NOT NULL,
+                imported_at REAL NOT NULL
+            )
+            """,
+            # A 64-bit fingerprint is stored as the rowid itself, so each record costs
+            # a single integer with no separate index
+            """
+            CREATE TABLE imported_records (
+                fingerprint INTEGER PRIMARY KEY
+            )
+            """,
+        ),
+    ),
+)
+
+# The schema version of a database with every migration applied
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def get_schema_version(connection: sqlite3.Connection) -> int:
+    """Get the schema version of a database.
+
+    Args:
+        connection (sqlite3.Connection): The connection to the database.
+
+    Returns:
+        int: The schema version, or 0 for a database that has never been migrated.
+    """
+
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def apply_migrations(connection: sqlite3.Connection) -> int:
+    """Upgrade a database in place by applying every migration it is missing.
+
+    Each migration runs in its own transaction together with the schema version update,
+    so an interrupted upgrade leaves the database at the last completed version. The
+    schema version is read again within each transaction, so connections upgrading
+    the same database at once apply every migration exactly once.
+
+    Args:
+        connection (sqlite3.Connection): The connection to the database.
+
+    Returns:
+        int: The schema version of the database once upgraded.
+
+    Raises:
+        RuntimeError: If the database was created by a newer version of the service.
+    """
+
+    schema_version = _check_schema_version(connection)
+
+    for migration in MIGRATIONS:
+        if migration.version <= schema_version:
+            continue
+
+        cursor = connection.cursor()
+
+        cursor.execute("BEGIN IMMEDIATE")
+
+        try:
+            # Another connection may have migrated the database since it was last read,
+            # so check again now that no other writer can
+            schema_version = _check_schema_version(connection)
+
+            if migration.version <= schema_version:
+                connection.rollback()
+                continue
+
+            LOGGER.debug(
+                "Migrating database schema to version %s: %s",
+                migration.version,
+                migration.description,
+            )
+
+            for statement in migration.statements:
+                cursor.execute(statement)
+
+            cursor.execute("PRAGMA user_version = {:d}".format(migration.version))
+
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+
+        schema_version = migration.version
+
+    return schema_version
+
+
+def _check_schema_version(connection: sqlite3.Connection) -> int:
+    schema_version = get_schema_version(connection)
+
+    if schema_version > SCHEMA_VERSION:
+        raise RuntimeError(
+            "Database schema version {} is newer than the supported version {}.".format(
+                schema_version, SCHEMA_VERSION
+            )
+        )
+
+    return schema_version
@@ -0,0 +1,64 @@
+import base64
+import binascii
+import json
+
+from dataclasses import dataclass, field
+from typing import Any, Generic, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+# The number of rows returned per page when no page size is provided
+DEFAULT_PAGE_SIZE = 500
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    """A single page of results from a keyset-paginated listing.
+
+    Args:
+        items (list[T]): The results within the page, in listing order.
+        next_page_token (str | None): The token to pass back for the following page,
+            or None if this is the last page.
+    """
+
+    items: list[T] = field(default_factory=list)
+    next_page_token: Optional[str] = None
+
+
+def encode_page_token(*values: Any) -> str:
+    """Encode the sort key of the last row of a page as an opaque page token.
+
+    Args:
+        *values (Any): The JSON serializable sort key values.
+
+    Returns:
+        str: The URL safe page token.
+    """
+
+    return base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii")
+
+
+def decode_page_token(page_token: str, size: int) -> list[Any]:
+    """Decode a page token back into the sort key it was encoded from.
+
+    Args:
+        page_token (str): The page token to decode.
+        size (int): The number of values the sort key is expected to hold.
+
+    Returns:
+        list[Any]: The sort key values.
+
+    Raises:
+        ValueError: If the page token is malformed.
+    """
+
+    try:
+        values = json.loads(base64.urlsafe_b64decode(page_token.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as error:
+        raise ValueError("Invalid page token: {}".format(page_token)) from error
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid page token: {}".format(page_token))
+
+    return values
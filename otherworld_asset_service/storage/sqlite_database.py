@@ -1,30 +1,92 @@
 import sqlite3
+import time
 
-from typing import Optional
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Union
 
 from otherworld_asset_service.models.asset import Asset
 from otherworld_asset_service.models.asset_version import AssetVersion
 from otherworld_asset_service.models.enums import AssetType, VersionStatus
-from otherworld_asset_service.utils import logger
+from otherworld_asset_service.storage.codes import (
+    ASSET_TYPE_CODES,
+    ASSET_TYPE_VALUES,
+    ASSET_TYPES,
+    VERSION_STATUS_CODES,
+    VERSION_STATUS_VALUES,
+    VERSION_STATUSES,
+    asset_type_code,
+    version_status_code,
+)
+from otherworld_asset_service.storage.connection_manager import (
+    DEFAULT_BUSY_TIMEOUT,
+    IN_MEMORY_PATH,
+    ConnectionManager,
+)
+from otherworld_asset_service.storage.data_store import (
+    AssetKey,
+    AssetRow,
+    AssetVersionRow,
+    ManifestRow,
+)
+from otherworld_asset_service.storage.migrations import apply_migrations
+from otherworld_asset_service.storage.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_page_token,
+    encode_page_token,
+)
+from otherworld_asset_service.utils import logger, metrics
 
 
 LOGGER = logger.get_logger("SQLiteDatabase")
 
+QUERY_DURATION = metrics.REGISTRY.histogram(
+    "otherworld_storage_query_duration_seconds",
+    "The latency of SQLiteDatabase queries.",
+    labels=("query",),
+)
+QUERY_ERRORS = metrics.REGISTRY.counter(
+    "otherworld_storage_query_errors_total",
+    "The number of SQLiteDatabase queries raising an exception.",
+    labels=("query",),
+)
+
+# Records the latency and errors of each query, labelled with the method name
+_timed = metrics.timed(QUERY_DURATION, QUERY_ERRORS)
+
+# The most bound parameters a single statement uses, kept within the lowest default
+# SQLite limit
+MAX_QUERY_PARAMETERS = 999
+
+# Reads select their columns in a fixed order, so rows are unpacked positionally
+_SELECT_ASSETS = "SELECT asset_id, name, type_id FROM assets "
+
+# Asset versions store their department as a code, so every read joins the department
+# name back in, ordering by name rather than code
+_SELECT_ASSET_VERSIONS = """
+    SELECT asset_id, departments.name AS department, version, status_id
+    FROM asset_versions
+    JOIN departments USING (department_id)
+    """
+
 
 class SQLiteDatabase:
     """A SQLite persistence layer to store asset and asset version data.
 
+    The database is safe to share across threads. Each thread reads through its own
+    connection while writes are serialized, see ConnectionManager.
+
     Args:
         path (str): The location of the data store. If one is not provided, an in-memory
             SQLite database will be created instead.
+        busy_timeout (int): The number of milliseconds to wait on a locked database.
     """
 
-    def __init__(self, path: str = ":memory:") -> None:
-        # Open a connection to the SQLite database using the provided path
-        self._connection = sqlite3.connect(path)
-
-        # Update the connection so queried rows will behave more like dicts than tuples
-        self._connection.row_factory = sqlite3.Row
+    def __init__(
+        self, path: str = IN_MEMORY_PATH, busy_timeout: int = DEFAULT_BUSY_TIMEOUT
+    ) -> None:
+        # Manage the connections to the SQLite database using the provided path
+        self._connections = ConnectionManager(path, busy_timeout=busy_timeout)
 
         # Initialize the schema
         self._initialize_schema()
@@ -32,30 +94,10 @@ class SQLiteDatabase:
     def _initialize_schema(self) -> None:
         LOGGER.debug("Initializing database schema")
 
-        cursor = self._connection.cursor()
-
-        cursor.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS assets (
-                asset_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                type TEXT NOT NULL,
-                UNIQUE(name, type)
-            );
-
-            CREATE TABLE IF NOT EXISTS asset_versions (
-                asset_id INTEGER NOT NULL,
-                department TEXT NOT NULL,
-                version INTEGER NOT NULL,
-                status TEXT NOT NULL,
-                FOREIGN KEY(asset_id) REFERENCES assets(asset_id),
-                UNIQUE(asset_id, department, version)
-            );
-            """
-        )
-
-        self._connection.commit()
+        with self._connections.writing() as connection:
+            apply_migrations(connection)
 
+    @_timed
     def add_asset(self, asset: Asset) -> Asset:
         """Add an asset to the database.
 
@@ -66,24 +108,26 @@ class SQLiteDatabase:
             Asset: The newly added asset.
         """
 
-        LOGGER.debug("Adding asset for {}".format(asset.name))
+        LOGGER.debug("Adding asset for %s", asset.name)
 
-        cursor = self._connection.cursor()
+        with self._connections.writing() as connection:
+            cursor = connection.cursor()
 
-        cursor.execute(
-            "INSERT INTO assets (name, type) VALUES (?, ?)",
-            (asset.name, asset.asset_type.value),
-        )
+            cursor.execute(
+                "INSERT INTO assets (name, type_id) VALUES (?, ?)",
+                (asset.name, ASSET_TYPE_CODES[asset.asset_type]),
+            )
 
-        self._connection.commit()
+            connection.commit()
 
-        # Update the asset now that it has a reference id
-        asset.id = cursor.lastrowid
+            # Update the asset now that it has a reference id
+            asset.id = cursor.lastrowid
 
-        LOGGER.debug("{} has been added!".format(asset.name))
+        LOGGER.debug("%s has been added!", asset.name)
 
         return asset
 
+    @_timed
     def add_asset_version(
         self, asset: Asset, asset_version: AssetVersion
     ) -> AssetVersion:
@@ -97,41 +141,67 @@ class SQLiteDatabase:
             AssetVersion: The newly added asset version.
         """
 
-        LOGGER.debug("Adding asset version for {}".format(asset.name))
+        LOGGER.debug("Adding asset version for %s", asset.name)
 
         if asset.id is None:
             raise ValueError("Asset versions must be associated with a valid asset id.")
 
         asset_version_number = asset_version.version
 
-        if asset_version_number is None:
-            # Ensure the asset version number exists and if not, increment the latest
-            latest_asset_version_number = self.get_last_asset_version_number(asset.id)
-
-            if latest_asset_version_number:
-                asset_version_number = latest_asset_version_number + 1
-            else:
-                asset_version_number = 1
+        with self._connections.writing() as connection:
+            cursor = connection.cursor()
+
+            # Take the write lock up front so no other writer, in this process or any
+            # other, can allocate the same version number in the meantime
+            cursor.execute("BEGIN IMMEDIATE")
+
+            department_id = self._get_department_ids(
+                cursor, [asset_version.department]
+            )[asset_version.department]
+
+            if asset_version_number is None:
+                # Allocate the version number following the latest within the insert
+                # itself, so the number is always free
+                cursor.execute(
+                    """
+                    INSERT INTO
+                    asset_versions (asset_id, department_id, version, status_id)
+                    SELECT ?, ?, COALESCE(MAX(version), 0) + 1, ?
+                    FROM asset_versions
+                    WHERE asset_id = ?
+                    """,
+                    (
+                        asset.id,
+                        department_id,
+                        VERSION_STATUS_CODES[asset_version.status],
+                        asset.id,
+                    ),
+                )
 
-        cursor = self._connection.cursor()
+                cursor.execute(
+                    "SELECT version FROM asset_versions WHERE rowid = ?",
+                    (cursor.lastrowid,),
+                )
 
-        cursor.execute(
-            """
-            INSERT INTO
-            asset_versions (asset_id, department, version, status)
-            VALUES (?, ?, ?, ?)
-            """,
-            (
-                asset.id,
-                asset_version.department,
-                asset_version_number,
-                asset_version.status.value,
-            ),
-        )
+                asset_version_number = cursor.fetchone()[0]
+            else:
+                cursor.execute(
+                    """
+                    INSERT INTO
+                    asset_versions (asset_id, department_id, version, status_id)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (
+                        asset.id,
+                        department_id,
+                        asset_version_number,
+                        VERSION_STATUS_CODES[asset_version.status],
+                    ),
+                )
 
-        self._connection.commit()
+            connection.commit()
 
-        LOGGER.debug("{} has been added!".format(asset.name))
+        LOGGER.debug("%s has been added!", asset.name)
 
         return AssetVersion(
             asset.id,
@@ -140,6 +210,187 @@ class SQLiteDatabase:
             status=asset_version.status,
         )
 
+    @_timed
+    def add_asset_versions_bulk(
+        self,
+        entries: Sequence[tuple[Asset, AssetVersion]],
+        fingerprints: Optional[Sequence[int]] = None,
+    ) -> list[Union[AssetVersion, sqlite3.IntegrityError]]:
+        """Add many assets and asset versions to the database in a single transaction.
+
+        Assets are inserted when they do not already exist and resolved to their ids.
+        Asset versions are written with executemany inside a savepoint. If any of them
+        violates a constraint, the savepoint is rolled back and each asset version is
+        retried within its own savepoint so a single bad row does not discard the rest
+        of the batch.
+
+        Args:
+            entries (Sequence[tuple[Asset, AssetVersion]]): The assets and the asset
+                versions to add for them.
+            fingerprints (Sequence[int] | None): The fingerprints of the manifest
+                records the entries were loaded from, if any. They are recorded within
+                the same transaction, so a record is never marked as imported unless
+                its entry was written, or already existed.
+
+        Returns:
+            list[AssetVersion | sqlite3.IntegrityError]: The newly added asset version,
+                or the error that prevented it from being added, for each entry.
+        """
+
+        LOGGER.debug("Adding %s asset versions in bulk", len(entries))
+
+        if not entries:
+            return []
+
+        with self._connections.writing() as connection:
+            cursor = connection.cursor()
+
+            # Take the write lock up front so the batch never waits part way through
+            cursor.execute("BEGIN IMMEDIATE")
+
+            # Insert any missing assets and resolve every asset to its reference id
+            asset_keys = list(
+                dict.fromkeys(
+                    (asset.name, ASSET_TYPE_CODES[asset.asset_type])
+                    for asset, _ in entries
+                )
+            )
+
+            cursor.executemany(
+                "INSERT OR IGNORE INTO assets (name, type_id) VALUES (?, ?)",
+                asset_keys,
+            )
+
+            asset_ids = {}
+            for asset_key in asset_keys:
+                cursor.execute(
+                    "SELECT asset_id FROM assets WHERE name = ? AND type_id = ?",
+                    asset_key,
+                )
+                asset_ids[asset_key] = cursor.fetchone()[0]
+
+            department_ids = self._get_department_ids(
+                cursor,
+                dict.fromkeys(asset_version.department for _, asset_version in entries),
+            )
+
+            # Build the asset version rows, incrementing the latest version number of
+            # an asset for any asset version that does not define one
+            latest_version_numbers: dict[int, int] = {}
+            rows = []
+            added_asset_versions = []
+            for asset, asset_version in entries:
+                asset.id = asset_ids[(asset.name, ASSET_TYPE_CODES[asset.asset_type])]
+
+                asset_version_number = asset_version.version
+
+                if asset_version_number is None:
+                    if asset.id not in latest_version_numbers:
+                        latest_version_numbers[asset.id] = (
+                            self._get_last_asset_version_number(cursor, asset.id) or 0
+                        )
+
+                    latest_version_numbers[asset.id] += 1
+                    asset_version_number = latest_version_numbers[asset.id]
+
+                rows.append(
+                    (
+                        asset.id,
+                        department_ids[asset_version.department],
+                        asset_version_number,
+                        VERSION_STATUS_CODES[asset_version.status],
+                    )
+                )
+                added_asset_versions.append(
+                    AssetVersion(
+                        asset.id,
+                        asset_version.department,
+                        version=asset_version_number,
+                        status=asset_version.status,
+                    )
+                )
+
+            insert_statement = (
+                "INSERT INTO asset_versions "
+                "(asset_id, department_id, version, status_id) VALUES (?, ?, ?, ?)"
+            )
+
+            results: list[Union[AssetVersion, sqlite3.IntegrityError]] = []
+
+            cursor.execute("SAVEPOINT bulk_asset_versions")
+
+            try:
+                cursor.executemany(insert_statement, rows)
+            except sqlite3.IntegrityError:
+                cursor.execute("ROLLBACK TO bulk_asset_versions")
+
+                # Fall back to isolating every row so only the offending rows fail
+                for row, added_asset_version in zip(rows, added_asset_versions):
+                    cursor.execute("SAVEPOINT bulk_asset_version")
+
+                    try:
+                        cursor.execute(insert_statement, row)
+                    except sqlite3.IntegrityError as error:
+                        cursor.execute("ROLLBACK TO bulk_asset_version")
+                        results.append(error)
+                    else:
+                        results.append(added_asset_version)
+
+                    cursor.execute("RELEASE bulk_asset_version")
+            else:
+                results = list(added_asset_versions)
+
+            cursor.execute("RELEASE bulk_asset_versions")
+
+            if fingerprints:
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO imported_records (fingerprint) VALUES (?)",
+                    [(fingerprint,) for fingerprint in fingerprints],
+                )
+
+            connection.commit()
+
+        LOGGER.debug("%s asset versions have been added!", len(entries))
+
+        return results
+
+    @staticmethod
+    def _get_department_ids(
+        cursor: sqlite3.Cursor, departments: Iterable[str]
+    ) -> dict[str, int]:
+        # Intern any departments not seen before, within the caller's transaction so
+        # they are rolled back along with it
+        departments = list(departments)
+
+        cursor.executemany(
+            "INSERT OR IGNORE INTO departments (name) VALUES (?)",
+            [(department,) for department in departments],
+        )
+
+        department_ids = {}
+        for department in departments:
+            cursor.execute(
+                "SELECT department_id FROM departments WHERE name = ?", (department,)
+            )
+            department_ids[department] = cursor.fetchone()[0]
+
+        return department_ids
+
+    @staticmethod
+    def _get_last_asset_version_number(
+        cursor: sqlite3.Cursor, asset_id: int
+    ) -> Optional[int]:
+        cursor.execute(
+            "SELECT version FROM asset_versions WHERE asset_id = ? "
+            "ORDER BY version DESC LIMIT 1",
+            (asset_id,),
+        )
+
+        row = cursor.fetchone()
+
+        return row[0] if row else None
+
+    @_timed
     def get_asset(self, name: str) -> Optional[Asset]:
         """Get the asset corresponding to the provided asset name.
 
@@ -148,29 +399,92 @@ class SQLiteDatabase:
 
         Returns:
             Asset | None: The asset corresponding to the provided asset name, or None if
-                not found.
+                not found. When assets of several types share the name, the first by
+                type is returned.
         """
 
-        LOGGER.debug("Getting asset for {}".format(name))
+        LOGGER.debug("Getting asset for %s", name)
 
-        cursor = self._connection.cursor()
+        with self._connections.reading() as connection:
+            cursor = connection.cursor()
 
-        cursor.execute(
-            "SELECT * FROM assets WHERE name = ?",
-            (name,),
-        )
+            cursor.execute(
+                _SELECT_ASSETS + "WHERE name = ? ORDER BY type_id LIMIT 1",
+                (name,),
+            )
 
-        row = cursor.fetchone()
+            row = cursor.fetchone()
 
         if not row:
             return None
 
-        return Asset(
-            row["name"],
-            AssetType(row["type"]),
-            id=row["asset_id"],
-        )
+        return _assets_from_rows([row])[0]
+
+    @_timed
+    def get_assets(self, keys: Iterable[AssetKey]) -> dict[AssetKey, Asset]:
+        """Get many assets at once, by name or by name and type.
+
+        Names and (name, type) pairs may be mixed. Lookups are batched into as few
+        queries as the SQLite parameter limit allows rather than one query per asset.
+
+        Args:
+            keys (Iterable[str | tuple[str, AssetType]]): The asset names, or asset
+                name and type pairs, to get.
+
+        Returns:
+            dict[str | tuple[str, AssetType], Asset]: The asset found for each key.
+                Keys without a matching asset are omitted. A name matching assets of
+                several types resolves to the first by type, as with get_asset.
+        """
+
+        names = []
+        pairs = []
+        for key in dict.fromkeys(keys):
+            if isinstance(key, tuple):
+                pairs.append(key)
+            else:
+                names.append(key)
+
+        LOGGER.debug("Getting %s assets", len(names) + len(pairs))
+
+        assets: dict[AssetKey, Asset] = {}
+
+        with self._connections.reading() as connection:
+            cursor = connection.cursor()
+
+            for chunk in _chunked(names, MAX_QUERY_PARAMETERS):
+                cursor.execute(
+                    _SELECT_ASSETS
+                    + "WHERE name IN ({}) ORDER BY name, type_id".format(
+                        ", ".join("?" * len(chunk))
+                    ),
+                    chunk,
+                )
+
+                for asset in _assets_from_rows(cursor.fetchall()):
+                    # Keep the first asset by type for each name
+                    if asset.name not in assets:
+                        assets[asset.name] = asset
+
+            for chunk in _chunked(pairs, MAX_QUERY_PARAMETERS // 2):
+                cursor.execute(
+                    _SELECT_ASSETS
+                    + "WHERE (name, type_id) IN (VALUES {})".format(
+                        ", ".join(["(?, ?)"] * len(chunk))
+                    ),
+                    [
+                        value
+                        for name, asset_type in chunk
+                        for value in (name, asset_type_code(asset_type))
+                    ],
+                )
+
+                for asset in _assets_from_rows(cursor.fetchall()):
+                    assets[(asset.name, asset.asset_type)] = asset
 
+        return assets
+
+    @_timed
     def get_asset_version(self, asset_id: int, version: int) -> Optional[AssetVersion]:
         """Get the asset version corresponding to the provided asset id.
 
@@ -183,27 +497,26 @@ class SQLiteDatabase:
             id, or None if not found.
         """
 
-        LOGGER.debug("Getting asset version for {}".format(asset_id))
+        LOGGER.debug("Getting asset version for %s", asset_id)
 
-        cursor = self._connection.cursor()
+        with self._connections.reading() as connection:
+            cursor = connection.cursor()
 
-        cursor.execute(
-            "SELECT * FROM asset_versions WHERE asset_id = ? AND version = ?",
-            (asset_id, version),
-        )
+            # Resolve a version shared by several departments to the first of them
+            cursor.execute(
+                _SELECT_ASSET_VERSIONS
+                + "WHERE asset_id = ? AND version = ? ORDER BY department LIMIT 1",
+                (asset_id, version),
+            )
 
-        row = cursor.fetchone()
+            row = cursor.fetchone()
 
         if not row:
             return None
 
-        return AssetVersion(
-            asset_id,
-            row["department"],
-            version=row["version"],
-            status=VersionStatus(row["status"]),
-        )
+        return _asset_versions_from_rows([row])[0]
 
+    @_timed
     def get_last_asset_version_number(self, asset_id: int) -> Optional[int]:
         """Get the last asset version number.
 
@@ -215,20 +528,12 @@ class SQLiteDatabase:
             int: The last asset version number.
         """
 
-        LOGGER.debug("Getting latest asset version for {}".format(asset_id))
-
-        cursor = self._connection.cursor()
-
-        cursor.execute(
-            "SELECT * FROM asset_versions WHERE asset_id = ? "
-            "ORDER BY version DESC LIMIT 1",
-            (asset_id,),
-        )
-
-        row = cursor.fetchone()
+        LOGGER.debug("Getting latest asset version for %s", asset_id)
 
-        return row["version"] if row else None
+        with self._connections.reading() as connection:
+            return self._get_last_asset_version_number(connection.cursor(), asset_id)
 
+    @_timed
     def list_assets(self) -> list[Asset]:
         """List all assets.
 
@@ -238,22 +543,90 @@ class SQLiteDatabase:
 
         LOGGER.debug("Listing assets")
 
-        cursor = self._connection.cursor()
+        with self._connections.reading() as connection:
+            cursor = connection.cursor()
+
+            cursor.execute(_SELECT_ASSETS + "ORDER BY name ASC, type_id ASC")
+
+            rows = cursor.fetchall()
+
+        return _assets_from_rows(rows)
+
+    @_timed
+    def list_assets_page(
+        self, page_token: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Page[Asset]:
+        """List a single page of assets, ordered by name and type.
 
-        cursor.execute("SELECT * FROM assets ORDER BY name ASC, type ASC")
+        Pages are found by seeking past the (name, type) of the previous page rather
+        than by offset, so every page costs the same no matter how deep it is and
+        assets added meanwhile never shift later pages.
 
-        assets = []
-        for row in cursor.fetchall():
-            assets.append(
-                Asset(
-                    row["name"],
-                    AssetType(row["type"]),
-                    id=row["asset_id"],
+        Args:
+            page_token (str | None): The token of the page to list, or None for the
+                first page.
+            page_size (int): The most assets returned within the page.
+
+        Returns:
+            Page[Asset]: The assets within the page and the token of the next page.
+        """
+
+        if page_size < 1:
+            raise ValueError("Page size must be greater than or equal to 1.")
+
+        LOGGER.debug("Listing a page of %s assets", page_size)
+
+        with self._connections.reading() as connection:
+            cursor = connection.cursor()
+
+            # Fetch one row beyond the page to know whether another page follows
+            if page_token is None:
+                cursor.execute(
+                    _SELECT_ASSETS + "ORDER BY name, type_id LIMIT ?",
+                    (page_size + 1,),
                 )
+            else:
+                # Page tokens hold the type value rather than its code
+                name, asset_type = decode_page_token(page_token, 2)
+
+                cursor.execute(
+                    _SELECT_ASSETS + "WHERE (name, type_id) > (?, ?) "
+                    "ORDER BY name, type_id LIMIT ?",
+                    (name, asset_type_code(asset_type), page_size + 1),
+                )
+
+            rows = cursor.fetchall()
+
+        page = Page(_assets_from_rows(rows[:page_size]))
+
+        if len(rows) > page_size:
+            last_asset = page.items[-1]
+            page.next_page_token = encode_page_token(
+                last_asset.name, last_asset.asset_type.value
             )
 
-        return assets
+        return page
 
+    def iter_assets(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[Asset]:
+        """Iterate all assets, ordered by name and type, one page at a time.
+
+        Only a single page is held in memory, and no read is held open between pages.
+
+        Args:
+            page_size (int): The number of assets read per query.
+
+        Yields:
+            Asset: Each asset within the database.
+        """
+
+        page = self.list_assets_page(page_size=page_size)
+        yield from page.items
+
+        while page.next_page_token is not None:
+            page = self.list_assets_page(page.next_page_token, page_size=page_size)
+            yield from page.items
+
+    @_timed
     def list_asset_versions(self, asset_id: int) -> list[AssetVersion]:
         """List all asset versions for a specific asset.
 
@@ -265,34 +638,415 @@ class SQLiteDatabase:
                 provided id.
         """
 
-        LOGGER.debug("Listing asset versions for {}".format(asset_id))
+        LOGGER.debug("Listing asset versions for %s", asset_id)
 
-        cursor = self._connection.cursor()
+        with self._connections.reading() as connection:
+            cursor = connection.cursor()
 
-        cursor.execute(
-            """
-            SELECT *
-            FROM asset_versions
-            WHERE asset_id = ?
-            ORDER BY department, version, status
-            """,
-            (asset_id,),
-        )
+            cursor.execute(
+                _SELECT_ASSET_VERSIONS
+                + "WHERE asset_id = ? ORDER BY department, version",
+                (asset_id,),
+            )
+
+            rows = cursor.fetchall()
+
+        return _asset_versions_from_rows(rows)
+
+    @_timed
+    def list_asset_versions_page(
+        self,
+        asset_id: int,
+        page_token: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Page[AssetVersion]:
+        """List a single page of asset versions for a specific asset.
 
-        asset_versions = []
-        for row in cursor.fetchall():
-            asset_versions.append(
-                AssetVersion(
-                    asset_id,
-                    row["department"],
-                    version=row["version"],
-                    status=VersionStatus(row["status"]),
+        Asset versions are ordered by department and version, and pages are found by
+        seeking past the (department, version) of the previous page.
+
+        Args:
+            asset_id (int): The id necessary to retrieve all associated versions.
+            page_token (str | None): The token of the page to list, or None for the
+                first page.
+            page_size (int): The most asset versions returned within the page.
+
+        Returns:
+            Page[AssetVersion]: The asset versions within the page and the token of the
+                next page.
+        """
+
+        if page_size < 1:
+            raise ValueError("Page size must be greater than or equal to 1.")
+
+        LOGGER.debug("Listing a page of %s asset versions for %s", page_size, asset_id)
+
+        with self._connections.reading() as connection:
+            cursor = connection.cursor()
+
+            # Fetch one row beyond the page to know whether another page follows
+            if page_token is None:
+                cursor.execute(
+                    _SELECT_ASSET_VERSIONS + "WHERE asset_id = ? "
+                    "ORDER BY department, version LIMIT ?",
+                    (asset_id, page_size + 1),
+                )
+            else:
+                cursor.execute(
+                    _SELECT_ASSET_VERSIONS
+                    + "WHERE asset_id = ? AND (departments.name, version) > (?, ?) "
+                    "ORDER BY department, version LIMIT ?",
+                    (asset_id, *decode_page_token(page_token, 2), page_size + 1),
                 )
+
+            rows = cursor.fetchall()
+
+        page = Page(_asset_versions_from_rows(rows[:page_size]))
+
+        if len(rows) > page_size:
+            last_asset_version = page.items[-1]
+            page.next_page_token = encode_page_token(
+                last_asset_version.department, last_asset_version.version
             )
 
+        return page
+
+    def iter_asset_versions(
+        self, asset_id: int, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[AssetVersion]:
+        """Iterate all asset versions for a specific asset, one page at a time.
+
+        Only a single page is held in memory, and no read is held open between pages.
+
+        Args:
+            asset_id (int): The id necessary to retrieve all associated versions.
+            page_size (int): The number of asset versions read per query.
+
+        Yields:
+            AssetVersion: Each asset version of the asset.
+        """
+
+        page = self.list_asset_versions_page(asset_id, page_size=page_size)
+        yield from page.items
+
+        while page.next_page_token is not None:
+            page = self.list_asset_versions_page(
+                asset_id, page.next_page_token, page_size=page_size
+            )
+            yield from page.items
+
+    @_timed
+    def list_asset_versions_for(
+        self, asset_ids: Iterable[int]
+    ) -> dict[int, list[AssetVersion]]:
+        """List all asset versions for many assets at once.
+
+        Lookups are batched into as few queries as the SQLite parameter limit allows
+        rather than one query per asset.
+
+        Args:
+            asset_ids (Iterable[int]): The ids of the assets to list versions for.
+
+        Returns:
+            dict[int, list[AssetVersion]]: The asset versions of each asset, ordered as
+                by list_asset_versions. Assets without versions map to an empty list.
+        """
+
+        asset_versions: dict[int, list[AssetVersion]] = {
+            asset_id: [] for asset_id in asset_ids
+        }
+
+        LOGGER.debug("Listing asset versions for %s assets", len(asset_versions))
+
+        with self._connections.reading() as connection:
+            cursor = connection.cursor()
+
+            for chunk in _chunked(list(asset_versions), MAX_QUERY_PARAMETERS):
+                cursor.execute(
+                    _SELECT_ASSET_VERSIONS
+                    + "WHERE asset_id IN ({}) "
+                    "ORDER BY asset_id, department, version".format(
+                        ", ".join("?" * len(chunk))
+                    ),
+                    chunk,
+                )
+
+                for asset_version in _asset_versions_from_rows(cursor.fetchall()):
+                    asset_versions[asset_version.asset].append(asset_version)
+
         return asset_versions
 
+    def iter_asset_rows(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[AssetRow]:
+        """Iterate every asset as a raw row, in id order, one page at a time.
+
+        No models are built, so exporters can stream rows straight to their output.
+
+        Args:
+            page_size (int): The number of rows read per query.
+
+        Yields:
+            tuple[int, str, str]: The id, name and type value of each asset.
+        """
+
+        if page_size < 1:
+            raise ValueError("Page size must be greater than or equal to 1.")
+
+        type_values = ASSET_TYPE_VALUES
+
+        # Asset ids start at 1
+        last_asset_id = 0
+
+        while True:
+            with self._connections.reading() as connection:
+                rows = connection.execute(
+                    _SELECT_ASSETS + "WHERE asset_id > ? ORDER BY asset_id LIMIT ?",
+                    (last_asset_id, page_size),
+                ).fetchall()
+
+            yield from [
+                (asset_id, name, type_values[type_id])
+                for asset_id, name, type_id in rows
+            ]
+
+            if len(rows) < page_size:
+                return
+
+            last_asset_id = rows[-1][0]
+
+    def iter_asset_version_rows(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[AssetVersionRow]:
+        """Iterate every asset version as a raw row, in the order added, page by page.
+
+        No models are built, so exporters can stream rows straight to their output.
+
+        Args:
+            page_size (int): The number of rows read per query.
+
+        Yields:
+            tuple[int, str, int, str]: The asset id, department, version and status
+                value of each asset version.
+        """
+
+        if page_size < 1:
+            raise ValueError("Page size must be greater than or equal to 1.")
+
+        status_values = VERSION_STATUS_VALUES
+        last_rowid = 0
+
+        while True:
+            with self._connections.reading() as connection:
+                rows = connection.execute(
+                    """
+                    SELECT
+                        asset_versions.rowid,
+                        asset_id,
+                        departments.name,
+                        version,
+                        status_id
+                    FROM asset_versions
+                    JOIN departments USING (department_id)
+                    WHERE asset_versions.rowid > ?
+                    ORDER BY asset_versions.rowid
+                    LIMIT ?
+                    """,
+                    (last_rowid, page_size),
+                ).fetchall()
+
+            yield from [
+                (asset_id, department, version, status_values[status_id])
+                for _, asset_id, department, version, status_id in rows
+            ]
+
+            if len(rows) < page_size:
+                return
+
+            last_rowid = rows[-1][0]
+
+    def iter_manifest_rows(
+        self,
+        asset_types: Optional[Iterable[Union[AssetType, str]]] = None,
+        departments: Optional[Iterable[str]] = None,
+        statuses: Optional[Iterable[Union[VersionStatus, str]]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[ManifestRow]:
+        """Iterate every asset version joined with its asset, in the order added.
+
+        Each page is read by a single query joining versions to their assets and
+        departments, and filters are applied within it. Assets without any versions
+        are not included.
+
+        Args:
+            asset_types (Iterable[AssetType | str] | None): Only include the versions
+                of assets of these types, or None for every type.
+            departments (Iterable[str] | None): Only include versions of these
+                departments, or None for every department.
+            statuses (Iterable[VersionStatus | str] | None): Only include versions with
+                these statuses, or None for every status.
+            page_size (int): The number of rows read per query.
+
+        Yields:
+            tuple[str, str, str, int, str]: The asset name and type value, and the
+                department, version and status value of each asset version.
+
+        Raises:
+            ValueError: If the page size is less than 1, or an asset type or status is
+                not known.
+        """
+
+        if page_size < 1:
+            raise ValueError("Page size must be greater than or equal to 1.")
+
+        conditions = []
+        parameters: list = []
+
+        for column, values in (
+            ("type_id", _codes(asset_types, asset_type_code)),
+            ("departments.name", None if departments is None else list(departments)),
+            ("status_id", _codes(statuses, version_status_code)),
+        ):
+            if values is not None:
+                conditions.append(
+                    " AND {} IN ({})".format(column, ", ".join("?" * len(values)))
+                )
+                parameters.extend(values)
+
+        query = """
+            SELECT
+                asset_versions.rowid,
+                assets.name,
+                type_id,
+                departments.name,
+                version,
+                status_id
+            FROM asset_versions
+            JOIN assets USING (asset_id)
+            JOIN departments USING (department_id)
+            WHERE asset_versions.rowid > ?{}
+            ORDER BY asset_versions.rowid
+            LIMIT ?
+            """.format("".join(conditions))
+
+        type_values = ASSET_TYPE_VALUES
+        status_values = VERSION_STATUS_VALUES
+        last_rowid = 0
+
+        while True:
+            with self._connections.reading() as connection:
+                rows = connection.execute(
+                    query, (last_rowid, *parameters, page_size)
+                ).fetchall()
+
+            yield from [
+                (name, type_values[type_id], department, version, status_values[status])
+                for _, name, type_id, department, version, status in rows
+            ]
+
+            if len(rows) < page_size:
+                return
+
+            last_rowid = rows[-1][0]
+
+    @_timed
+    def find_record_fingerprints(self, fingerprints: Iterable[int]) -> set[int]:
+        """Find which manifest record fingerprints have already been imported.
+
+        Args:
+            fingerprints (Iterable[int]): The fingerprints to look for.
+
+        Returns:
+            set[int]: The fingerprints that were recorded by an earlier import.
+        """
+
+        found_fingerprints: set[int] = set()
+
+        with self._connections.reading() as connection:
+            cursor = connection.cursor()
+
+            for chunk in _chunked(list(fingerprints), MAX_QUERY_PARAMETERS):
+                cursor.execute(
+                    "SELECT fingerprint FROM imported_records "
+                    "WHERE fingerprint IN ({})".format(", ".join("?" * len(chunk))),
+                    chunk,
+                )
+                found_fingerprints.update(row[0] for row in cursor.fetchall())
+
+        return found_fingerprints
+
+    @_timed
+    def has_imported_file(self, content_hash: str) -> bool:
+        """Check whether a file with the same content has been imported.
+
+        Args:
+            content_hash (str): The hash of the content of the file.
+
+        Returns:
+            bool: True if a file with this content was imported before.
+        """
+
+        with self._connections.reading() as connection:
+            row = connection.execute(
+                "SELECT 1 FROM imported_files WHERE content_hash = ?", (content_hash,)
+            ).fetchone()
+
+        return row is not None
+
+    @_timed
+    def add_imported_file(self, content_hash: str, file_path: str, rows: int) -> None:
+        """Record that a file has been imported, so its content can be skipped.
+
+        Args:
+            content_hash (str): The hash of the content of the file.
+            file_path (str): The path the file was imported from.
+            rows (int): The number of entries within the file.
+        """
+
+        LOGGER.debug("Recording import of %s", file_path)
+
+        with self._connections.writing() as connection:
+            connection.execute(
+                """
+                INSERT OR REPLACE INTO imported_files
+                    (content_hash, file_path, rows, imported_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (content_hash, str(file_path), rows, time.time()),
+            )
+            connection.commit()
+
     def close(self) -> None:
-        """Safely close the connection."""
+        """Safely close every connection."""
+
+        self._connections.close()
+
+
+def _assets_from_rows(rows: list[tuple]) -> list[Asset]:
+    # Build every model in a single comprehension, unpacking rows positionally and
+    # mapping codes through a tuple rather than constructing enums by value
+    asset_types = ASSET_TYPES
+
+    return [
+        Asset(name, asset_types[type_id], asset_id)
+        for asset_id, name, type_id in rows
+    ]
+
+
+def _asset_versions_from_rows(rows: list[tuple]) -> list[AssetVersion]:
+    statuses = VERSION_STATUSES
+
+    return [
+        AssetVersion(asset_id, department, version, statuses[status_id])
+        for asset_id, department, version, status_id in rows
+    ]
+
+
+def _codes(values: Optional[Iterable], code: Callable[[Any], int]) -> Optional[list]:
+    # No filter is applied for None, while an empty filter matches nothing
+    return None if values is None else sorted({code(value) for value in values})
+
+
+def _chunked(values: Sequence, size: int) -> Iterator[list]:
+    iterator = iter(values)
 
-        self._connection.close()
+    while chunk := list(islice(iterator, size)):
+        yield chunk
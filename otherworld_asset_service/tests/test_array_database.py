@@ -0,0 +1,331 @@
+import pytest
+import sqlite3
+
+from pathlib import Path
+
+from otherworld_asset_service.api.export import export_manifest
+from otherworld_asset_service.api.service import OtherWorldAssetService
+from otherworld_asset_service.api.validation.pipelines.asset_pipeline import (
+    build_default_asset_pipeline,
+)
+from otherworld_asset_service.api.validation.pipelines.asset_version_pipeline import (
+    build_default_asset_version_pipeline,
+)
+from otherworld_asset_service.models.asset import Asset
+from otherworld_asset_service.models.asset_version import AssetVersion
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+from otherworld_asset_service.storage.array_database import ArrayDatabase
+from otherworld_asset_service.storage.sqlite_database import SQLiteDatabase
+
+
+CHARACTER_NAME = "coraline"
+DEPARTMENT = "animation"
+
+
+@pytest.fixture(params=[SQLiteDatabase, ArrayDatabase])
+def data_store(request):
+    """Text fixture to provide each data store backend for each test run.
+
+    Every test using it checks the backends behave identically.
+
+    Yields:
+        AssetDataStore: The newly created data store to test with.
+    """
+
+    database = request.param()
+
+    try:
+        yield database
+    finally:
+        database.close()
+
+
+def populate(data_store) -> list[Asset]:
+    """Add an asset of every type sharing a name, and another asset with versions."""
+
+    assets = [
+        data_store.add_asset(Asset(name=CHARACTER_NAME, asset_type=asset_type))
+        for asset_type in reversed(AssetType)
+    ]
+    assets.append(data_store.add_asset(Asset("button", AssetType.PROP)))
+
+    for department in ("rigging", "modeling", DEPARTMENT):
+        for version in (2, 1, 3):
+            data_store.add_asset_version(
+                assets[-1],
+                AssetVersion(
+                    assets[-1].id,
+                    department,
+                    version=version,
+                    status=VersionStatus.ACTIVE,
+                ),
+            )
+
+    return assets
+
+
+def test_assets(data_store):
+    assets = populate(data_store)
+
+    assert [asset.id for asset in assets] == list(range(1, len(AssetType) + 2))
+    assert data_store.get_asset(CHARACTER_NAME).asset_type == AssetType.CHARACTER
+    assert data_store.get_asset("beldam") is None
+    assert [(asset.name, asset.asset_type) for asset in data_store.list_assets()] == [
+        ("button", AssetType.PROP),
+        *((CHARACTER_NAME, asset_type) for asset_type in AssetType),
+    ]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        data_store.add_asset(Asset(name=CHARACTER_NAME, asset_type=AssetType.SET))
+
+
+def test_get_assets(data_store):
+    populate(data_store)
+
+    assets = data_store.get_assets(
+        [CHARACTER_NAME, (CHARACTER_NAME, AssetType.SET), ("button", "set"), "beldam"]
+    )
+
+    assert list(assets) == [CHARACTER_NAME, (CHARACTER_NAME, AssetType.SET)]
+    assert assets[CHARACTER_NAME].asset_type == AssetType.CHARACTER
+
+
+def test_asset_versions(data_store):
+    asset = populate(data_store)[-1]
+
+    asset_versions = data_store.list_asset_versions(asset.id)
+
+    assert [
+        (asset_version.department, asset_version.version)
+        for asset_version in asset_versions
+    ] == [
+        (department, version)
+        for department in (DEPARTMENT, "modeling", "rigging")
+        for version in (1, 2, 3)
+    ]
+    assert data_store.get_asset_version(asset.id, 2) == AssetVersion(
+        asset.id, DEPARTMENT, version=2, status=VersionStatus.ACTIVE
+    )
+    assert data_store.get_asset_version(asset.id, 4) is None
+    assert data_store.get_last_asset_version_number(asset.id) == 3
+    assert data_store.list_asset_versions_for([asset.id, 1]) == {
+        asset.id: asset_versions,
+        1: [],
+    }
+
+    added_asset_version = data_store.add_asset_version(
+        asset, AssetVersion(asset.id, "fx", status=VersionStatus.INACTIVE)
+    )
+
+    assert added_asset_version.version == 4
+
+    with pytest.raises(sqlite3.IntegrityError):
+        data_store.add_asset_version(
+            asset, AssetVersion(asset.id, DEPARTMENT, version=1)
+        )
+
+
+def test_add_asset_version_without_asset():
+    database = ArrayDatabase()
+    populate(database)
+
+    for asset_id in (99, 0):
+        with pytest.raises(sqlite3.IntegrityError):
+            database.add_asset_version(
+                Asset("beldam", AssetType.CHARACTER, id=asset_id),
+                AssetVersion(asset_id, DEPARTMENT, status=VersionStatus.ACTIVE),
+            )
+
+    assert database.list_asset_versions(99) == []
+    assert database.list_asset_versions(0) == []
+
+
+def test_add_asset_versions_bulk(data_store):
+    asset = Asset(name=CHARACTER_NAME, asset_type=AssetType.CHARACTER)
+
+    results = data_store.add_asset_versions_bulk(
+        [
+            (asset, AssetVersion(None, DEPARTMENT, status=VersionStatus.ACTIVE)),
+            (asset, AssetVersion(None, DEPARTMENT, status=VersionStatus.ACTIVE)),
+            (asset, AssetVersion(None, DEPARTMENT, version=1)),
+        ]
+    )
+
+    assert [result.version for result in results[:2]] == [1, 2]
+    assert isinstance(results[2], sqlite3.IntegrityError)
+    assert len(data_store.list_asset_versions(asset.id)) == 2
+
+
+def test_pages(data_store):
+    asset = populate(data_store)[-1]
+
+    assert list(data_store.iter_assets(page_size=3)) == data_store.list_assets()
+    assert list(data_store.iter_asset_versions(asset.id, page_size=2)) == (
+        data_store.list_asset_versions(asset.id)
+    )
+
+    page = data_store.list_asset_versions_page(asset.id, page_size=4)
+    next_page = data_store.list_asset_versions_page(
+        asset.id, page.next_page_token, page_size=4
+    )
+
+    assert next_page.items == data_store.list_asset_versions(asset.id)[4:8]
+
+    with pytest.raises(ValueError):
+        data_store.list_assets_page("not a token")
+
+
+def test_pages_after_insert(data_store):
+    populate(data_store)
+
+    page = data_store.list_assets_page(page_size=2)
+
+    # Assets added between pages are listed in order, without shifting later pages
+    data_store.add_asset(Asset("beldam", AssetType.CHARACTER))
+    data_store.add_asset(Asset("wybie", AssetType.CHARACTER))
+
+    next_page = data_store.list_assets_page(page.next_page_token, page_size=2)
+
+    assert [asset.name for asset in page.items] == ["button", CHARACTER_NAME]
+    assert [asset.name for asset in next_page.items] == [CHARACTER_NAME] * 2
+
+    names = [asset.name for asset in data_store.list_assets()]
+
+    assert names[:2] == ["beldam", "button"]
+    assert names[-1] == "wybie"
+
+
+def test_from_sqlite(tmp_path: Path):
+    path = tmp_path / "sqlite_database.db"
+    sqlite_database = SQLiteDatabase(path)
+
+    try:
+        asset = populate(sqlite_database)[-1]
+    finally:
+        sqlite_database.close()
+
+    array_database = ArrayDatabase.from_sqlite(path, page_size=2)
+    sqlite_database = SQLiteDatabase(path)
+
+    try:
+        assert array_database.list_assets() == sqlite_database.list_assets()
+        assert array_database.list_asset_versions(asset.id) == (
+            sqlite_database.list_asset_versions(asset.id)
+        )
+
+        # New assets continue from the largest id loaded
+        added_asset = array_database.add_asset(Asset("wybie", AssetType.CHARACTER))
+
+        assert added_asset.id == asset.id + 1
+    finally:
+        sqlite_database.close()
+
+
+def test_service_with_array_database():
+    asset_service = OtherWorldAssetService(
+        None,
+        build_default_asset_pipeline(),
+        build_default_asset_version_pipeline(),
+        data_store=ArrayDatabase(),
+    )
+
+    asset = asset_service.add_asset(Asset(CHARACTER_NAME, AssetType.CHARACTER))
+    asset_service.add_asset_version(
+        asset, AssetVersion(asset.id, DEPARTMENT, status=VersionStatus.ACTIVE)
+    )
+
+    assert asset_service.get_asset_version(CHARACTER_NAME, 1).department == DEPARTMENT
+
+
+def test_raw_rows(data_store):
+    asset = populate(data_store)[-1]
+
+    asset_rows = list(data_store.iter_asset_rows(page_size=3))
+    asset_version_rows = list(data_store.iter_asset_version_rows(page_size=4))
+
+    assert asset_rows == sorted(
+        (asset.id, asset.name, asset.asset_type.value)
+        for asset in data_store.list_assets()
+    )
+    assert asset_version_rows[:3] == [
+        (asset.id, "rigging", 2, "active"),
+        (asset.id, "rigging", 1, "active"),
+        (asset.id, "rigging", 3, "active"),
+    ]
+    assert sorted(asset_version_rows) == sorted(
+        (
+            asset_version.asset,
+            asset_version.department,
+            asset_version.version,
+            asset_version.status.value,
+        )
+        for asset_version in data_store.list_asset_versions(asset.id)
+    )
+
+
+@pytest.mark.parametrize("page_size", [0, -1])
+def test_raw_rows_invalid_page_size(data_store, page_size: int):
+    populate(data_store)
+
+    for rows in (
+        data_store.iter_asset_rows(page_size=page_size),
+        data_store.iter_asset_version_rows(page_size=page_size),
+        data_store.iter_manifest_rows(page_size=page_size),
+    ):
+        with pytest.raises(ValueError):
+            next(rows)
+
+
+def test_manifest_rows(data_store):
+    asset = populate(data_store)[-1]
+    data_store.add_asset_version(
+        asset, AssetVersion(asset.id, "fx", status=VersionStatus.INACTIVE)
+    )
+
+    assert list(data_store.iter_manifest_rows(page_size=4))[:2] == [
+        ("button", "prop", "rigging", 2, "active"),
+        ("button", "prop", "rigging", 1, "active"),
+    ]
+    assert list(
+        data_store.iter_manifest_rows(
+            asset_types=[AssetType.PROP],
+            departments=["fx", "cfx"],
+            statuses=["inactive"],
+        )
+    ) == [("button", "prop", "fx", 4, "inactive")]
+    assert list(data_store.iter_manifest_rows(asset_types=["set"])) == []
+    assert list(data_store.iter_manifest_rows(departments=[])) == []
+
+
+def test_manifest_rows_without_asset(data_store, tmp_path: Path):
+    populate(data_store)
+
+    # Versions of missing assets, past and within the known asset ids, are skipped
+    # by SQLite, which does not enforce foreign keys, and rejected by the arrays
+    for asset_id in (99, 0):
+        try:
+            data_store.add_asset_version(
+                Asset("beldam", AssetType.CHARACTER, id=asset_id),
+                AssetVersion(asset_id, DEPARTMENT, status=VersionStatus.ACTIVE),
+            )
+        except sqlite3.IntegrityError:
+            assert isinstance(data_store, ArrayDatabase)
+
+    result = export_manifest(data_store, tmp_path / "export.ndjson")
+
+    assert result.rows == 9
+    assert "beldam" not in (tmp_path / "export.ndjson").read_text()
+
+
+def test_import_records(data_store):
+    asset = Asset(name=CHARACTER_NAME, asset_type=AssetType.CHARACTER)
+
+    data_store.add_asset_versions_bulk(
+        [(asset, AssetVersion(None, DEPARTMENT, status=VersionStatus.ACTIVE))],
+        fingerprints=[-1, 2**63 - 1],
+    )
+    data_store.add_imported_file("content hash", "manifest.json", rows=1)
+
+    assert data_store.find_record_fingerprints([-1, 0, 2**63 - 1]) == {-1, 2**63 - 1}
+    assert data_store.has_imported_file("content hash")
+    assert not data_store.has_imported_file("other content hash")
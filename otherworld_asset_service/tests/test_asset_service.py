@@ -1,7 +1,10 @@
+import json
 import pytest
 
 from pathlib import Path
 
+from otherworld_asset_service.api.ingestion import RowStatus
+from otherworld_asset_service.api.reporting import ImportReport
 from otherworld_asset_service.api.service import OtherWorldAssetService
 from otherworld_asset_service.api.validation.pipelines.asset_pipeline import (
     build_default_asset_pipeline,
@@ -9,9 +12,11 @@ from otherworld_asset_service.api.validation.pipelines.asset_pipeline import (
 from otherworld_asset_service.api.validation.pipelines.asset_version_pipeline import (
     build_default_asset_version_pipeline,
 )
+from otherworld_asset_service.api.validation.validation import ValidationPipeline
 from otherworld_asset_service.models.asset import Asset
 from otherworld_asset_service.models.asset_version import AssetVersion
 from otherworld_asset_service.models.enums import AssetType, VersionStatus
+from otherworld_asset_service.storage.array_database import ArrayDatabase
 from otherworld_asset_service.storage.sqlite_database import SQLiteDatabase
 
 
@@ -58,7 +63,60 @@ def test_service_load_assets(asset_service: OtherWorldAssetService):
     tests_directory = Path(__file__).parent
     sample_data = tests_directory / "sample_data.json"
 
-    assert asset_service.load_assets(file_path=sample_data) is None
+    report = asset_service.load_assets(file_path=sample_data)
+
+    assert report.rows == 21
+    assert report.added == 18
+    assert report.invalid == 2
+    assert report.duplicates == 1
+    assert sum(report.error_counts.values()) == 3
+
+
+def test_service_load_assets_reject_file(
+    asset_service: OtherWorldAssetService, tmp_path: Path
+):
+    sample_data = Path(__file__).parent / "sample_data.json"
+    reject_file_path = tmp_path / "rejected.ndjson"
+
+    with ImportReport(max_examples=1, reject_file_path=reject_file_path) as report:
+        asset_service.load_assets(sample_data, report=report)
+
+    rejected_entries = [
+        json.loads(line) for line in reject_file_path.read_text().splitlines()
+    ]
+
+    assert len(report.examples) == 1
+    assert len(rejected_entries) == report.rejected == 3
+    assert {entry["status"] for entry in rejected_entries} == {"invalid", "duplicate"}
+    assert all(entry["entry"]["asset"] for entry in rejected_entries)
+
+
+def test_service_load_assets_bulk_report(asset_service: OtherWorldAssetService):
+    sample_data = Path(__file__).parent / "sample_data.json"
+    report = ImportReport()
+
+    result = asset_service.load_assets_bulk(sample_data, batch_size=4, report=report)
+
+    assert report.rows == result.rows
+    assert report.added == result.added
+    assert report.examples[0].entry is not None
+
+
+def test_service_add_asset_report(asset_service: OtherWorldAssetService):
+    report = ImportReport()
+    asset = asset_service.add_asset(
+        Asset(name=CHARACTER_NAME, asset_type=ASSET_TYPE), report=report
+    )
+
+    assert asset_service.add_asset(asset, report=report) == asset
+    asset_version = asset_service.add_asset_version(
+        asset, AssetVersion(asset.id, department=None), report=report
+    )
+
+    assert asset_version is None
+
+    assert (report.added, report.duplicates, report.invalid) == (1, 1, 1)
+    assert [example.index for example in report.examples] == [1, 2]
 
 
 def test_service_add_asset(asset_service: OtherWorldAssetService):
@@ -121,3 +179,264 @@ def test_service_list_asset_versions(asset_service: OtherWorldAssetService):
     asset_service.add_asset_version(asset, asset_version_v3)
 
     assert len(asset_service.list_asset_versions(asset.name)) == 3
+
+
+def test_service_load_assets_bulk(asset_service: OtherWorldAssetService):
+    tests_directory = Path(__file__).parent
+    sample_data = tests_directory / "sample_data.json"
+
+    result = asset_service.load_assets_bulk(file_path=sample_data, batch_size=4)
+
+    assert result.rows == len(json.loads(sample_data.read_text()))
+    assert result.added + result.rejected == result.rows
+    assert [outcome.index for outcome in result.outcomes] == list(range(result.rows))
+    assert len(asset_service.list_assets()) > 0
+
+
+@pytest.mark.parametrize(
+    "load",
+    [
+        OtherWorldAssetService.load_assets_bulk,
+        OtherWorldAssetService.load_assets_parallel,
+        OtherWorldAssetService.load_assets_incremental,
+    ],
+)
+def test_service_load_assets_non_object_entries(
+    asset_service: OtherWorldAssetService, tmp_path: Path, load
+):
+    entry = {
+        "asset": {"name": CHARACTER_NAME, "type": ASSET_TYPE.value},
+        "department": DEPARTMENT,
+        "status": VERSION_STATUS.value,
+    }
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps([1, "x", None, [entry], {"asset": "x"}, entry]))
+
+    result = load(asset_service, manifest)
+
+    assert [outcome.status for outcome in result.outcomes] == [
+        *[RowStatus.INVALID] * 5,
+        RowStatus.ADDED,
+    ]
+    assert [outcome.errors[0].field for outcome in result.outcomes[:5]] == [
+        *["entry"] * 4,
+        "asset",
+    ]
+
+
+def test_service_load_assets_bulk_invalid_batch_size(
+    asset_service: OtherWorldAssetService,
+):
+    with pytest.raises(ValueError):
+        asset_service.load_assets_bulk(file_path="unused.json", batch_size=0)
+
+
+def test_service_cache(asset_service: OtherWorldAssetService):
+    asset = asset_service.add_asset(Asset(name=CHARACTER_NAME, asset_type=ASSET_TYPE))
+    asset_version = AssetVersion(
+        asset=asset.id, department=DEPARTMENT, status=VERSION_STATUS
+    )
+
+    asset_service.add_asset_version(asset, asset_version)
+
+    assert len(asset_service.list_asset_versions(asset.name)) == 1
+    assert len(asset_service.list_asset_versions(asset.name)) == 1
+
+    cache_info = asset_service.cache_info()
+
+    assert cache_info["assets"].hits == 1
+    assert cache_info["asset_versions"].hits == 1
+
+    # Adding a version must invalidate the cached version list
+    asset_service.add_asset_version(asset, asset_version)
+
+    assert len(asset_service.list_asset_versions(asset.name)) == 2
+
+
+def test_service_cache_copies(asset_service: OtherWorldAssetService):
+    asset = asset_service.add_asset(Asset(name=CHARACTER_NAME, asset_type=ASSET_TYPE))
+    asset_service.add_asset_version(
+        asset, AssetVersion(asset.id, DEPARTMENT, status=VERSION_STATUS)
+    )
+
+    # Models returned on a miss and on a hit are modified without touching the cache
+    for _ in range(2):
+        asset_service.get_asset(CHARACTER_NAME).id = -1
+        asset_service.get_assets([CHARACTER_NAME])[CHARACTER_NAME].id = -1
+        asset_service.list_asset_versions(CHARACTER_NAME)[0].status = None
+        asset_service.list_asset_versions_for([asset.id])[asset.id][0].version = -1
+
+    assert asset_service.cache_info()["assets"].hits > 0
+    assert asset_service.cache_info()["asset_versions"].hits > 0
+    assert asset_service.get_asset(CHARACTER_NAME) == asset
+    assert asset_service.get_assets([CHARACTER_NAME]) == {CHARACTER_NAME: asset}
+    assert asset_service.list_asset_versions(CHARACTER_NAME) == [
+        AssetVersion(asset.id, DEPARTMENT, version=1, status=VERSION_STATUS)
+    ]
+    assert asset_service.list_asset_versions_for([asset.id]) == {
+        asset.id: [AssetVersion(asset.id, DEPARTMENT, version=1, status=VERSION_STATUS)]
+    }
+
+
+def test_service_cache_concurrent_write(
+    asset_service: OtherWorldAssetService, monkeypatch
+):
+    asset = asset_service.add_asset(Asset(name=CHARACTER_NAME, asset_type=ASSET_TYPE))
+    data_store = asset_service._data_store
+    list_asset_versions = data_store.list_asset_versions
+
+    def list_asset_versions_then_write(asset_id: int) -> list[AssetVersion]:
+        asset_versions = list_asset_versions(asset_id=asset_id)
+
+        # Another thread adds a version after the read but before it is cached
+        monkeypatch.setattr(data_store, "list_asset_versions", list_asset_versions)
+        asset_service.add_asset_version(
+            asset, AssetVersion(asset.id, DEPARTMENT, status=VERSION_STATUS)
+        )
+
+        return asset_versions
+
+    monkeypatch.setattr(
+        data_store, "list_asset_versions", list_asset_versions_then_write
+    )
+
+    assert asset_service.list_asset_versions(asset.name) == []
+    assert len(asset_service.list_asset_versions(asset.name)) == 1
+
+
+def test_service_close():
+    data_store = ArrayDatabase()
+    asset_service = OtherWorldAssetService(
+        data_store_path=None,
+        asset_pipeline=build_default_asset_pipeline(),
+        asset_version_pipeline=build_default_asset_version_pipeline(),
+        data_store=data_store,
+    )
+    asset_service.add_asset(Asset(name=CHARACTER_NAME, asset_type=ASSET_TYPE))
+
+    asset_service.close()
+
+    assert data_store.list_assets() == []
+
+
+def test_service_get_assets(asset_service: OtherWorldAssetService):
+    asset = asset_service.add_asset(Asset(name=CHARACTER_NAME, asset_type=ASSET_TYPE))
+    asset_service.add_asset_version(
+        asset,
+        AssetVersion(asset=asset.id, department=DEPARTMENT, status=VERSION_STATUS),
+    )
+
+    assets = asset_service.get_assets([CHARACTER_NAME, (CHARACTER_NAME, ASSET_TYPE)])
+
+    assert assets[CHARACTER_NAME] == asset
+    assert assets[(CHARACTER_NAME, ASSET_TYPE)] == asset
+
+    asset_versions = asset_service.list_asset_versions_for([asset.id])
+
+    assert len(asset_versions[asset.id]) == 1
+
+
+def test_service_iter_asset_versions(asset_service: OtherWorldAssetService):
+    asset = asset_service.add_asset(Asset(name=CHARACTER_NAME, asset_type=ASSET_TYPE))
+
+    for _ in range(3):
+        asset_service.add_asset_version(
+            asset,
+            AssetVersion(asset=asset.id, department=DEPARTMENT, status=VERSION_STATUS),
+        )
+
+    page = asset_service.list_asset_versions_page(CHARACTER_NAME, page_size=2)
+
+    assert len(page.items) == 2
+    assert len(list(asset_service.iter_asset_versions(CHARACTER_NAME))) == 3
+    assert list(asset_service.iter_assets()) == [asset]
+
+
+def test_service_load_assets_parallel(
+    asset_service: OtherWorldAssetService, tmp_path: Path
+):
+    tests_directory = Path(__file__).parent
+    sample_data = tests_directory / "sample_data.json"
+
+    result = asset_service.load_assets_parallel(
+        file_path=sample_data, workers=2, chunk_size=4
+    )
+
+    bulk_asset_service = OtherWorldAssetService(
+        data_store_path=tmp_path / "bulk_sqlite_database.db",
+        asset_pipeline=build_default_asset_pipeline(),
+        asset_version_pipeline=build_default_asset_version_pipeline(),
+    )
+    bulk_result = bulk_asset_service.load_assets_bulk(file_path=sample_data)
+
+    # Entries are persisted in manifest order, just as a sequential load would
+    assert [outcome.index for outcome in result.outcomes] == list(range(result.rows))
+    assert [outcome.status for outcome in result.outcomes] == [
+        outcome.status for outcome in bulk_result.outcomes
+    ]
+
+
+def test_service_load_assets_parallel_unpicklable_rule(sqlite_database: Path):
+    class AssetNameIsLowercaseRule:
+        def validate(self, asset: Asset) -> list:
+            return []
+
+    asset_service = OtherWorldAssetService(
+        data_store_path=sqlite_database,
+        asset_pipeline=ValidationPipeline[Asset](rules=[AssetNameIsLowercaseRule()]),
+        asset_version_pipeline=build_default_asset_version_pipeline(),
+    )
+
+    with pytest.raises(TypeError):
+        asset_service.load_assets_parallel(file_path="unused.json")
+
+
+def test_service_load_assets_incremental(
+    asset_service: OtherWorldAssetService, tmp_path: Path
+):
+    sample_data = Path(__file__).parent / "sample_data.json"
+
+    result = asset_service.load_assets_incremental(sample_data, batch_size=4)
+
+    # The duplicate entry repeats a record of an earlier batch, so is already skipped
+    assert (result.rows, result.unchanged, result.added, result.rejected) == (
+        21,
+        1,
+        18,
+        2,
+    )
+
+    # Re-sending the same manifest skips the whole file
+    result = asset_service.load_assets_incremental(sample_data)
+
+    assert result.file_unchanged
+    assert result.rows == 0
+
+    # A changed manifest only loads its new entries, and retries invalid entries
+    entries = json.loads(sample_data.read_text())
+    entries.append(
+        {
+            "asset": {"name": CHARACTER_NAME, "type": ASSET_TYPE.value},
+            "department": DEPARTMENT,
+            "version": 1,
+            "status": VERSION_STATUS.value,
+        }
+    )
+    changed_data = tmp_path / "changed_data.ndjson"
+    changed_data.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+
+    report = ImportReport()
+    result = asset_service.load_assets_incremental(
+        changed_data, batch_size=4, report=report
+    )
+
+    assert not result.file_unchanged
+    assert (result.rows, result.unchanged, result.added, result.rejected) == (
+        22,
+        19,
+        1,
+        2,
+    )
+    assert result.outcomes[-1].index == 21
+    assert report.rows == 3
+    assert asset_service.get_asset_version(CHARACTER_NAME, 1).department == DEPARTMENT
@@ -0,0 +1,106 @@
+import asyncio
+import pytest
+
+from pathlib import Path
+
+from otherworld_asset_service.api.async_service import AsyncOtherWorldAssetService
+from otherworld_asset_service.api.validation.pipelines.asset_pipeline import (
+    build_default_asset_pipeline,
+)
+from otherworld_asset_service.api.validation.pipelines.asset_version_pipeline import (
+    build_default_asset_version_pipeline,
+)
+from otherworld_asset_service.models.asset import Asset
+from otherworld_asset_service.models.asset_version import AssetVersion
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+
+
+ASSET_TYPE = AssetType.CHARACTER
+CHARACTER_NAME = "coraline"
+DEPARTMENT = "animation"
+VERSION_STATUS = VersionStatus.ACTIVE
+
+
+@pytest.fixture
+def async_asset_service(tmp_path: Path) -> AsyncOtherWorldAssetService:
+    """Test fixture to provide an async asset service instance for each test run.
+
+    Returns:
+        AsyncOtherWorldAssetService: The service to execute tests on.
+    """
+
+    return AsyncOtherWorldAssetService(
+        data_store_path=tmp_path / "sqlite_database.db",
+        asset_pipeline=build_default_asset_pipeline(),
+        asset_version_pipeline=build_default_asset_version_pipeline(),
+    )
+
+
+def test_async_service_add_and_get(async_asset_service: AsyncOtherWorldAssetService):
+    async def run():
+        async with async_asset_service as service:
+            asset = await service.add_asset(
+                Asset(name=CHARACTER_NAME, asset_type=ASSET_TYPE)
+            )
+            await service.add_asset_version(
+                asset,
+                AssetVersion(
+                    asset=asset.id, department=DEPARTMENT, status=VERSION_STATUS
+                ),
+            )
+
+            return (
+                await service.get_asset(CHARACTER_NAME),
+                await service.get_asset_version(CHARACTER_NAME, 1),
+                await service.list_asset_versions(CHARACTER_NAME),
+            )
+
+    found_asset, found_asset_version, asset_versions = asyncio.run(run())
+
+    assert found_asset.name == CHARACTER_NAME
+    assert found_asset_version.version == 1
+    assert len(asset_versions) == 1
+
+
+def test_async_service_coalesces_reads(
+    async_asset_service: AsyncOtherWorldAssetService,
+):
+    async def run():
+        async with async_asset_service as service:
+            await service.add_asset(Asset(name=CHARACTER_NAME, asset_type=ASSET_TYPE))
+
+            return await asyncio.gather(
+                *(service.get_asset(CHARACTER_NAME) for _ in range(20))
+            )
+
+    found_assets = asyncio.run(run())
+
+    assert all(found_asset.name == CHARACTER_NAME for found_asset in found_assets)
+
+    # Every request was served by a single lookup through the service
+    cache_info = async_asset_service.cache_info()["assets"]
+
+    assert cache_info.hits + cache_info.misses == 1
+
+
+def test_async_service_close(
+    async_asset_service: AsyncOtherWorldAssetService, monkeypatch
+):
+    data_store = async_asset_service._service._data_store
+    close = data_store.close
+    closed = []
+
+    def record_close() -> None:
+        # Every storage call has finished by the time the data store is closed
+        closed.append(async_asset_service._executor._shutdown)
+        close()
+
+    monkeypatch.setattr(data_store, "close", record_close)
+
+    async def run():
+        async with async_asset_service as service:
+            await service.add_asset(Asset(name=CHARACTER_NAME, asset_type=ASSET_TYPE))
+
+    asyncio.run(run())
+
+    assert closed == [True]
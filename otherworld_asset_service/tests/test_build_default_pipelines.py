@@ -1,9 +1,14 @@
+from otherworld_asset_service.api.validation.errors import ValidationError
 from otherworld_asset_service.api.validation.pipelines.asset_pipeline import (
     build_default_asset_pipeline,
 )
 from otherworld_asset_service.api.validation.pipelines.asset_version_pipeline import (
     build_default_asset_version_pipeline,
 )
+from otherworld_asset_service.api.validation.validation import (
+    NO_ERRORS,
+    ValidationPipeline,
+)
 from otherworld_asset_service.models.asset import Asset
 from otherworld_asset_service.models.enums import AssetType
 from otherworld_asset_service.models.asset_version import AssetVersion
@@ -72,3 +77,112 @@ def test_build_default_asset_version_pipeline():
 
     assert fields.count("department") == 1
     assert fields.count("version") == 1
+
+
+def test_compiled_asset_pipeline():
+    pipeline = build_default_asset_pipeline()
+    validate = pipeline.compile()
+
+    asset = Asset(name="coraline", asset_type=AssetType.CHARACTER)
+
+    # The success path returns the shared empty result rather than a new list
+    assert validate(asset) is NO_ERRORS
+
+    asset.name = None
+    asset.asset_type = 1
+
+    assert list(validate(asset)) == pipeline.validate(asset)
+    assert len(pipeline.compile(fail_fast=True)(asset)) == 1
+
+
+def test_compiled_pipeline_custom_rule():
+    class AssetNameIsLowercaseRule:
+        def validate(self, asset: Asset) -> list[ValidationError]:
+            if asset.name.islower():
+                return []
+
+            return [ValidationError(field="name", message="Name must be lowercase")]
+
+    pipeline = ValidationPipeline[Asset](rules=[AssetNameIsLowercaseRule()])
+    validate = pipeline.compile()
+
+    assert validate(Asset(name="coraline", asset_type=AssetType.CHARACTER)) == ()
+    assert validate(Asset(name="Coraline", asset_type=AssetType.CHARACTER)) == [
+        ValidationError(field="name", message="Name must be lowercase")
+    ]
+
+
+def test_memoized_pipeline():
+    pipeline = build_default_asset_pipeline(memo_size=8)
+    validate = pipeline.compile()
+
+    asset = Asset(name="coraline", asset_type=AssetType.CHARACTER)
+
+    assert pipeline.validate(asset) == []
+    assert validate(asset) == ()
+    assert validate(Asset(name="coraline", asset_type=AssetType.CHARACTER)) == ()
+
+    memo_info = pipeline.memo_info()
+
+    assert memo_info.hits == 2
+    assert memo_info.misses == 1
+
+    # Changing a field, or only its type, must miss the memo
+    asset.name = 1
+    assert len(pipeline.validate(asset)) == 1
+
+    asset.name = True
+    assert len(pipeline.validate(asset)) == 1
+
+    assert pipeline.memo_info().misses == 3
+
+
+def test_pipeline_without_memo():
+    pipeline = build_default_asset_pipeline()
+
+    assert pipeline.memo_info() is None
+
+
+def test_profiled_pipeline():
+    pipeline = build_default_asset_pipeline()
+    profile = pipeline.enable_profiling()
+    validate = pipeline.compile()
+
+    pipeline.validate(Asset(name="coraline", asset_type=AssetType.CHARACTER))
+    validate(Asset(name=None, asset_type=AssetType.CHARACTER))
+
+    stats = profile.stats()
+
+    assert len(stats) == 4
+    assert stats["AssetNameIsRequiredRule"].calls == 2
+    assert stats["AssetNameIsRequiredRule"].failures == 1
+    assert stats["AssetTypeIsValidRule"].failures == 0
+    assert all(rule_stats.seconds >= 0 for rule_stats in stats.values())
+
+    table = profile.format_table().splitlines()
+
+    assert table[0].split()[:3] == ["Rule", "Calls", "Failures"]
+    assert len(table) == 6
+
+    profile.reset()
+    assert profile.stats() == {}
+
+    pipeline.disable_profiling()
+    pipeline.validate(Asset(name="coraline", asset_type=AssetType.CHARACTER))
+
+    assert pipeline.profile is None
+    assert profile.stats() == {}
+
+
+def test_profiled_columnar_pipeline():
+    pipeline = build_default_asset_pipeline()
+    profile = pipeline.enable_profiling()
+
+    pipeline.validate_many(
+        {"name": ["coraline", "", "wybie"], "type": ["character"] * 3}
+    )
+
+    stats = profile.stats()
+
+    assert stats["AssetNameIsRequiredRule"].calls == 3
+    assert stats["AssetNameIsRequiredRule"].failures == 1
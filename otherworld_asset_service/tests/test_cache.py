@@ -0,0 +1,71 @@
+import pytest
+
+from otherworld_asset_service.utils.cache import LRUCache
+
+
+def test_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+
+    cache.put("coraline", 1)
+    cache.put("wybie", 2)
+
+    # Touch the first entry so the second becomes the least recently used
+    assert cache.get("coraline") == 1
+
+    cache.put("beldam", 3)
+
+    assert cache.get("wybie") is None
+    assert cache.get("coraline") == 1
+    assert cache.get("beldam") == 3
+
+
+def test_cache_info():
+    cache = LRUCache(max_size=2)
+
+    cache.put("coraline", 1)
+    cache.get("coraline")
+    cache.get("wybie")
+
+    cache_info = cache.info()
+
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+    assert cache_info.size == 1
+    assert cache_info.max_size == 2
+
+
+def test_cache_invalidate():
+    cache = LRUCache(max_size=2)
+
+    cache.put("coraline", 1)
+    cache.invalidate("coraline")
+
+    assert cache.get("coraline") is None
+
+
+def test_cache_put_after_invalidate():
+    cache = LRUCache(max_size=2)
+
+    # A value read before the key is invalidated must not be cached over the write
+    generation = cache.generation("coraline")
+    cache.invalidate("coraline")
+    cache.put("coraline", 1, generation=generation)
+
+    assert cache.get("coraline") is None
+
+    cache.put("coraline", 2, generation=cache.generation("coraline"))
+
+    assert cache.get("coraline") == 2
+
+
+def test_cache_disabled():
+    cache = LRUCache(max_size=0)
+
+    cache.put("coraline", 1)
+
+    assert cache.get("coraline") is None
+
+
+def test_cache_invalid_size():
+    with pytest.raises(ValueError):
+        LRUCache(max_size=-1)
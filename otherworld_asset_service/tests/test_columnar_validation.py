@@ -0,0 +1,154 @@
+import pytest
+
+from otherworld_asset_service.api.validation import columnar
+from otherworld_asset_service.api.validation.errors import ValidationError
+from otherworld_asset_service.api.validation.pipelines.asset_pipeline import (
+    build_default_asset_pipeline,
+)
+from otherworld_asset_service.api.validation.pipelines.asset_version_pipeline import (
+    build_default_asset_version_pipeline,
+)
+from otherworld_asset_service.api.validation.validation import ValidationPipeline
+from otherworld_asset_service.models.asset import Asset
+from otherworld_asset_service.models.asset_version import AssetVersion
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+
+
+ASSETS = [
+    Asset("coraline", AssetType.CHARACTER),
+    Asset(None, AssetType.PROP),
+    Asset("", 1),
+    Asset(1, None),
+]
+
+ASSET_VERSIONS = [
+    AssetVersion(1, "animation", version=1, status=VersionStatus.ACTIVE),
+    AssetVersion(1, "modeling", version=None, status="inactive"),
+    AssetVersion(1, "", version=0, status="deprecated"),
+    AssetVersion(1, None, version=3, status=None),
+]
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    """Test fixture to run each test with and without the NumPy fast path."""
+
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columnar, "numpy", None)
+
+    return request.param
+
+
+def assert_matches_validate(pipeline, subjects, result):
+    for row, subject in enumerate(subjects):
+        assert result.row_errors(row) == pipeline.validate(subject)
+
+    expected_failing_rows = [
+        row for row, subject in enumerate(subjects) if pipeline.validate(subject)
+    ]
+
+    assert result.failing_rows() == expected_failing_rows
+    assert [row for row, _ in result.iter_errors()] == expected_failing_rows
+
+
+def test_validate_many_assets(backend: str):
+    pipeline = build_default_asset_pipeline()
+
+    result = pipeline.validate_many(
+        {
+            "name": [asset.name for asset in ASSETS],
+            "type": [asset.asset_type for asset in ASSETS],
+        }
+    )
+
+    assert not result.is_valid
+    assert_matches_validate(pipeline, ASSETS, result)
+
+
+def test_validate_many_asset_versions(backend: str):
+    pipeline = build_default_asset_version_pipeline()
+
+    result = pipeline.validate_many(
+        {
+            "department": [version.department for version in ASSET_VERSIONS],
+            "version": [version.version for version in ASSET_VERSIONS],
+            "status": [version.status for version in ASSET_VERSIONS],
+        }
+    )
+
+    assert_matches_validate(pipeline, ASSET_VERSIONS, result)
+
+
+def test_validate_many_typed_columns(backend: str):
+    pipeline = build_default_asset_version_pipeline()
+
+    # Homogeneous columns take the vectorized path when NumPy is available
+    result = pipeline.validate_many(
+        {
+            "department": ["animation", "", "fx"],
+            "version": [1, 2, 0],
+            "status": ["active", "inactive", "deprecated"],
+        }
+    )
+
+    assert result.failing_rows() == [1, 2]
+    assert [error.field for error in result.row_errors(1)] == ["department"]
+    assert [error.field for error in result.row_errors(2)] == ["version", "status"]
+
+
+def test_validate_many_mixed_columns(backend: str):
+    # NumPy would coerce these columns to strings, hiding the values of the wrong type
+    assets = [Asset("x", AssetType.SET), Asset(5, AssetType.SET)]
+    asset_versions = [
+        AssetVersion(1, "modeling", version=1, status="active"),
+        AssetVersion(1, 3, version=2, status="active"),
+        AssetVersion(1, b"fx", version=3, status="active"),
+        AssetVersion(1, "\x00", version=True, status=1),
+    ]
+
+    asset_pipeline = build_default_asset_pipeline()
+    asset_result = asset_pipeline.validate_many(
+        {
+            "name": [asset.name for asset in assets],
+            "type": [asset.asset_type for asset in assets],
+        }
+    )
+
+    asset_version_pipeline = build_default_asset_version_pipeline()
+    asset_version_result = asset_version_pipeline.validate_many(
+        {
+            "department": [version.department for version in asset_versions],
+            "version": [version.version for version in asset_versions],
+            "status": [version.status for version in asset_versions],
+        }
+    )
+
+    assert asset_result.failing_rows() == [1]
+    assert asset_version_result.failing_rows() == [1, 2, 3]
+    assert_matches_validate(asset_pipeline, assets, asset_result)
+    assert_matches_validate(
+        asset_version_pipeline, asset_versions, asset_version_result
+    )
+
+
+def test_validate_many_invalid_columns():
+    pipeline = build_default_asset_pipeline()
+
+    with pytest.raises(ValueError):
+        pipeline.validate_many({"name": ["coraline"], "type": []})
+
+    with pytest.raises(ValueError):
+        pipeline.validate_many({"name": ["coraline"]})
+
+
+def test_validate_many_unsupported_rule():
+    class AssetNameIsLowercaseRule:
+        def validate(self, asset: Asset) -> list[ValidationError]:
+            return []
+
+    pipeline = ValidationPipeline[Asset](rules=[AssetNameIsLowercaseRule()])
+
+    with pytest.raises(TypeError):
+        pipeline.validate_many({"name": ["coraline"]})
@@ -0,0 +1,118 @@
+import csv
+import json
+import pytest
+
+from pathlib import Path
+
+from otherworld_asset_service.api.service import OtherWorldAssetService
+from otherworld_asset_service.api.validation.pipelines.asset_pipeline import (
+    build_default_asset_pipeline,
+)
+from otherworld_asset_service.api.validation.pipelines.asset_version_pipeline import (
+    build_default_asset_version_pipeline,
+)
+
+
+SAMPLE_DATA_PATH = Path(__file__).parent / "sample_data.json"
+
+
+def create_service(data_store_path: Path) -> OtherWorldAssetService:
+    return OtherWorldAssetService(
+        data_store_path=data_store_path,
+        asset_pipeline=build_default_asset_pipeline(),
+        asset_version_pipeline=build_default_asset_version_pipeline(),
+    )
+
+
+@pytest.fixture
+def asset_service(tmp_path: Path) -> OtherWorldAssetService:
+    """Test fixture to provide an asset service loaded with the sample data.
+
+    Returns:
+        OtherWorldAssetService: The service to export from.
+    """
+
+    asset_service = create_service(tmp_path / "sqlite_database.db")
+    asset_service.load_assets(SAMPLE_DATA_PATH)
+
+    return asset_service
+
+
+def manifest_entries(asset_service: OtherWorldAssetService) -> list[tuple]:
+    assets = asset_service.list_assets()
+    asset_versions = asset_service.list_asset_versions_for(
+        asset.id for asset in assets
+    )
+
+    return sorted(
+        (
+            asset.name,
+            asset.asset_type.value,
+            asset_version.department,
+            asset_version.version,
+            asset_version.status.value,
+        )
+        for asset in assets
+        for asset_version in asset_versions[asset.id]
+    )
+
+
+@pytest.mark.parametrize("suffix", [".json", ".ndjson"])
+def test_export_round_trip(
+    asset_service: OtherWorldAssetService, tmp_path: Path, suffix: str
+):
+    export_path = tmp_path / "export{}".format(suffix)
+
+    result = asset_service.export_assets(export_path, page_size=2)
+
+    imported_service = create_service(tmp_path / "imported.db")
+    report = imported_service.load_assets(export_path)
+
+    assert result.rows == report.rows == report.added
+    assert manifest_entries(imported_service) == manifest_entries(asset_service)
+
+
+def test_export_json_shape(asset_service: OtherWorldAssetService, tmp_path: Path):
+    export_path = tmp_path / "export.json"
+
+    asset_service.export_assets(export_path)
+
+    exported = json.loads(export_path.read_text(encoding="utf-8"))
+    sample = json.loads(SAMPLE_DATA_PATH.read_text(encoding="utf-8"))
+
+    assert exported[0] == sample[0]
+    assert set(exported[0]) == {"asset", "department", "version", "status"}
+
+
+def test_export_csv_with_filters(
+    asset_service: OtherWorldAssetService, tmp_path: Path
+):
+    export_path = tmp_path / "export.csv"
+
+    result = asset_service.export_assets(
+        export_path, asset_types=["character"], departments=["modeling"]
+    )
+
+    with export_path.open(newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+
+    assert result.export_format == "csv"
+    assert len(rows) == result.rows > 0
+    assert {(row["type"], row["department"]) for row in rows} == {
+        ("character", "modeling")
+    }
+
+
+def test_export_errors(asset_service: OtherWorldAssetService, tmp_path: Path):
+    with pytest.raises(ValueError):
+        asset_service.export_assets(tmp_path / "export.json", export_format="xml")
+
+    with pytest.raises(ValueError):
+        asset_service.export_assets(tmp_path / "export.json", statuses=["retired"])
+
+    # Invalid page sizes are rejected before the file is created
+    for page_size in (0, -1):
+        with pytest.raises(ValueError):
+            asset_service.export_assets(tmp_path / "paged.json", page_size=page_size)
+
+    assert not (tmp_path / "paged.json").exists()
@@ -0,0 +1,221 @@
+import asyncio
+import http.client
+import json
+import pytest
+
+from pathlib import Path
+from urllib.parse import quote
+
+from otherworld_asset_service.api.async_service import AsyncOtherWorldAssetService
+from otherworld_asset_service.api.http_service import AssetHTTPService
+from otherworld_asset_service.api.validation.pipelines.asset_pipeline import (
+    build_default_asset_pipeline,
+)
+from otherworld_asset_service.api.validation.pipelines.asset_version_pipeline import (
+    build_default_asset_version_pipeline,
+)
+
+
+CHARACTER_NAME = "coraline"
+DEPARTMENT = "animation"
+
+
+@pytest.fixture
+def async_asset_service(tmp_path: Path) -> AsyncOtherWorldAssetService:
+    """Test fixture to provide an async asset service instance for each test run.
+
+    Returns:
+        AsyncOtherWorldAssetService: The service to serve over HTTP.
+    """
+
+    return AsyncOtherWorldAssetService(
+        data_store_path=tmp_path / "sqlite_database.db",
+        asset_pipeline=build_default_asset_pipeline(),
+        asset_version_pipeline=build_default_asset_version_pipeline(),
+    )
+
+
+def run_client(async_asset_service, client):
+    """Serve the service on a free local port and run a blocking client against it.
+
+    Args:
+        async_asset_service (AsyncOtherWorldAssetService): The service to serve.
+        client (Callable[[http.client.HTTPConnection], Any]): Makes requests over a
+            single connection to the service.
+
+    Returns:
+        Any: The result of the client.
+    """
+
+    async def run():
+        async with async_asset_service as service:
+            async with AssetHTTPService(service, port=0) as http_service:
+                connection = http.client.HTTPConnection(
+                    "127.0.0.1", http_service.port, timeout=5
+                )
+
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(
+                        None, client, connection
+                    )
+                finally:
+                    connection.close()
+
+    return asyncio.run(run())
+
+
+def request(connection, method, path, body=None):
+    headers = {"Content-Type": "application/json"} if body is not None else {}
+    connection.request(
+        method,
+        path,
+        body=None if body is None else json.dumps(body),
+        headers=headers,
+    )
+    response = connection.getresponse()
+
+    return response.status, json.loads(response.read())
+
+
+def test_add_and_get(async_asset_service):
+    def client(connection):
+        added_asset = request(
+            connection, "POST", "/assets", {"name": CHARACTER_NAME, "type": "set"}
+        )
+        sock = connection.sock
+
+        responses = [
+            added_asset,
+            request(
+                connection,
+                "POST",
+                "/assets/{}/versions".format(CHARACTER_NAME),
+                {"department": DEPARTMENT, "status": "active"},
+            ),
+            request(connection, "GET", "/assets/{}".format(CHARACTER_NAME)),
+            request(connection, "GET", "/assets/{}/versions/1".format(CHARACTER_NAME)),
+            request(connection, "GET", "/assets/{}/versions".format(CHARACTER_NAME)),
+            request(connection, "GET", "/assets?page_size=1"),
+        ]
+
+        # Every request was served over the same keep-alive connection
+        responses.append(connection.sock is sock)
+
+        return responses
+
+    (
+        added_asset,
+        added_asset_version,
+        found_asset,
+        found_asset_version,
+        asset_versions,
+        assets,
+        kept_alive,
+    ) = run_client(async_asset_service, client)
+
+    asset = {"id": 1, "name": CHARACTER_NAME, "type": "set"}
+    asset_version = {
+        "asset": 1,
+        "department": DEPARTMENT,
+        "version": 1,
+        "status": "active",
+    }
+
+    assert added_asset == (201, {"status": "added", "asset": asset})
+    assert added_asset_version == (201, asset_version)
+    assert found_asset == (200, asset)
+    assert found_asset_version == (200, asset_version)
+    assert asset_versions == (200, {"items": [asset_version], "next_page_token": None})
+    assert assets == (200, {"items": [asset], "next_page_token": None})
+    assert kept_alive
+
+
+def test_batch(async_asset_service):
+    def client(connection):
+        for name in (CHARACTER_NAME, "wybie"):
+            request(connection, "POST", "/assets", {"name": name, "type": "character"})
+
+        request(
+            connection,
+            "POST",
+            "/assets/{}/versions".format(CHARACTER_NAME),
+            {"department": DEPARTMENT, "status": "active"},
+        )
+
+        return request(
+            connection,
+            "POST",
+            "/assets/batch",
+            {
+                "keys": [CHARACTER_NAME, ["wybie", "character"], ["wybie", "set"]],
+                "versions": True,
+            },
+        )
+
+    status, body = run_client(async_asset_service, client)
+
+    assert status == 200
+    assert [result["key"] for result in body["results"]] == [
+        CHARACTER_NAME,
+        ["wybie", "character"],
+        ["wybie", "set"],
+    ]
+    assert [len(result["versions"]) for result in body["results"][:2]] == [1, 0]
+    assert body["results"][2] == {"key": ["wybie", "set"], "asset": None}
+
+
+def test_errors(async_asset_service):
+    versions_path = "/assets/{}/versions".format(CHARACTER_NAME)
+    asset_version = {"department": DEPARTMENT, "status": "active"}
+    requests = [
+        ("GET", "/assets/beldam", None),
+        ("GET", versions_path + "/2", None),
+        ("POST", "/assets", {"name": "", "type": "fx"}),
+        ("POST", "/assets", {"name": "cat", "type": "ghost"}),
+        ("GET", "/assets?page_token=nope", None),
+        ("DELETE", "/assets", None),
+        ("GET", "/unknown", None),
+        ("POST", versions_path, {"department": DEPARTMENT, "version": 0}),
+        ("POST", versions_path, {**asset_version, "version": "abc"}),
+        ("POST", versions_path, {**asset_version, "version": 1.5}),
+        ("POST", versions_path, {**asset_version, "version": True}),
+    ]
+
+    def client(connection):
+        request(connection, "POST", "/assets", {"name": CHARACTER_NAME, "type": "fx"})
+
+        statuses = [request(connection, *arguments)[0] for arguments in requests]
+
+        return statuses, request(connection, "GET", versions_path)[1]
+
+    statuses, asset_versions = run_client(async_asset_service, client)
+
+    # Rejected versions are never stored
+    assert asset_versions == {"items": [], "next_page_token": None}
+    assert statuses == [
+        404,
+        404,
+        422,
+        422,
+        400,
+        405,
+        404,
+        422,
+        422,
+        422,
+        422,
+    ]
+
+
+def test_encoded_names(async_asset_service):
+    name = "other world/button"
+
+    def client(connection):
+        request(connection, "POST", "/assets", {"name": name, "type": "prop"})
+
+        return request(connection, "GET", "/assets/{}".format(quote(name, safe="")))
+
+    assert run_client(async_asset_service, client) == (
+        200,
+        {"id": 1, "name": name, "type": "prop"},
+    )
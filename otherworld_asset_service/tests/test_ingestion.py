@@ -0,0 +1,50 @@
+import json
+import pytest
+
+from pathlib import Path
+
+from otherworld_asset_service.api.ingestion import (
+    iter_json_entries,
+    iter_manifest_entries,
+    iter_ndjson_entries,
+)
+
+
+SAMPLE_DATA = Path(__file__).parent / "sample_data.json"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_iter_json_entries(chunk_size: int):
+    expected_entries = json.loads(SAMPLE_DATA.read_text())
+
+    entries = list(iter_json_entries(SAMPLE_DATA, chunk_size=chunk_size))
+
+    assert entries == expected_entries
+
+
+def test_iter_json_entries_empty_array(tmp_path: Path):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text("  [ ]  ")
+
+    assert list(iter_json_entries(manifest)) == []
+
+
+@pytest.mark.parametrize("contents", ["{}", "[{}", "[{} {}]", ""])
+def test_iter_json_entries_malformed(tmp_path: Path, contents: str):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(contents)
+
+    with pytest.raises(ValueError):
+        list(iter_json_entries(manifest, chunk_size=2))
+
+
+def test_iter_ndjson_entries(tmp_path: Path):
+    expected_entries = json.loads(SAMPLE_DATA.read_text())
+
+    manifest = tmp_path / "manifest.ndjson"
+    manifest.write_text(
+        "\n\n".join(json.dumps(entry) for entry in expected_entries) + "\n"
+    )
+
+    assert list(iter_ndjson_entries(manifest)) == expected_entries
+    assert list(iter_manifest_entries(manifest)) == expected_entries
@@ -0,0 +1,194 @@
+import io
+import json
+import logging
+import multiprocessing
+import os
+import pytest
+import queue
+import sys
+
+from otherworld_asset_service.utils import logger
+
+
+@pytest.fixture
+def stream():
+    """Test fixture to capture the output of every logger, restoring it afterwards.
+
+    Yields:
+        io.StringIO: The stream every logger writes to.
+    """
+
+    stream = io.StringIO()
+
+    yield stream
+
+    logger.stop_logging()
+    logger.configure_logging(level=logging.INFO, stream=sys.stderr)
+
+
+def read_lines(stream: io.StringIO) -> list[str]:
+    # Wait for the background thread to write every queued record
+    logger.stop_logging()
+
+    return stream.getvalue().splitlines()
+
+
+def test_get_logger_is_idempotent(stream: io.StringIO):
+    test_logger = logger.get_logger("Test Logger")
+
+    assert logger.get_logger("Test Logger") is test_logger
+    assert len(test_logger.handlers) == 1
+    assert not test_logger.propagate
+
+
+def test_lazy_formatting(stream: io.StringIO):
+    formatted = []
+
+    class Argument:
+        def __init__(self, label: str) -> None:
+            self.label = label
+
+        def __str__(self) -> str:
+            formatted.append(self.label)
+            return self.label
+
+    logger.configure_logging(stream=stream)
+    test_logger = logger.get_logger("Test Logger")
+
+    test_logger.debug("Disabled %s", Argument("disabled"))
+    test_logger.info("Enabled %s", Argument("enabled"))
+
+    assert read_lines(stream) == ["[INFO] Test Logger: Enabled enabled"]
+    assert "disabled" not in formatted
+
+
+def test_json_output(stream: io.StringIO):
+    logger.configure_logging(json_output=True, stream=stream)
+    test_logger = logger.get_logger("Test Logger")
+
+    test_logger.warning("Loaded %s rows", 10, extra={"rows": 10})
+
+    record = json.loads(read_lines(stream)[0])
+
+    assert record["level"] == "WARNING"
+    assert record["logger"] == "Test Logger"
+    assert record["message"] == "Loaded 10 rows"
+    assert record["rows"] == 10
+
+
+def test_json_output_exception(stream: io.StringIO):
+    logger.configure_logging(json_output=True, stream=stream)
+    test_logger = logger.get_logger("Test Logger")
+
+    try:
+        raise ValueError("beldam")
+    except ValueError:
+        test_logger.exception("Failed")
+
+    record = json.loads(read_lines(stream)[0])
+
+    assert record["message"] == "Failed"
+    assert "ValueError: beldam" in record["exception"]
+
+
+def test_queued_records_are_not_formatted():
+    try:
+        raise ValueError("beldam")
+    except ValueError:
+        exc_info = sys.exc_info()
+
+    record = logging.LogRecord(
+        "Test", logging.ERROR, "", 0, "Failed %s", ("beldam",), exc_info
+    )
+    handler = logger.BackgroundQueueHandler(queue.SimpleQueue())
+
+    # Formatting, including the exception, is left to the background thread
+    prepared = handler.prepare(record)
+
+    assert prepared.msg == "Failed %s"
+    assert prepared.args == ("beldam",)
+    assert prepared.exc_info is exc_info
+
+
+def log_from_child() -> None:
+    logger.get_logger("Test Logger").info("From child %s", os.getpid())
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="Requires fork"
+)
+def test_logging_after_fork(stream: io.StringIO, tmp_path):
+    log_path = tmp_path / "forked.log"
+
+    with log_path.open("w") as log_file:
+        logger.configure_logging(stream=log_file)
+
+        # Start the background thread in the parent, which the child does not inherit
+        logger.get_logger("Test Logger").info("From parent")
+
+        process = multiprocessing.get_context("fork").Process(target=log_from_child)
+        process.start()
+        process.join(timeout=10)
+
+        logger.stop_logging()
+        logger.configure_logging(stream=stream)
+
+    lines = log_path.read_text().splitlines()
+
+    assert process.exitcode == 0
+    assert lines == [
+        "[INFO] Test Logger: From parent",
+        "[INFO] Test Logger: From child {}".format(process.pid),
+    ]
+
+
+def test_rate_limit(stream: io.StringIO):
+    logger.configure_logging(stream=stream, rate_limit=2, rate_interval=60)
+    test_logger = logger.get_logger("Test Logger")
+
+    for index in range(5):
+        test_logger.info("Repeated %s", index)
+
+    test_logger.info("Different")
+
+    assert read_lines(stream) == [
+        "[INFO] Test Logger: Repeated 0",
+        "[INFO] Test Logger: Repeated 1",
+        "[INFO] Test Logger: Different",
+    ]
+
+
+def test_rate_limit_reports_suppressed():
+    rate_limit = logger.RateLimitFilter(1, interval=60)
+    first, second, third = (
+        logging.LogRecord("Test", logging.INFO, "", 0, "Repeated", None, None)
+        for _ in range(3)
+    )
+
+    assert rate_limit.filter(first)
+    assert not rate_limit.filter(second)
+
+    # Once the interval has passed, the next record reports the dropped repeats
+    rate_limit.interval = 0
+
+    assert rate_limit.filter(third)
+    assert third.suppressed == 1
+
+
+def test_sampling(stream: io.StringIO):
+    logger.configure_logging(level=logging.DEBUG, stream=stream, sample_every=3)
+    test_logger = logger.get_logger("Test Logger")
+
+    for index in range(7):
+        test_logger.debug("Sampled %s", index)
+
+    test_logger.error("Never sampled")
+    test_logger.error("Never sampled")
+
+    assert read_lines(stream) == [
+        "[DEBUG] Test Logger: Sampled 0",
+        "[DEBUG] Test Logger: Sampled 3",
+        "[DEBUG] Test Logger: Sampled 6",
+        "[ERROR] Test Logger: Never sampled",
+        "[ERROR] Test Logger: Never sampled",
+    ]
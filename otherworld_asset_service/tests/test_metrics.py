@@ -0,0 +1,179 @@
+import gc
+import pytest
+import urllib.request
+
+from pathlib import Path
+
+from otherworld_asset_service.api.service import OtherWorldAssetService
+from otherworld_asset_service.api.validation.pipelines.asset_pipeline import (
+    build_default_asset_pipeline,
+)
+from otherworld_asset_service.api.validation.pipelines.asset_version_pipeline import (
+    build_default_asset_version_pipeline,
+)
+from otherworld_asset_service.models.asset import Asset
+from otherworld_asset_service.models.enums import AssetType
+from otherworld_asset_service.utils import metrics
+
+
+@pytest.fixture
+def registry() -> metrics.MetricsRegistry:
+    """Test fixture to provide an empty metrics registry for each test run.
+
+    Returns:
+        MetricsRegistry: The registry to record to.
+    """
+
+    return metrics.MetricsRegistry()
+
+
+def test_counter(registry: metrics.MetricsRegistry):
+    counter = registry.counter("calls_total", "Calls.", labels=("method",))
+
+    counter.labels("get").inc()
+    counter.labels(method="get").inc(2)
+
+    assert registry.counter("calls_total", "Calls.", labels=("method",)) is counter
+    assert registry.get_sample_value("calls_total", {"method": "get"}) == 3
+
+    with pytest.raises(ValueError):
+        counter.labels("get").inc(-1)
+
+    with pytest.raises(ValueError):
+        registry.histogram("calls_total", "Calls.")
+
+
+def test_histogram(registry: metrics.MetricsRegistry):
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(value)
+
+    assert registry.get_sample_value("latency_seconds_bucket", {"le": "0.1"}) == 2
+    assert registry.get_sample_value("latency_seconds_bucket", {"le": "1"}) == 3
+    assert registry.get_sample_value("latency_seconds_bucket", {"le": "+Inf"}) == 4
+    assert registry.get_sample_value("latency_seconds_count") == 4
+    assert registry.get_sample_value("latency_seconds_sum") == pytest.approx(5.65)
+
+
+def test_timed(registry: metrics.MetricsRegistry):
+    timed = metrics.timed(
+        registry.histogram("duration_seconds", "Duration.", labels=("method",)),
+        registry.counter("errors_total", "Errors.", labels=("method",)),
+    )
+
+    @timed
+    def divide(numerator: int, denominator: int) -> float:
+        return numerator / denominator
+
+    assert divide(4, 2) == 2
+
+    with pytest.raises(ZeroDivisionError):
+        divide(1, 0)
+
+    labels = {"method": "divide"}
+
+    assert registry.get_sample_value("duration_seconds_count", labels) == 2
+    assert registry.get_sample_value("errors_total", labels) == 1
+
+
+def test_collectors_are_merged_and_weak(registry: metrics.MetricsRegistry):
+    class Source:
+        def collect(self) -> list[metrics.MetricFamily]:
+            return [metrics.gauge_family("entries", "Entries.", [((), 2)])]
+
+    first, second = Source(), Source()
+    registry.register_collector(first.collect)
+    registry.register_collector(second.collect)
+
+    assert registry.get_sample_value("entries") == 4
+
+    del second
+    gc.collect()
+
+    assert registry.get_sample_value("entries") == 2
+
+
+def test_prometheus_text(registry: metrics.MetricsRegistry, tmp_path: Path):
+    registry.counter("calls_total", "Calls.", labels=("method",)).labels('a"b').inc()
+    registry.histogram("latency_seconds", "Latency.", buckets=(0.5,)).observe(0.25)
+
+    expected_text = "\n".join(
+        [
+            "# HELP calls_total Calls.",
+            "# TYPE calls_total counter",
+            'calls_total{method="a\\"b"} 1',
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{le="0.5"} 1',
+            'latency_seconds_bucket{le="+Inf"} 1',
+            "latency_seconds_sum 0.25",
+            "latency_seconds_count 1",
+            "",
+        ]
+    )
+
+    assert registry.to_prometheus_text() == expected_text
+
+    metrics_file = tmp_path / "metrics.prom"
+    registry.write_prometheus(metrics_file)
+
+    assert metrics_file.read_text() == expected_text
+    assert list(tmp_path.iterdir()) == [metrics_file]
+
+
+def test_serve_metrics(registry: metrics.MetricsRegistry):
+    registry.counter("calls_total", "Calls.").inc()
+
+    server = metrics.serve_metrics(0, registry=registry)
+
+    try:
+        url = "http://127.0.0.1:{}/metrics".format(server.server_address[1])
+
+        with urllib.request.urlopen(url) as response:
+            body = response.read().decode("utf-8")
+
+        assert response.headers["Content-Type"] == metrics.PROMETHEUS_CONTENT_TYPE
+        assert "calls_total 1" in body
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_service_metrics():
+    asset_pipeline = build_default_asset_pipeline(memo_size=8)
+    asset_pipeline.enable_profiling()
+
+    asset_service = OtherWorldAssetService(
+        ":memory:", asset_pipeline, build_default_asset_version_pipeline()
+    )
+
+    def sample(name: str, **labels: str) -> float:
+        return metrics.REGISTRY.get_sample_value(name, labels) or 0
+
+    calls = sample("otherworld_service_call_duration_seconds_count", method="add_asset")
+    queries = sample(
+        "otherworld_storage_query_duration_seconds_count", query="add_asset"
+    )
+
+    asset_service.add_asset(Asset(name="coraline", asset_type=AssetType.CHARACTER))
+    asset_service.get_asset("coraline")
+
+    assert (
+        sample("otherworld_service_call_duration_seconds_count", method="add_asset")
+        == calls + 1
+    )
+    assert (
+        sample("otherworld_storage_query_duration_seconds_count", query="add_asset")
+        == queries + 1
+    )
+    assert sample("otherworld_cache_entries", cache="assets") >= 1
+    assert sample("otherworld_validation_memo_misses_total", pipeline="asset") >= 1
+    assert (
+        sample(
+            "otherworld_validation_rule_calls_total",
+            pipeline="asset",
+            rule="AssetNameIsRequiredRule",
+        )
+        >= 1
+    )
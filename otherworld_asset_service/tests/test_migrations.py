@@ -0,0 +1,181 @@
+import pytest
+import sqlite3
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from otherworld_asset_service.models.asset import Asset
+from otherworld_asset_service.storage import migrations
+from otherworld_asset_service.models.asset_version import AssetVersion
+from otherworld_asset_service.models.enums import AssetType, VersionStatus
+from otherworld_asset_service.storage.migrations import (
+    SCHEMA_VERSION,
+    apply_migrations,
+    get_schema_version,
+)
+from otherworld_asset_service.storage.sqlite_database import SQLiteDatabase
+
+
+@pytest.fixture
+def legacy_database_path(tmp_path: Path) -> Path:
+    """Test fixture to provide a database created before schema versioning existed.
+
+    Returns:
+        Path: The path of the legacy database, containing a single asset version.
+    """
+
+    path = tmp_path / "legacy.db"
+
+    connection = sqlite3.connect(path)
+    connection.executescript(
+        """
+        CREATE TABLE assets (
+            asset_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            UNIQUE(name, type)
+        );
+
+        CREATE TABLE asset_versions (
+            asset_id INTEGER NOT NULL,
+            department TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            FOREIGN KEY(asset_id) REFERENCES assets(asset_id),
+            UNIQUE(asset_id, department, version)
+        );
+
+        INSERT INTO assets (name, type) VALUES ('coraline', 'character');
+        INSERT INTO asset_versions VALUES (1, 'animation', 1, 'active');
+        """
+    )
+    connection.close()
+
+    return path
+
+
+def test_apply_migrations_new_database():
+    connection = sqlite3.connect(":memory:")
+
+    assert apply_migrations(connection) == SCHEMA_VERSION
+    assert get_schema_version(connection) == SCHEMA_VERSION
+
+    # Applying migrations again should be a no-op
+    assert apply_migrations(connection) == SCHEMA_VERSION
+
+
+def test_upgrade_legacy_database(legacy_database_path: Path):
+    database = SQLiteDatabase(legacy_database_path)
+
+    try:
+        assert database.get_asset_version(asset_id=1, version=1) is not None
+    finally:
+        database.close()
+
+    connection = sqlite3.connect(legacy_database_path)
+
+    try:
+        assert get_schema_version(connection) == SCHEMA_VERSION
+
+        query_plan = connection.execute(
+            "EXPLAIN QUERY PLAN "
+            "SELECT * FROM asset_versions WHERE asset_id = ? AND version = ?",
+            (1, 1),
+        ).fetchall()
+    finally:
+        connection.close()
+
+    assert "COVERING INDEX" in query_plan[0][-1]
+
+
+def test_concurrent_upgrade_legacy_database(legacy_database_path: Path, monkeypatch):
+    # Both connections read the legacy schema version before either starts migrating
+    barrier = threading.Barrier(2)
+    waited = threading.local()
+    read_schema_version = migrations.get_schema_version
+
+    def get_schema_version_together(connection: sqlite3.Connection) -> int:
+        schema_version = read_schema_version(connection)
+
+        if not getattr(waited, "value", False):
+            waited.value = True
+            barrier.wait(timeout=5)
+
+        return schema_version
+
+    monkeypatch.setattr(migrations, "get_schema_version", get_schema_version_together)
+
+    def upgrade() -> int:
+        connection = sqlite3.connect(legacy_database_path, timeout=5)
+
+        try:
+            return apply_migrations(connection)
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(upgrade) for _ in range(2)]
+
+    assert [future.result() for future in futures] == [SCHEMA_VERSION] * 2
+
+    connection = sqlite3.connect(legacy_database_path)
+
+    try:
+        assert get_schema_version(connection) == SCHEMA_VERSION
+    finally:
+        connection.close()
+
+
+def test_apply_migrations_newer_database():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("PRAGMA user_version = {:d}".format(SCHEMA_VERSION + 1))
+
+    with pytest.raises(RuntimeError):
+        apply_migrations(connection)
+
+
+def test_upgrade_to_integer_codes(legacy_database_path: Path):
+    connection = sqlite3.connect(legacy_database_path)
+    connection.executescript(
+        """
+        INSERT INTO assets (name, type) VALUES ('coraline', 'prop');
+        INSERT INTO asset_versions VALUES (1, 'modeling', 1, 'inactive');
+        INSERT INTO asset_versions VALUES (2, 'animation', 1, 'active');
+        """
+    )
+    connection.close()
+
+    database = SQLiteDatabase(legacy_database_path)
+
+    try:
+        assert database.list_assets() == [
+            Asset("coraline", AssetType.CHARACTER, id=1),
+            Asset("coraline", AssetType.PROP, id=2),
+        ]
+        assert database.list_asset_versions(asset_id=1) == [
+            AssetVersion(1, "animation", version=1, status=VersionStatus.ACTIVE),
+            AssetVersion(1, "modeling", version=1, status=VersionStatus.INACTIVE),
+        ]
+
+        # Ids continue from the migrated assets, and departments are interned once
+        added_asset = database.add_asset(Asset("wybie", AssetType.CHARACTER))
+        database.add_asset_version(added_asset, AssetVersion(None, "animation"))
+
+        assert added_asset.id == 3
+    finally:
+        database.close()
+
+    connection = sqlite3.connect(legacy_database_path)
+
+    try:
+        departments = connection.execute("SELECT name FROM departments").fetchall()
+        version_columns = [
+            column[1]
+            for column in connection.execute("PRAGMA table_info(asset_versions)")
+        ]
+    finally:
+        connection.close()
+
+    assert departments == [("animation",), ("modeling",)]
+    assert version_columns == ["asset_id", "department_id", "version", "status_id"]
@@ -0,0 +1,54 @@
+import json
+
+from pathlib import Path
+
+from otherworld_asset_service.api.ingestion import RowOutcome, RowStatus
+from otherworld_asset_service.api.reporting import ImportReport
+from otherworld_asset_service.api.validation.errors import ValidationError
+
+
+NAME_ERROR = ValidationError(field="name", message="Asset must define a valid name")
+TYPE_ERROR = ValidationError(
+    field="type", message="Asset type must be of type AssetType"
+)
+
+
+def test_import_report_counts():
+    report = ImportReport(max_examples=2)
+
+    report.record(RowOutcome(0, RowStatus.ADDED))
+    report.record(RowOutcome(1, RowStatus.INVALID, errors=[NAME_ERROR, TYPE_ERROR]))
+    report.record(RowOutcome(2, RowStatus.INVALID, errors=[NAME_ERROR]))
+    report.record(RowOutcome(3, RowStatus.DUPLICATE, errors=[NAME_ERROR]))
+
+    assert (report.rows, report.added, report.rejected) == (4, 1, 3)
+    assert report.most_common_errors() == [(NAME_ERROR, 3), (TYPE_ERROR, 1)]
+
+    # Only a bounded sample of rejected entries is kept
+    assert [example.index for example in report.examples] == [1, 2]
+
+    summary = report.summary(limit=1).splitlines()
+
+    assert summary[0] == "Added 1 of 4 entries (2 invalid, 1 duplicates)"
+    assert len(summary) == 2
+    assert NAME_ERROR.message in summary[1]
+
+
+def test_import_report_reject_file(tmp_path: Path):
+    reject_file_path = tmp_path / "rejected.ndjson"
+    entry = {"asset": {"name": None, "type": "prop"}}
+
+    with ImportReport(reject_file_path=reject_file_path) as report:
+        report.record(RowOutcome(0, RowStatus.ADDED), {"asset": {}})
+        report.record(RowOutcome(1, RowStatus.INVALID, errors=[NAME_ERROR]), entry)
+
+    lines = reject_file_path.read_text().splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        {
+            "index": 1,
+            "status": "invalid",
+            "errors": [{"field": NAME_ERROR.field, "message": NAME_ERROR.message}],
+            "entry": entry,
+        }
+    ]
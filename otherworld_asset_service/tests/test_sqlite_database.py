@@ -1,6 +1,9 @@
 import pytest
 import sqlite3
 
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 from otherworld_asset_service.models.asset import Asset
 from otherworld_asset_service.models.asset_version import AssetVersion
 from otherworld_asset_service.models.enums import AssetType, VersionStatus
@@ -207,3 +210,210 @@ def test_duplicate_asset_versions(sqlite_database: SQLiteDatabase):
     # exception due to asset id, department, and version number defining uniqueness.
     with pytest.raises(sqlite3.IntegrityError):
         sqlite_database.add_asset_version(asset=asset, asset_version=asset_version_v2)
+
+
+def test_add_asset_versions_bulk(sqlite_database: SQLiteDatabase):
+    asset = Asset(name=CHARACTER_NAME, asset_type=AssetType.CHARACTER)
+
+    entries = [
+        (asset, AssetVersion(None, DEPARTMENT, status=VersionStatus.ACTIVE)),
+        (asset, AssetVersion(None, DEPARTMENT, status=VersionStatus.ACTIVE)),
+        (asset, AssetVersion(None, DEPARTMENT, version=1, status=VersionStatus.ACTIVE)),
+    ]
+
+    results = sqlite_database.add_asset_versions_bulk(entries)
+
+    # The duplicated version number should fail without discarding the rest of the batch
+    assert [result.version for result in results[:2]] == [1, 2]
+    assert isinstance(results[2], sqlite3.IntegrityError)
+    assert len(sqlite_database.list_asset_versions(asset_id=asset.id)) == 2
+
+
+@pytest.mark.parametrize("in_memory", [True, False])
+def test_concurrent_reads_and_writes(tmp_path: Path, in_memory: bool):
+    path = ":memory:" if in_memory else tmp_path / "sqlite_database.db"
+    database = SQLiteDatabase(path)
+
+    asset = database.add_asset(Asset(name=CHARACTER_NAME, asset_type=AssetType.PROP))
+
+    def add_and_read(_):
+        database.add_asset_version(
+            asset=asset,
+            asset_version=AssetVersion(
+                asset=asset.id, department=DEPARTMENT, status=VersionStatus.ACTIVE
+            ),
+        )
+
+        return database.get_asset(name=CHARACTER_NAME)
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            found_assets = list(executor.map(add_and_read, range(50)))
+
+        asset_versions = database.list_asset_versions(asset_id=asset.id)
+    finally:
+        database.close()
+
+    assert all(found_asset == asset for found_asset in found_assets)
+    assert [asset_version.version for asset_version in asset_versions] == list(
+        range(1, 51)
+    )
+
+
+def test_get_assets(sqlite_database: SQLiteDatabase):
+    character = sqlite_database.add_asset(
+        Asset(name=CHARACTER_NAME, asset_type=AssetType.CHARACTER)
+    )
+    prop = sqlite_database.add_asset(
+        Asset(name=CHARACTER_NAME, asset_type=AssetType.PROP)
+    )
+
+    assets = sqlite_database.get_assets(
+        [
+            CHARACTER_NAME,
+            (CHARACTER_NAME, AssetType.PROP),
+            (CHARACTER_NAME, AssetType.SET),
+            "DoesNotExist",
+        ]
+    )
+
+    assert assets == {
+        CHARACTER_NAME: character,
+        (CHARACTER_NAME, AssetType.PROP): prop,
+    }
+
+
+def test_get_assets_chunked(sqlite_database: SQLiteDatabase):
+    names = ["asset_{}".format(index) for index in range(1500)]
+
+    for name in names:
+        sqlite_database.add_asset(Asset(name=name, asset_type=AssetType.PROP))
+
+    assets = sqlite_database.get_assets(
+        names + [(name, AssetType.PROP) for name in names]
+    )
+
+    assert len(assets) == 3000
+
+
+def test_list_asset_versions_for(sqlite_database: SQLiteDatabase):
+    asset = sqlite_database.add_asset(
+        Asset(name=CHARACTER_NAME, asset_type=AssetType.CHARACTER)
+    )
+    another_asset = sqlite_database.add_asset(
+        Asset(name=CHARACTER_NAME, asset_type=AssetType.PROP)
+    )
+
+    for _ in range(2):
+        sqlite_database.add_asset_version(
+            asset=asset,
+            asset_version=AssetVersion(
+                asset=asset.id, department=DEPARTMENT, status=VersionStatus.ACTIVE
+            ),
+        )
+
+    asset_versions = sqlite_database.list_asset_versions_for(
+        [asset.id, another_asset.id]
+    )
+
+    assert [asset_version.version for asset_version in asset_versions[asset.id]] == [
+        1,
+        2,
+    ]
+    assert asset_versions[another_asset.id] == []
+
+
+def test_list_assets_page(sqlite_database: SQLiteDatabase):
+    for asset_type in AssetType:
+        sqlite_database.add_asset(Asset(name=CHARACTER_NAME, asset_type=asset_type))
+
+    page = sqlite_database.list_assets_page(page_size=4)
+
+    assert len(page.items) == 4
+    assert page.next_page_token is not None
+
+    next_page = sqlite_database.list_assets_page(page.next_page_token, page_size=4)
+
+    assert len(next_page.items) == len(AssetType) - 4
+    assert next_page.next_page_token is None
+    assert page.items + next_page.items == sqlite_database.list_assets()
+
+
+def test_list_assets_page_invalid_token(sqlite_database: SQLiteDatabase):
+    with pytest.raises(ValueError):
+        sqlite_database.list_assets_page("not a token")
+
+
+def test_iter_assets(sqlite_database: SQLiteDatabase):
+    for asset_type in AssetType:
+        sqlite_database.add_asset(Asset(name=CHARACTER_NAME, asset_type=asset_type))
+
+    assert list(sqlite_database.iter_assets(page_size=2)) == (
+        sqlite_database.list_assets()
+    )
+
+
+def test_iter_asset_versions(sqlite_database: SQLiteDatabase):
+    asset = sqlite_database.add_asset(
+        Asset(name=CHARACTER_NAME, asset_type=AssetType.CHARACTER)
+    )
+
+    for department in ("modeling", "rigging", DEPARTMENT):
+        for _ in range(3):
+            sqlite_database.add_asset_version(
+                asset=asset,
+                asset_version=AssetVersion(
+                    asset=asset.id, department=department, version=None
+                ),
+            )
+
+    asset_versions = list(sqlite_database.iter_asset_versions(asset.id, page_size=2))
+
+    assert asset_versions == sqlite_database.list_asset_versions(asset_id=asset.id)
+
+
+def test_concurrent_version_allocation(tmp_path: Path):
+    path = tmp_path / "sqlite_database.db"
+
+    setup_database = SQLiteDatabase(path)
+    asset = setup_database.add_asset(
+        Asset(name=CHARACTER_NAME, asset_type=AssetType.CHARACTER)
+    )
+
+    def publish(_):
+        # Each writer has its own database instance, so only SQLite serializes them
+        database = SQLiteDatabase(path)
+
+        try:
+            return [
+                database.add_asset_version(
+                    asset=asset,
+                    asset_version=AssetVersion(
+                        asset=asset.id,
+                        department=DEPARTMENT,
+                        status=VersionStatus.ACTIVE,
+                    ),
+                ).version
+                for _ in range(25)
+            ]
+        finally:
+            database.close()
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            allocated_versions = [
+                version
+                for versions in executor.map(publish, range(8))
+                for version in versions
+            ]
+
+        stored_versions = [
+            asset_version.version
+            for asset_version in setup_database.list_asset_versions(asset_id=asset.id)
+        ]
+    finally:
+        setup_database.close()
+
+    # Every publish succeeded on its first try without gaps or duplicates
+    assert sorted(allocated_versions) == list(range(1, 201))
+    assert stored_versions == list(range(1, 201))
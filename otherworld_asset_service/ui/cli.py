@@ -1,19 +1,30 @@
 import argparse
+import asyncio
 
 from pathlib import Path
 from typing import Optional
 
+from otherworld_asset_service.api.async_service import AsyncOtherWorldAssetService
+from otherworld_asset_service.api.export import EXPORT_FORMATS
+from otherworld_asset_service.api.http_service import DEFAULT_HOST, serve
+from otherworld_asset_service.api.ingestion import NDJSON_SUFFIXES
 from otherworld_asset_service.api.validation.pipelines.asset_pipeline import (
     build_default_asset_pipeline,
 )
 from otherworld_asset_service.api.validation.pipelines.asset_version_pipeline import (
     build_default_asset_version_pipeline,
 )
+from otherworld_asset_service.api.validation.validation import DEFAULT_MEMO_SIZE
 from otherworld_asset_service.api.service import OtherWorldAssetService
 from otherworld_asset_service.storage.sqlite_database import SQLiteDatabase
 from otherworld_asset_service.models.asset import Asset
 from otherworld_asset_service.models.asset_version import AssetVersion
 from otherworld_asset_service.models.enums import AssetType, VersionStatus
+from otherworld_asset_service.utils import logger, metrics
+
+
+# The data store used when no path is provided, kept alongside the CLI
+DEFAULT_DATA_STORE_PATH = Path(__file__).parent / "sqlite_database.db"
 
 
 def get_asset_type_from_input() -> Optional[AssetType]:
@@ -142,6 +153,77 @@ def build_parser() -> argparse.ArgumentParser:
         help="The data_store path (default: None)",
     )
 
+    parser.add_argument(
+        "--log-format",
+        choices=("text", "json"),
+        default="text",
+        help="The format of log output (default: text)",
+    )
+
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus metrics on this local port (default: None)",
+    )
+
+    parser.add_argument(
+        "--export",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="Export every asset version to a JSON, NDJSON or CSV file instead of "
+        "the menu (default: None)",
+    )
+
+    parser.add_argument(
+        "--export-format",
+        choices=EXPORT_FORMATS,
+        default=None,
+        help="The format to export, chosen from the file suffix by default",
+    )
+
+    parser.add_argument(
+        "--asset-type",
+        action="append",
+        choices=[asset_type.value for asset_type in AssetType],
+        default=None,
+        help="Only export assets of this type, repeated for several (default: all)",
+    )
+
+    parser.add_argument(
+        "--department",
+        action="append",
+        default=None,
+        help="Only export versions of this department, repeated for several "
+        "(default: all)",
+    )
+
+    parser.add_argument(
+        "--status",
+        action="append",
+        choices=[status.value for status in VersionStatus],
+        default=None,
+        help="Only export versions with this status, repeated for several "
+        "(default: all)",
+    )
+
+    parser.add_argument(
+        "--http-port",
+        type=int,
+        default=None,
+        help="Serve the asset API over HTTP on this port instead of the menu "
+        "(default: None)",
+    )
+
+    parser.add_argument(
+        "--http-host",
+        default=DEFAULT_HOST,
+        help="The address to serve the asset API on (default: {})".format(
+            DEFAULT_HOST
+        ),
+    )
+
     return parser
 
 
@@ -156,11 +238,10 @@ def create_asset_service(data_store_path: Path | None) -> OtherWorldAssetService
     """
 
     if data_store_path is None:
-        database_directory = Path(__file__).parent
-        sqlite_database = database_directory / "sqlite_database.db"
-        data_store_path = Path(sqlite_database)
+        data_store_path = DEFAULT_DATA_STORE_PATH
 
-    asset_pipeline = build_default_asset_pipeline()
+    # Assets are validated again for every version added, so memoize their results
+    asset_pipeline = build_default_asset_pipeline(memo_size=DEFAULT_MEMO_SIZE)
     asset_version_pipeline = build_default_asset_version_pipeline()
 
     asset_service = OtherWorldAssetService(
@@ -169,6 +250,30 @@ def create_asset_service(data_store_path: Path | None) -> OtherWorldAssetService
     return asset_service
 
 
+def serve_asset_service(data_store_path: Path | None, host: str, port: int) -> None:
+    """Serve the asset API over HTTP until interrupted.
+
+    Args:
+        data_store_path (Path): The data store location.
+        host (str): The address to listen on.
+        port (int): The port to listen on.
+    """
+
+    if data_store_path is None:
+        data_store_path = DEFAULT_DATA_STORE_PATH
+
+    asset_service = AsyncOtherWorldAssetService(
+        data_store_path,
+        build_default_asset_pipeline(memo_size=DEFAULT_MEMO_SIZE),
+        build_default_asset_version_pipeline(),
+    )
+
+    try:
+        asyncio.run(serve(asset_service, host, port))
+    except KeyboardInterrupt:
+        pass
+
+
 def launch_menu_loop(asset_service: OtherWorldAssetService):
     """The main CLI menu loop.
 
@@ -182,7 +287,9 @@ def launch_menu_loop(asset_service: OtherWorldAssetService):
         choice = input("> ").strip().lower()
 
         if choice == "1":
-            user_input = input("\nPlease provide a JSON file path to load: ").strip()
+            user_input = input(
+                "\nPlease provide a JSON or NDJSON file path to load: "
+            ).strip()
 
             # Handle empty submission
             if not user_input:
@@ -192,12 +299,16 @@ def launch_menu_loop(asset_service: OtherWorldAssetService):
             file_path = Path(user_input)
 
             # Check file path validity
-            if not file_path.is_file() or not user_input.endswith(".json"):
-                print("\n{} is not a valid JSON file.".format(file_path))
+            if not file_path.is_file() or file_path.suffix.lower() not in (
+                ".json",
+                *NDJSON_SUFFIXES,
+            ):
+                print("\n{} is not a valid JSON or NDJSON file.".format(file_path))
                 continue
 
             try:
-                asset_service.load_assets(file_path)
+                report = asset_service.load_assets(file_path)
+                print("\n{}".format(report.summary()))
             except Exception as error:
                 print("Error loading assets: {}".format(error))
         elif choice == "2":
@@ -306,6 +417,30 @@ def launch_asset_service_cli(argv: list[str] | None = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    logger.configure_logging(json_output=args.log_format == "json")
+
+    if args.metrics_port is not None:
+        metrics.serve_metrics(args.metrics_port)
+
+    if args.export is not None:
+        result = create_asset_service(args.data_store_path).export_assets(
+            args.export,
+            export_format=args.export_format,
+            asset_types=args.asset_type,
+            departments=args.department,
+            statuses=args.status,
+        )
+        print(
+            "Exported {} asset versions to {} in {:.2f}s".format(
+                result.rows, result.file_path, result.elapsed_seconds
+            )
+        )
+        return
+
+    if args.http_port is not None:
+        serve_asset_service(args.data_store_path, args.http_host, args.http_port)
+        return
+
     asset_service = create_asset_service(args.data_store_path)
 
     launch_menu_loop(asset_service)
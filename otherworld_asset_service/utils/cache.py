@@ -0,0 +1,152 @@
+import threading
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Generic, Hashable, Optional, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# The number of generation counters shared between the keys of a cache, which bounds
+# their memory however many keys are invalidated
+GENERATION_SLOTS = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class CacheInfo:
+    """A snapshot of the effectiveness of a cache.
+
+    Args:
+        hits (int): The number of lookups answered by the cache.
+        misses (int): The number of lookups the cache could not answer.
+        size (int): The number of entries currently cached.
+        max_size (int): The number of entries the cache holds before evicting.
+    """
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class LRUCache(Generic[K, V]):
+    """A bounded, thread-safe cache that evicts the least recently used entry.
+
+    Readers filling the cache from a slower source take the generation of a key before
+    reading and pass it to put, so a value read before a concurrent invalidation of
+    the key is never cached over it.
+
+    Args:
+        max_size (int): The number of entries held before evicting. A size of 0
+            disables caching entirely.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        if max_size < 0:
+            raise ValueError("Cache size must be greater than or equal to 0.")
+
+        self._max_size = max_size
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        # Every invalidation bumps the counter of its key, so keys hashing to the same
+        # slot only ever cause an extra miss
+        self._generations = [0] * GENERATION_SLOTS
+
+    def __reduce__(self):
+        # Locks cannot be pickled, so a cache is sent to other processes empty
+        return type(self), (self._max_size,)
+
+    def get(self, key: K) -> Optional[V]:
+        """Get a cached value, marking it as the most recently used.
+
+        Args:
+            key (K): The key of the value to get.
+
+        Returns:
+            V | None: The cached value, or None if not cached.
+        """
+
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+            return value
+
+    def generation(self, key: K) -> int:
+        """Get the generation of a key, to be passed to put after reading its value.
+
+        Args:
+            key (K): The key about to be read.
+
+        Returns:
+            int: The generation of the key, which changes whenever it is invalidated.
+        """
+
+        with self._lock:
+            return self._generations[hash(key) % GENERATION_SLOTS]
+
+    def put(self, key: K, value: V, generation: Optional[int] = None) -> None:
+        """Cache a value, evicting the least recently used entry when full.
+
+        Args:
+            key (K): The key to cache the value under.
+            value (V): The value to cache.
+            generation (int | None): The generation of the key when the value was
+                read, or None to always cache the value. The value is not cached if
+                the key has been invalidated since.
+        """
+
+        if not self._max_size:
+            return
+
+        with self._lock:
+            if (
+                generation is not None
+                and self._generations[hash(key) % GENERATION_SLOTS] != generation
+            ):
+                return
+
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """Remove a cached value, if any.
+
+        Args:
+            key (K): The key of the value to remove.
+        """
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generations[hash(key) % GENERATION_SLOTS] += 1
+
+    def clear(self) -> None:
+        """Remove every cached value."""
+
+        with self._lock:
+            self._entries.clear()
+            self._generations = [generation + 1 for generation in self._generations]
+
+    def info(self) -> CacheInfo:
+        """Get the hit and miss counters and current size of the cache.
+
+        Returns:
+            CacheInfo: A snapshot of the cache.
+        """
+
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, len(self._entries), self._max_size
+            )
@@ -1,26 +1,337 @@
+import atexit
+import json
 import logging
+import multiprocessing.util
+import os
+import queue
+import threading
+import time
 
 from logging import Logger
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional, TextIO
 
 
-def get_logger(name: str = "Other World Asset Service Logger") -> Logger:
+DEFAULT_LOGGER_NAME = "Other World Asset Service Logger"
+
+# The format of every record when not writing JSON
+TEXT_FORMAT = "[%(levelname)s] %(name)s: %(message)s"
+
+# The number of distinct messages tracked by rate limiting and sampling. Tracking is
+# reset once exceeded, so messages that are not lazily formatted stay bounded.
+MAX_TRACKED_MESSAGES = 1024
+
+# Attributes every LogRecord has, so anything else was passed through extra
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord("", logging.INFO, "", 0, "", None, None).__dict__
+) | {"message", "asctime", "suppressed", "sample_rate"}
+
+
+def _message_key(record: logging.LogRecord) -> tuple:
+    # Lazily formatted records keep their template as msg, so every repeat of a message
+    # shares a key regardless of its arguments
+    message = record.msg if isinstance(record.msg, str) else str(record.msg)
+
+    return record.name, record.levelno, message
+
+
+class RateLimitFilter(logging.Filter):
+    """Drop repeats of a message beyond a limit within each interval.
+
+    The first record of a message after an interval with dropped repeats is annotated
+    with the number dropped as suppressed.
+
+    Args:
+        limit (int): The number of records of a message let through per interval.
+        interval (float): The length of an interval in seconds.
+    """
+
+    def __init__(self, limit: int, interval: float = 1.0) -> None:
+        super().__init__()
+
+        if limit < 1:
+            raise ValueError("Rate limit must be greater than or equal to 1.")
+
+        self.limit = limit
+        self.interval = interval
+
+        # The start, count and number suppressed of the current interval of a message
+        self._windows: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = _message_key(record)
+        now = time.monotonic()
+
+        with self._lock:
+            window = self._windows.get(key)
+
+            if window is None or now - window[0] >= self.interval:
+                if window is None and len(self._windows) >= MAX_TRACKED_MESSAGES:
+                    self._windows.clear()
+
+                if window is not None and window[2]:
+                    record.suppressed = window[2]
+
+                self._windows[key] = [now, 1, 0]
+
+                return True
+
+            if window[1] < self.limit:
+                window[1] += 1
+
+                return True
+
+            window[2] += 1
+
+            return False
+
+
+class SamplingFilter(logging.Filter):
+    """Let through only every nth record of each message at or below a level.
+
+    Records let through are annotated with the sampling rate as sample_rate, so counts
+    can be scaled back up. Records above the level, such as errors, are never sampled.
+
+    Args:
+        every (int): The sampling rate, e.g. 10 keeps 1 in 10 records of a message.
+        max_level (int): The most severe level sampled.
+    """
+
+    def __init__(self, every: int, max_level: int = logging.DEBUG) -> None:
+        super().__init__()
+
+        if every < 1:
+            raise ValueError("Sampling rate must be greater than or equal to 1.")
+
+        self.every = every
+        self.max_level = max_level
+
+        self._counts: dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or self.every == 1:
+            return True
+
+        key = _message_key(record)
+
+        with self._lock:
+            count = self._counts.get(key)
+
+            if count is None and len(self._counts) >= MAX_TRACKED_MESSAGES:
+                self._counts.clear()
+
+            count = count or 0
+            self._counts[key] = count + 1
+
+        if count % self.every:
+            return False
+
+        record.sample_rate = self.every
+
+        return True
+
+
+class TextFormatter(logging.Formatter):
+    """Format records as plain text, noting any repeats dropped by rate limiting."""
+
+    def __init__(self) -> None:
+        super().__init__(TEXT_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+
+        suppressed = getattr(record, "suppressed", 0)
+
+        if suppressed:
+            message += " ({} similar messages suppressed)".format(suppressed)
+
+        return message
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as a single line JSON object each.
+
+    Every object holds the time, level, logger name and message, along with any fields
+    passed through extra, e.g. LOGGER.info("Loaded", extra={"rows": 10}).
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "time": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                payload[key] = value
+
+        for key in ("suppressed", "sample_rate"):
+            if hasattr(record, key):
+                payload[key] = getattr(record, key)
+
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(payload, default=str)
+
+
+class BackgroundQueueHandler(QueueHandler):
+    """Queue records for the background logging thread, starting it when needed.
+
+    Records are queued as logged, so their message, arguments and any exception are
+    only formatted by the background thread. Arguments must therefore not be modified
+    after they are logged.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if _listener is None:
+            _start_listener()
+
+        super().emit(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # QueueHandler formats the message and drops exc_info so records can be
+        # pickled, but records never leave the process, so both are left to the
+        # background thread
+        return record
+
+
+# Records are handed to a single background thread, which formats and writes them, so
+# logging never blocks the calling thread on I/O
+_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler = BackgroundQueueHandler(_queue)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setLevel(logging.INFO)
+_stream_handler.setFormatter(TextFormatter())
+_listener: Optional[QueueListener] = None
+# Whether this is a forked child that has not yet started its own listener
+_forked = False
+_loggers: dict[str, Logger] = {}
+_lock = threading.Lock()
+
+
+def _start_listener() -> None:
+    global _listener, _forked
+
+    with _lock:
+        if _listener is None:
+            _listener = QueueListener(
+                _queue, _stream_handler, respect_handler_level=True
+            )
+            _listener.start()
+
+            if _forked:
+                # Worker processes exit without running atexit hooks, but do run
+                # multiprocessing finalizers registered once they have started
+                multiprocessing.util.Finalize(None, stop_logging, exitpriority=0)
+                _forked = False
+
+
+def _reset_after_fork() -> None:
+    global _listener, _lock, _queue, _forked
+
+    # A forked child inherits the listener without its thread, and any records the
+    # parent had queued, so it starts over with its own
+    _listener = None
+    _lock = threading.Lock()
+    _queue = _queue_handler.queue = queue.SimpleQueue()
+    _forked = True
+
+
+def stop_logging() -> None:
+    """Write every queued record and stop the background logging thread.
+
+    Logging again starts a new background thread.
+    """
+
+    global _listener
+
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+def configure_logging(
+    level: Optional[int] = None,
+    json_output: bool = False,
+    stream: Optional[TextIO] = None,
+    rate_limit: Optional[int] = None,
+    rate_interval: float = 1.0,
+    sample_every: Optional[int] = None,
+) -> None:
+    """Configure the output shared by every logger of the application.
+
+    Args:
+        level (int | None): The level of every logger, or None to keep it.
+        json_output (bool): Whether to write JSON objects rather than plain text.
+        stream (TextIO | None): The stream written to, or None to keep it.
+        rate_limit (int | None): The number of repeats of a message written per
+            rate_interval, or None to write every repeat.
+        rate_interval (float): The length of a rate limiting interval in seconds.
+        sample_every (int | None): Only write every nth repeat of a DEBUG message, or
+            None to write every repeat.
+    """
+
+    with _lock:
+        if level is not None:
+            _stream_handler.setLevel(level)
+
+            for logger in _loggers.values():
+                logger.setLevel(level)
+
+        if stream is not None:
+            _stream_handler.setStream(stream)
+
+        _stream_handler.setFormatter(
+            JsonFormatter() if json_output else TextFormatter()
+        )
+
+        for existing_filter in list(_queue_handler.filters):
+            _queue_handler.removeFilter(existing_filter)
+
+        # Filters run on the calling thread, so dropped records are never queued
+        if sample_every is not None:
+            _queue_handler.addFilter(SamplingFilter(sample_every))
+
+        if rate_limit is not None:
+            _queue_handler.addFilter(RateLimitFilter(rate_limit, rate_interval))
+
+
+def get_logger(name: str = DEFAULT_LOGGER_NAME) -> Logger:
     """A simple logger instance for the application.
 
+    Records are written by a background thread, so arguments should be passed to the
+    logging call rather than formatted up front, e.g. LOGGER.debug("Adding %s", name),
+    which also skips formatting entirely when the level is disabled.
+
+    Args:
+        name (str): The name of the logger.
+
     Returns:
         Logger: The logger instance.
     """
 
     logger = logging.getLogger(name)
 
-    if not logger.handlers:
-        logger.setLevel(logging.INFO)
+    with _lock:
+        if name not in _loggers:
+            _loggers[name] = logger
 
-        handler = logging.StreamHandler()
-        handler.setLevel(logging.INFO)
+            if not logger.handlers:
+                logger.setLevel(_stream_handler.level or logging.INFO)
+                logger.addHandler(_queue_handler)
+                logger.propagate = False
 
-        handler.setFormatter(logging.Formatter("[%(levelname)s] %(name)s: %(message)s"))
+    return logger
 
-        logger.addHandler(handler)
-        logger.propagate = False
 
-    return logger
+# Write any records still queued when the interpreter exits
+atexit.register(stop_logging)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
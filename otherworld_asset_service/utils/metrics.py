@@ -0,0 +1,638 @@
+import bisect
+import functools
+import math
+import os
+import tempfile
+import threading
+import time
+import weakref
+
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterable, Optional, Sequence, TypeVar
+
+
+R = TypeVar("R")
+
+# Latency buckets in seconds, from a cached lookup up to a large bulk load
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# The content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = tuple[tuple[str, str], ...]
+
+
+@dataclass(slots=True)
+class MetricFamily:
+    """A snapshot of every sample of a single metric, ready to export.
+
+    Args:
+        name (str): The name of the metric.
+        kind (str): The Prometheus type of the metric, e.g. counter or gauge.
+        help (str): A short description of the metric.
+        samples (list[tuple[str, Labels, float]]): The name suffix, labels and value of
+            every sample.
+    """
+
+    name: str
+    kind: str
+    help: str
+    samples: list[tuple[str, Labels, float]] = field(default_factory=list)
+
+
+class _CounterChild:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter.
+
+        Args:
+            amount (float): The amount to increase by, which must not be negative.
+        """
+
+        if amount < 0:
+            raise ValueError("Counters can only be increased.")
+
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        """float: The current value of the counter."""
+
+        return self._value
+
+
+class _HistogramChild:
+    __slots__ = ("_buckets", "_counts", "_sum", "_lock")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self._buckets = buckets
+        # The count of each bucket, with a final bucket for anything above the last
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record a single observation, such as the duration of a call.
+
+        Args:
+            value (float): The observed value.
+        """
+
+        index = bisect.bisect_left(self._buckets, value)
+
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @property
+    def count(self) -> int:
+        """int: The number of observations recorded."""
+
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        """float: The total of every observation recorded."""
+
+        return self._sum
+
+    def _snapshot(self) -> tuple[list[int], float]:
+        with self._lock:
+            return list(self._counts), self._sum
+
+
+class _Metric:
+    """The children of a metric, one per combination of label values."""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str, **labels: str):
+        """Get the child of the metric for a combination of label values.
+
+        The child can be kept and used directly, skipping the lookup on hot paths.
+
+        Args:
+            *values (str): The label values in label order.
+            **labels (str): The label values keyed by label name.
+
+        Returns:
+            The child of the metric for the label values.
+        """
+
+        if labels:
+            values = tuple(labels[label_name] for label_name in self.label_names)
+
+        if len(values) != len(self.label_names):
+            raise ValueError(
+                "Expected values for labels {} of {}.".format(
+                    self.label_names, self.name
+                )
+            )
+
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _items(self) -> list[tuple[Labels, object]]:
+        with self._lock:
+            children = list(self._children.items())
+
+        return [
+            (tuple(zip(self.label_names, values)), child) for values, child in children
+        ]
+
+
+class Counter(_Metric):
+    """A value that only ever increases, such as the number of calls made.
+
+    Args:
+        name (str): The name of the metric.
+        help (str): A short description of the metric.
+        labels (Sequence[str]): The names of the labels of the metric.
+    """
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter of a metric without labels.
+
+        Args:
+            amount (float): The amount to increase by, which must not be negative.
+        """
+
+        self.labels().inc(amount)
+
+    def collect(self) -> MetricFamily:
+        """Get a snapshot of every sample of the metric.
+
+        Returns:
+            MetricFamily: The value of every child.
+        """
+
+        return MetricFamily(
+            self.name,
+            self.kind,
+            self.help,
+            [("", labels, child.value) for labels, child in self._items()],
+        )
+
+
+class Histogram(_Metric):
+    """The distribution of observed values, such as call latencies, in buckets.
+
+    Args:
+        name (str): The name of the metric.
+        help (str): A short description of the metric.
+        labels (Sequence[str]): The names of the labels of the metric.
+        buckets (Sequence[float]): The upper bound of each bucket, in ascending order.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labels)
+
+        self.buckets = tuple(sorted(bucket for bucket in buckets if bucket != math.inf))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record a single observation of a metric without labels.
+
+        Args:
+            value (float): The observed value.
+        """
+
+        self.labels().observe(value)
+
+    def collect(self) -> MetricFamily:
+        """Get a snapshot of every sample of the metric.
+
+        Returns:
+            MetricFamily: The cumulative buckets, sum and count of every child.
+        """
+
+        family = MetricFamily(self.name, self.kind, self.help)
+
+        for labels, child in self._items():
+            counts, total = child._snapshot()
+            cumulative = 0
+
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                family.samples.append(
+                    ("_bucket", (*labels, ("le", _format_value(bound))), cumulative)
+                )
+
+            family.samples.append(("_sum", labels, total))
+            family.samples.append(("_count", labels, cumulative))
+
+        return family
+
+
+def gauge_family(
+    name: str, help: str, samples: Iterable[tuple[Labels, float]]
+) -> MetricFamily:
+    """Build a gauge metric family, for collectors reporting current values.
+
+    Args:
+        name (str): The name of the metric.
+        help (str): A short description of the metric.
+        samples (Iterable[tuple[Labels, float]]): The labels and value of each sample.
+
+    Returns:
+        MetricFamily: The metric family.
+    """
+
+    return MetricFamily(
+        name, "gauge", help, [("", labels, value) for labels, value in samples]
+    )
+
+
+def counter_family(
+    name: str, help: str, samples: Iterable[tuple[Labels, float]]
+) -> MetricFamily:
+    """Build a counter metric family, for collectors reporting running totals.
+
+    Args:
+        name (str): The name of the metric.
+        help (str): A short description of the metric.
+        samples (Iterable[tuple[Labels, float]]): The labels and value of each sample.
+
+    Returns:
+        MetricFamily: The metric family.
+    """
+
+    return MetricFamily(
+        name, "counter", help, [("", labels, value) for labels, value in samples]
+    )
+
+
+class MetricsRegistry:
+    """A collection of metrics exported together.
+
+    Besides its own counters and histograms, a registry exports the metric families of
+    any registered collectors, e.g. cache stats read on demand. Families of the same
+    name from several collectors are merged, summing samples with identical labels.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], Optional[Callable]]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        """Get, or create, a counter.
+
+        Args:
+            name (str): The name of the metric.
+            help (str): A short description of the metric.
+            labels (Sequence[str]): The names of the labels of the metric.
+
+        Returns:
+            Counter: The counter registered under the name.
+        """
+
+        return self._register(Counter(name, help, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get, or create, a histogram.
+
+        Args:
+            name (str): The name of the metric.
+            help (str): A short description of the metric.
+            labels (Sequence[str]): The names of the labels of the metric.
+            buckets (Sequence[float]): The upper bound of each bucket.
+
+        Returns:
+            Histogram: The histogram registered under the name.
+        """
+
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def _register(self, metric: _Metric):
+        with self._lock:
+            existing_metric = self._metrics.get(metric.name)
+
+            if existing_metric is None:
+                self._metrics[metric.name] = metric
+                return metric
+
+        if type(existing_metric) is not type(metric) or (
+            existing_metric.label_names != metric.label_names
+        ):
+            raise ValueError(
+                "Metric {} is already registered differently.".format(metric.name)
+            )
+
+        return existing_metric
+
+    def register_collector(
+        self, collector: Callable[[], Iterable[MetricFamily]]
+    ) -> None:
+        """Export the metric families returned by a callable whenever collecting.
+
+        Bound methods are held weakly, so registering an object's method does not keep
+        the object alive. Its metrics stop being exported once it is garbage collected.
+
+        Args:
+            collector (Callable[[], Iterable[MetricFamily]]): The callable to collect.
+        """
+
+        try:
+            reference = weakref.WeakMethod(collector)
+        except TypeError:
+
+            def reference() -> Callable:
+                return collector
+
+        with self._lock:
+            self._collectors.append(reference)
+
+    def collect(self) -> list[MetricFamily]:
+        """Get a snapshot of every metric and collector.
+
+        Returns:
+            list[MetricFamily]: Every metric family, ordered by name.
+        """
+
+        with self._lock:
+            families = [metric.collect() for metric in self._metrics.values()]
+
+            # Drop the collectors of objects that have been garbage collected
+            collectors = [reference() for reference in self._collectors]
+            self._collectors = [
+                reference
+                for reference, collector in zip(self._collectors, collectors)
+                if collector is not None
+            ]
+
+        for collector in collectors:
+            if collector is not None:
+                families.extend(collector())
+
+        merged: dict[str, MetricFamily] = {}
+        for family in families:
+            if family.name not in merged:
+                merged[family.name] = MetricFamily(
+                    family.name, family.kind, family.help, list(family.samples)
+                )
+                continue
+
+            totals = {
+                (suffix, labels): index
+                for index, (suffix, labels, _) in enumerate(
+                    merged[family.name].samples
+                )
+            }
+            samples = merged[family.name].samples
+
+            for suffix, labels, value in family.samples:
+                index = totals.get((suffix, labels))
+
+                if index is None:
+                    samples.append((suffix, labels, value))
+                else:
+                    samples[index] = (suffix, labels, samples[index][2] + value)
+
+        return [merged[name] for name in sorted(merged)]
+
+    def get_sample_value(
+        self, name: str, labels: Optional[dict[str, str]] = None
+    ) -> Optional[float]:
+        """Get the current value of a single sample, mostly useful for tests.
+
+        Args:
+            name (str): The full name of the sample, e.g. including _count.
+            labels (dict[str, str] | None): The labels of the sample.
+
+        Returns:
+            float | None: The value of the sample, or None if it does not exist.
+        """
+
+        labels = sorted((labels or {}).items())
+
+        for family in self.collect():
+            for suffix, sample_labels, value in family.samples:
+                if family.name + suffix != name:
+                    continue
+
+                if sorted(sample_labels) == labels:
+                    return value
+
+        return None
+
+    def to_prometheus_text(self) -> str:
+        """Export every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: The exported metrics.
+        """
+
+        lines = []
+
+        for family in self.collect():
+            lines.append("# HELP {} {}".format(family.name, _escape_help(family.help)))
+            lines.append("# TYPE {} {}".format(family.name, family.kind))
+
+            for suffix, labels, value in family.samples:
+                lines.append(
+                    "{}{}{} {}".format(
+                        family.name,
+                        suffix,
+                        _format_labels(labels),
+                        _format_value(value),
+                    )
+                )
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, file_path: str) -> None:
+        """Write every metric to a file in the Prometheus text exposition format.
+
+        The file is replaced atomically, so a scraper such as the node exporter's
+        textfile collector never reads a partially written file.
+
+        Args:
+            file_path (str): The file to write.
+        """
+
+        directory = os.path.dirname(os.path.abspath(file_path))
+        descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                file.write(self.to_prometheus_text())
+
+            os.replace(temporary_path, file_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+
+    return "{{{}}}".format(
+        ",".join(
+            '{}="{}"'.format(
+                name,
+                value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+            )
+            for name, value in labels
+        )
+    )
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+
+    if float(value).is_integer():
+        return str(int(value))
+
+    return repr(float(value))
+
+
+def timed(histogram: Histogram, errors: Counter) -> Callable:
+    """Build a decorator recording the latency of functions and the exceptions raised.
+
+    Each function is labelled with its name. The children of both metrics are looked up
+    once when decorating, so each call only costs two clock reads and a bucket update.
+
+    Args:
+        histogram (Histogram): The latency histogram, with a single label.
+        errors (Counter): The error counter, with a single label.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(function: Callable[..., R]) -> Callable[..., R]:
+        latency = histogram.labels(function.__name__)
+        error_count = errors.labels(function.__name__)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs) -> R:
+            started = time.perf_counter()
+
+            try:
+                return function(*args, **kwargs)
+            except BaseException:
+                error_count.inc()
+                raise
+            finally:
+                latency.observe(time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
+def serve_metrics(
+    port: int, host: str = "127.0.0.1", registry: Optional[MetricsRegistry] = None
+) -> ThreadingHTTPServer:
+    """Serve every metric over HTTP at /metrics from a background thread.
+
+    Args:
+        port (int): The port to listen on, or 0 to pick a free port.
+        host (str): The address to listen on, the local machine by default.
+        registry (MetricsRegistry | None): The registry to serve, or None for the
+            default registry.
+
+    Returns:
+        ThreadingHTTPServer: The running server. Call shutdown to stop it.
+    """
+
+    registry = registry or REGISTRY
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+
+            body = registry.to_prometheus_text().encode("utf-8")
+
+            self.send_response(200)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_) -> None:
+            # Scrapes are frequent, so they are not logged
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+
+    threading.Thread(
+        target=server.serve_forever, name="MetricsServer", daemon=True
+    ).start()
+
+    return server
+
+
+# The registry every service and data store records to
+REGISTRY = MetricsRegistry()